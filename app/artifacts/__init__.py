@@ -1,6 +1,8 @@
 from app.artifacts.infrastructure import (
+    find_dataset_by_hash,
     get_session,
     log_dataset,
+    log_datasets,
     log_evaluation,
     log_model,
     log_pruned_model,
@@ -8,9 +10,11 @@ from app.artifacts.infrastructure import (
 from app.artifacts.models import init_db
 
 __all__ = [
+    "find_dataset_by_hash",
     "get_session",
     "init_db",
     "log_dataset",
+    "log_datasets",
     "log_evaluation",
     "log_model",
     "log_pruned_model",
@@ -1,18 +1,78 @@
 from .celery_app import celery_app
+from .dataset_cache import DatasetCache, get_dataset_cache, load_training_data
+from .dataset_store import (
+    CONSTANT_COLUMNS,
+    FILTER_OPS,
+    DatasetWriter,
+    ParquetWriteOptions,
+    dataset_columns,
+    dataset_fingerprint,
+    dataset_metadata,
+    dataset_rows,
+    expand_constants,
+    iter_dataset,
+    model_columns,
+    read_dataset,
+    read_dataset_table,
+    read_manifest,
+    resolve_dataset,
+    schema_hash,
+    split_features,
+    storage_table,
+    write_dataset,
+    write_manifest,
+)
+from .feature_sidecar import read_sidecar, sidecar_path, write_sidecar
 from .repository import (
+    count_model_cache_hit,
+    find_dataset_by_hash,
+    find_model_by_training_key,
+    get_dataset_stats,
     get_session,
     log_dataset,
+    log_datasets,
     log_evaluation,
     log_model,
     log_pruned_model,
 )
 
 __all__ = [
+    "CONSTANT_COLUMNS",
+    "DatasetCache",
+    "DatasetWriter",
+    "FILTER_OPS",
+    "ParquetWriteOptions",
     "celery_app",
+    "count_model_cache_hit",
+    "dataset_columns",
+    "dataset_fingerprint",
+    "dataset_metadata",
+    "dataset_rows",
+    "expand_constants",
+    "find_dataset_by_hash",
+    "find_model_by_training_key",
+    "get_dataset_cache",
+    "get_dataset_stats",
     "get_session",
+    "iter_dataset",
     "log_dataset",
+    "log_datasets",
     "log_evaluation",
     "log_model",
+    "load_training_data",
     "log_pruned_model",
+    "model_columns",
+    "read_dataset",
+    "read_dataset_table",
+    "read_manifest",
+    "read_sidecar",
+    "resolve_dataset",
+    "schema_hash",
+    "sidecar_path",
+    "split_features",
+    "storage_table",
+    "write_dataset",
+    "write_manifest",
+    "write_sidecar",
 ]
 
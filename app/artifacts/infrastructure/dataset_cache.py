@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from settings import settings
+from utils.logger import get_logger
+
+from .dataset_store import dataset_signature, model_columns, read_dataset, split_features
+from .feature_sidecar import read_sidecar
+
+logger = get_logger(__name__)
+
+
+class DatasetCache:
+    """Process-wide LRU cache of loaded datasets as ready-made ``(X, y)``.
+
+    Entries are keyed by dataset path and validated against the file's mtime
+    and size, so a rewritten dataset is reloaded. The total ``nbytes`` of the
+    cached frames is kept under ``max_bytes`` by evicting the least recently
+    used entries; a dataset larger than the whole budget is returned without
+    being cached. Cached ``X``/``y`` are shared between callers and must not
+    be modified in place.
+
+    Datasets with a valid Arrow IPC sidecar are memory-mapped instead of
+    decoded: their ``(X, y)`` are views of the page cache shared by every
+    process on the node, so they count towards ``mapped_bytes`` rather than
+    the private ``bytes`` budget.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.bytes = 0
+        self.mapped_bytes = 0
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> tuple[pd.DataFrame, np.ndarray]:
+        key = str(path)
+        signature = dataset_signature(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], entry[2]
+            self.misses += 1
+
+        mapped = read_sidecar(path)
+        if mapped is not None:
+            X, y = mapped
+            nbytes, mapped_bytes = 0, int(X.memory_usage(index=False).sum()) + y.nbytes
+        else:
+            X, y = split_features(read_dataset(path, columns=model_columns(path)))
+            y.flags.writeable = False
+            nbytes, mapped_bytes = int(X.memory_usage(deep=True).sum()) + y.nbytes, 0
+
+        with self._lock:
+            self._discard(key)
+            if nbytes <= self.max_bytes:
+                self._entries[key] = (signature, X, y, nbytes, mapped_bytes)
+                self.bytes += nbytes
+                self.mapped_bytes += mapped_bytes
+                while self.bytes > self.max_bytes:
+                    self._discard(next(iter(self._entries)))
+                    self.evictions += 1
+        return X, y
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry[3]
+            self.mapped_bytes -= entry[4]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "mapped_bytes": self.mapped_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self.mapped_bytes = 0
+
+
+_cache: DatasetCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_dataset_cache() -> DatasetCache:
+    """Return the process-wide dataset cache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DatasetCache(settings.dataset_cache_bytes)
+        return _cache
+
+
+def load_training_data(path: Path) -> tuple[pd.DataFrame, np.ndarray]:
+    """Return ``(X, y)`` for the dataset at ``path`` through the process cache."""
+    cache = get_dataset_cache()
+    X, y = cache.get(path)
+    stats = cache.stats()
+    logger.info(
+        "Dataset cache: %d hits / %d misses (%.0f%% hit rate), %.1f MiB held, %.1f MiB mapped in %d entries",
+        stats["hits"],
+        stats["misses"],
+        100 * stats["hit_rate"],
+        stats["bytes"] / 2**20,
+        stats["mapped_bytes"] / 2**20,
+        stats["entries"],
+    )
+    return X, y
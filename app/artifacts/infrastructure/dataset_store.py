@@ -0,0 +1,541 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import fastparquet
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from settings import settings
+
+# Parquet key-value metadata entry holding dataset-wide constants.
+DATASET_METADATA_KEY = b"credit_risk.dataset"
+# Columns that hold one macro value for every row of a dataset.
+CONSTANT_COLUMNS = ("interest_rate", "debt_ratio")
+TARGET_COLUMN = "default"
+# Columns that are never model features.
+NON_FEATURE_COLUMNS = ("name", TARGET_COLUMN)
+# Manifest file of a partitioned dataset directory.
+MANIFEST_NAME = "_manifest.json"
+MANIFEST_VERSION = 1
+# Comparison operators accepted in ``filters`` terms, as in ``pyarrow.parquet``.
+FILTER_OPS = ("=", "==", "!=", "<", "<=", ">", ">=", "in", "not in")
+
+
+def storage_table(df: pd.DataFrame, constants=CONSTANT_COLUMNS) -> pa.Table:
+    """Convert a dataset frame to the Arrow table that is written to disk.
+
+    Columns listed in ``constants`` are dropped from the table and their single
+    value is stored once in the schema metadata, together with the original
+    column order so ``read_dataset`` can restore the frame exactly. A column is
+    only stored as a constant if it really holds one value.
+    """
+    stored = {}
+    for column in constants:
+        values = df[column].to_numpy() if column in df else None
+        if values is not None and len(values) and (values == values[0]).all():
+            stored[column] = {"value": values[0].item(), "dtype": str(values.dtype)}
+
+    table = pa.Table.from_pandas(df.drop(columns=list(stored)), preserve_index=False)
+    metadata = {"constants": stored, "columns": list(df.columns)}
+    return table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        DATASET_METADATA_KEY: json.dumps(metadata).encode(),
+    })
+
+
+def dataset_metadata(schema: pa.Schema) -> dict:
+    """Return the dataset metadata stored in ``schema`` (empty for legacy files)."""
+    raw = (schema.metadata or {}).get(DATASET_METADATA_KEY)
+    return json.loads(raw) if raw else {"constants": {}, "columns": None}
+
+
+def expand_constants(df: pd.DataFrame, metadata: dict, columns: list[str] | None = None) -> pd.DataFrame:
+    """Broadcast metadata constants back into columns and restore column order.
+
+    With ``columns``, only those constants are broadcast and the frame follows
+    the order of ``columns``.
+    """
+    constants = metadata.get("constants") or {}
+    if columns is not None:
+        constants = {column: spec for column, spec in constants.items() if column in columns}
+    elif not constants:
+        return df
+    for column, spec in constants.items():
+        df[column] = np.full(len(df), spec["value"], dtype=spec["dtype"])
+    order = columns if columns is not None else metadata.get("columns") or df.columns
+    return df[[column for column in order if column in df]]
+
+
+class ParquetWriteOptions:
+    """How dataset files are encoded on disk.
+
+    ``engine`` is ``pyarrow`` or ``fastparquet``. ``compression`` is any codec
+    both engines understand (``zstd``, ``snappy``, ``lz4``, ``gzip``,
+    ``brotli`` or ``none``); ``compression_level`` is passed to codecs that
+    take one (pyarrow only). Every write is split into row groups of at most
+    ``row_group_rows`` rows. ``statistics`` writes per-column min/max for
+    predicate pushdown, ``dictionary`` dictionary-encodes non-float columns,
+    and ``byte_stream_split`` encodes float columns byte-plane by byte-plane,
+    which compresses better than dictionary or plain encoding for
+    high-cardinality floats (pyarrow only).
+    """
+
+    ENGINES = ("pyarrow", "fastparquet")
+
+    def __init__(
+        self,
+        engine: str = "pyarrow",
+        compression: str | None = "zstd",
+        compression_level: int | None = None,
+        row_group_rows: int = 100_000,
+        statistics: bool = True,
+        dictionary: bool = True,
+        byte_stream_split: bool = True,
+    ):
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unknown Parquet engine '{engine}', expected one of {self.ENGINES}")
+        if row_group_rows < 1:
+            raise ValueError("row_group_rows must be positive")
+        self.engine = engine
+        self.compression = None if compression in (None, "", "none") else compression.lower()
+        self.compression_level = compression_level
+        self.row_group_rows = row_group_rows
+        self.statistics = statistics
+        self.dictionary = dictionary
+        self.byte_stream_split = byte_stream_split
+
+    @classmethod
+    def from_settings(cls) -> ParquetWriteOptions:
+        return cls(
+            engine=settings.dataset_parquet_engine,
+            compression=settings.dataset_parquet_compression,
+            compression_level=settings.dataset_parquet_compression_level,
+            row_group_rows=settings.dataset_row_group_rows,
+            statistics=settings.dataset_parquet_statistics,
+            dictionary=settings.dataset_parquet_dictionary,
+            byte_stream_split=settings.dataset_parquet_byte_stream_split,
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+    def pyarrow_kwargs(self, schema: pa.Schema) -> dict:
+        """Keyword arguments for ``pq.ParquetWriter`` on a table with ``schema``."""
+        floats = [field.name for field in schema if pa.types.is_floating(field.type)]
+        split = floats if self.byte_stream_split else []
+        others = [field.name for field in schema if field.name not in split]
+        return {
+            "compression": self.compression or "none",
+            "compression_level": self.compression_level if self.compression else None,
+            "write_statistics": self.statistics,
+            "use_dictionary": others if self.dictionary else False,
+            "use_byte_stream_split": split or False,
+        }
+
+    def fastparquet_kwargs(self) -> dict:
+        """Keyword arguments for ``fastparquet.write``."""
+        compression = None
+        if self.compression:
+            compression = "LZ4_RAW" if self.compression == "lz4" else self.compression.upper()
+        return {
+            "compression": compression,
+            "stats": "auto" if self.statistics else False,
+        }
+
+
+class DatasetWriter:
+    """Write a dataset file one frame at a time with ``ParquetWriteOptions``.
+
+    Frames are converted with ``storage_table`` and appended as row groups of
+    at most ``options.row_group_rows`` rows, so the same writer serves
+    in-memory, streamed and merged datasets with either engine. Use as a
+    context manager; the file is complete once the writer is closed.
+    """
+
+    def __init__(self, path: Path, options: ParquetWriteOptions | None = None, constants=CONSTANT_COLUMNS):
+        self.path = path
+        self.options = options or ParquetWriteOptions.from_settings()
+        self.constants = constants
+        self.rows = 0
+        self._writer = None
+
+    def __enter__(self) -> DatasetWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, df: pd.DataFrame) -> None:
+        self.write_table(storage_table(df, self.constants))
+
+    def write_table(self, table: pa.Table) -> None:
+        """Append a table already in storage form, e.g. a row group of another dataset file."""
+        if self.options.engine == "fastparquet":
+            self._write_fastparquet(table)
+        else:
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(
+                    self.path, table.schema, **self.options.pyarrow_kwargs(table.schema)
+                )
+            self._writer.write_table(table, row_group_size=self.options.row_group_rows)
+        self.rows += table.num_rows
+
+    def _write_fastparquet(self, table: pa.Table) -> None:
+        df = table.to_pandas()
+        categorical = list(df.select_dtypes("category"))
+        if not self.options.dictionary:
+            df = df.astype({column: "object" for column in categorical})
+            categorical = []
+        metadata = (table.schema.metadata or {}).get(DATASET_METADATA_KEY)
+        custom_metadata = {DATASET_METADATA_KEY.decode(): metadata.decode()} if metadata else None
+
+        # One call per row group: fastparquet writes every category into each
+        # dictionary page, and pyarrow rejects pages with more entries than
+        # the row group has values, so unused categories are dropped first.
+        step = self.options.row_group_rows
+        for start in range(0, max(len(df), 1), step):
+            part = df.iloc[start:start + step]
+            part = part.assign(**{column: part[column].cat.remove_unused_categories() for column in categorical})
+            fastparquet.write(
+                str(self.path),
+                part,
+                append=self.rows + start > 0,
+                custom_metadata=custom_metadata,
+                **self.options.fastparquet_kwargs(),
+            )
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def write_dataset(
+    df: pd.DataFrame, path: Path, options: ParquetWriteOptions | None = None, constants=CONSTANT_COLUMNS
+) -> None:
+    """Write a whole frame as one dataset file."""
+    with DatasetWriter(path, options, constants) as writer:
+        writer.write(df)
+
+
+def _categorical_columns(schema: pa.Schema) -> list[str]:
+    """Columns the pandas metadata marks as categorical, whatever engine wrote them."""
+    raw = (schema.metadata or {}).get(b"pandas")
+    if not raw:
+        return []
+    return [
+        column["name"]
+        for column in json.loads(raw)["columns"]
+        if column["pandas_type"] == "categorical" and column["name"] in schema.names
+    ]
+
+
+def schema_hash(schema: pa.Schema) -> str:
+    """Hash the column names and types of ``schema``, ignoring metadata."""
+    return hashlib.sha256(schema.remove_metadata().to_string().encode()).hexdigest()
+
+
+def _row_group_stats(row_group: pq.RowGroupMetaData) -> dict:
+    """Min/max/null count per column of one row group, for columns with statistics."""
+    stats = {}
+    for j in range(row_group.num_columns):
+        column = row_group.column(j)
+        if column.statistics is None:
+            continue
+        has_min_max = column.statistics.has_min_max
+        stats[column.path_in_schema] = {
+            "min": column.statistics.min if has_min_max else None,
+            "max": column.statistics.max if has_min_max else None,
+            "null_count": column.statistics.null_count or 0,
+        }
+    return stats
+
+
+def _part_stats(metadata: pq.FileMetaData) -> dict:
+    """Aggregate row-group min/max/null counts of one part file per column."""
+    stats = {}
+    for i in range(metadata.num_row_groups):
+        for column, group in _row_group_stats(metadata.row_group(i)).items():
+            entry = stats.setdefault(column, {"min": None, "max": None, "null_count": 0})
+            entry["null_count"] += group["null_count"]
+            if group["min"] is not None:
+                entry["min"] = group["min"] if entry["min"] is None else min(entry["min"], group["min"])
+                entry["max"] = group["max"] if entry["max"] is None else max(entry["max"], group["max"])
+    return stats
+
+
+def _term_may_match(op: str, value, low, high) -> bool:
+    if op in ("=", "=="):
+        return low <= value <= high
+    if op == "!=":
+        return not low == high == value
+    if op == "<":
+        return low < value
+    if op == "<=":
+        return low <= value
+    if op == ">":
+        return high > value
+    if op == ">=":
+        return high >= value
+    if op == "in":
+        return any(low <= item <= high for item in value)
+    return not (low == high and low in value)
+
+
+def _stats_may_match(stats: dict, filters) -> bool:
+    """Whether rows described by per-column min/max ``stats`` may satisfy every filter term.
+
+    Terms on columns without statistics, or whose value cannot be compared
+    with them, never rule rows out.
+    """
+    for column, op, value in filters:
+        entry = stats.get(column)
+        if entry is None or entry["min"] is None or entry["max"] is None:
+            continue
+        try:
+            if not _term_may_match(op, value, entry["min"], entry["max"]):
+                return False
+        except TypeError:
+            continue
+    return True
+
+
+def write_manifest(directory: Path) -> dict:
+    """Describe every ``part-*.parquet`` file of ``directory`` in its manifest.
+
+    Records the total and per-part row counts, per-part column statistics
+    and a hash of the shared schema. Raises ``ValueError`` if the parts do
+    not all have the same schema.
+    """
+    parts = []
+    hashes = set()
+    for part in sorted(directory.glob("part-*.parquet")):
+        parquet_file = pq.ParquetFile(part)
+        hashes.add(schema_hash(parquet_file.schema_arrow))
+        parts.append({
+            "file": part.name,
+            "rows": parquet_file.metadata.num_rows,
+            "bytes": part.stat().st_size,
+            "row_groups": parquet_file.metadata.num_row_groups,
+            "stats": _part_stats(parquet_file.metadata),
+        })
+    if len(hashes) > 1:
+        raise ValueError(f"Part files in {directory} do not share one schema")
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "rows": sum(part["rows"] for part in parts),
+        "schema_hash": hashes.pop() if hashes else None,
+        "parts": parts,
+    }
+    (directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, default=str))
+    return manifest
+
+
+def read_manifest(directory: Path) -> dict:
+    return json.loads((directory / MANIFEST_NAME).read_text())
+
+
+def dataset_signature(path: Path) -> tuple[int, int]:
+    """(mtime_ns, size) of a dataset file, or of the manifest of a partitioned one."""
+    stat = (path / MANIFEST_NAME if path.is_dir() else path).stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=64)
+def _fingerprint(path: Path, signature: tuple[int, int]) -> str:
+    files = [path / part["file"] for part in read_manifest(path)["parts"]] if path.is_dir() else [path]
+    digest = hashlib.sha256()
+    for file in files:
+        with open(file, "rb") as f:
+            while chunk := f.read(1 << 20):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(path: Path) -> str:
+    """SHA-256 over the bytes of a dataset's data files, in manifest order for partitioned ones.
+
+    Unlike the generation ``content_hash``, this covers every dataset,
+    seeded or not. It is memoized per process by ``dataset_signature``.
+    """
+    return _fingerprint(path, dataset_signature(path))
+
+
+def resolve_dataset(root: Path, name: str) -> Path | None:
+    """Return the path of dataset ``name`` under ``root`` in either layout.
+
+    A single-file dataset is ``<root>/<name>.parquet``; a partitioned one is
+    a ``<root>/<name>/`` directory with a manifest. Returns ``None`` if
+    neither exists.
+    """
+    file_path = root / f"{name}.parquet"
+    if file_path.exists():
+        return file_path
+    directory = root / name
+    if (directory / MANIFEST_NAME).exists():
+        return directory
+    return None
+
+
+def dataset_columns(path: Path) -> list[str]:
+    """Column names of a dataset in either layout, constants included, without reading any rows."""
+    if path.is_dir():
+        path = path / read_manifest(path)["parts"][0]["file"]
+    schema = pq.read_schema(path)
+    return dataset_metadata(schema)["columns"] or list(schema.names)
+
+
+def model_columns(path: Path) -> list[str]:
+    """Feature and target columns of a dataset: what training, evaluation and pruning read."""
+    return [
+        column for column in dataset_columns(path)
+        if column == TARGET_COLUMN or column not in NON_FEATURE_COLUMNS
+    ]
+
+
+def _read_table(
+    path: Path,
+    row_groups: list[int] | None = None,
+    expected_hash: str | None = None,
+    columns: list[str] | None = None,
+    filters: list[tuple] | None = None,
+) -> pa.Table:
+    schema = pq.read_schema(path)
+    if expected_hash is not None and schema_hash(schema) != expected_hash:
+        raise ValueError(f"Part {path.name} of {path.parent.name} does not match the manifest schema")
+    constants = dataset_metadata(schema).get("constants") or {}
+    filters = list(filters or ())
+    for column, op, _ in filters:
+        if column not in schema.names and column not in constants:
+            raise ValueError(f"Unknown filter column '{column}' in {path.name}")
+        if op not in FILTER_OPS:
+            raise ValueError(f"Unknown filter operator '{op}', expected one of {FILTER_OPS}")
+    stored_filters = [term for term in filters if term[0] not in constants]
+
+    parquet_file = pq.ParquetFile(path, read_dictionary=_categorical_columns(schema))
+    if filters:
+        # Constants are exact min/max statistics of the whole file; row groups
+        # are skipped on their own statistics before any page is decoded.
+        constant_stats = {column: {"min": spec["value"], "max": spec["value"]} for column, spec in constants.items()}
+        candidates = range(parquet_file.metadata.num_row_groups) if row_groups is None else row_groups
+        if not _stats_may_match(constant_stats, filters):
+            candidates = []
+        row_groups = [
+            i for i in candidates
+            if _stats_may_match(_row_group_stats(parquet_file.metadata.row_group(i)), stored_filters)
+        ]
+
+    read_columns = None
+    if columns is not None:
+        needed = set(columns) | {term[0] for term in stored_filters}
+        read_columns = [column for column in schema.names if column in needed]
+    if row_groups is None:
+        table = parquet_file.read(columns=read_columns)
+    else:
+        table = parquet_file.read_row_groups(row_groups, columns=read_columns)
+    if stored_filters:
+        table = table.filter(pq.filters_to_expression(stored_filters))
+    if columns is not None:
+        table = table.select([column for column in table.column_names if column in columns])
+    return table
+
+
+def read_dataset_table(
+    path: Path,
+    parts: list[int] | None = None,
+    max_workers: int | None = None,
+    columns: list[str] | None = None,
+    filters: list[tuple] | None = None,
+) -> pa.Table:
+    """Read a dataset in either layout as one Arrow table in storage form.
+
+    For a partitioned dataset ``parts`` selects part files by index and the
+    parts are read concurrently on up to ``max_workers`` threads; every part
+    must match the manifest's schema hash. For a single file ``parts``
+    selects row groups.
+
+    ``columns`` limits the stored columns that are decoded. ``filters`` is a
+    list of ``(column, op, value)`` terms that must all hold, with ``op`` one
+    of ``FILTER_OPS``; parts and row groups whose statistics rule a term out
+    are skipped without being read, and the remaining rows are filtered
+    exactly. Terms may also name constant columns.
+    """
+    if not path.is_dir():
+        return _read_table(path, parts, columns=columns, filters=filters)
+
+    manifest = read_manifest(path)
+    entries = manifest["parts"]
+    if parts is not None:
+        entries = [entries[i] for i in parts]
+    if not entries:
+        raise ValueError(f"No parts selected from dataset {path.name}")
+    if filters:
+        # Keep one part when all are ruled out so the result still has the schema.
+        entries = [entry for entry in entries if _stats_may_match(entry["stats"], filters)] or entries[:1]
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(len(entries), 8)) as pool:
+        tables = list(pool.map(
+            lambda entry: _read_table(
+                path / entry["file"], expected_hash=manifest["schema_hash"], columns=columns, filters=filters
+            ),
+            entries,
+        ))
+    return pa.concat_tables(tables)
+
+
+def read_dataset(
+    path: Path,
+    parts: list[int] | None = None,
+    max_workers: int | None = None,
+    columns: list[str] | None = None,
+    filters: list[tuple] | None = None,
+) -> pd.DataFrame:
+    """Read a dataset written with ``DatasetWriter`` (or a legacy file) as a frame.
+
+    See ``read_dataset_table`` for ``parts``, ``max_workers``, ``columns``
+    and ``filters``. Constants stored in the file metadata are broadcast back
+    into columns; with ``columns``, only the requested ones are returned, in
+    that order.
+    """
+    table = read_dataset_table(path, parts, max_workers, columns, filters)
+    return expand_constants(table.to_pandas(), dataset_metadata(table.schema), columns)
+
+
+def dataset_rows(path: Path) -> int:
+    """Row count of a dataset in either layout, from file metadata only."""
+    if path.is_dir():
+        return read_manifest(path)["rows"]
+    return pq.ParquetFile(path).metadata.num_rows
+
+
+def iter_dataset(path: Path, columns: list[str] | None = None) -> Iterator[pd.DataFrame]:
+    """Yield a dataset in either layout one row group at a time, in storage order.
+
+    Each frame is read like ``read_dataset`` (constants broadcast, only
+    ``columns`` if given), so a dataset larger than memory can be processed
+    with one row group resident at a time.
+    """
+    files = [path / part["file"] for part in read_manifest(path)["parts"]] if path.is_dir() else [path]
+    for file in files:
+        schema = pq.read_schema(file)
+        metadata = dataset_metadata(schema)
+        parquet_file = pq.ParquetFile(file, read_dictionary=_categorical_columns(schema))
+        read_columns = None if columns is None else [column for column in schema.names if column in columns]
+        for i in range(parquet_file.num_row_groups):
+            table = parquet_file.read_row_group(i, columns=read_columns)
+            yield expand_constants(table.to_pandas(), metadata, columns)
+
+
+def split_features(df: pd.DataFrame) -> tuple[pd.DataFrame, np.ndarray]:
+    """Split a dataset frame into the feature frame and the target array."""
+    return df.drop(columns=list(NON_FEATURE_COLUMNS), errors="ignore"), df[TARGET_COLUMN].to_numpy()
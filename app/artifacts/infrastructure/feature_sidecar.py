@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from .dataset_store import TARGET_COLUMN, dataset_signature, model_columns, read_dataset, split_features
+
+# Schema metadata entry of a sidecar: feature names and the dataset it was built from.
+SIDECAR_METADATA_KEY = b"credit_risk.sidecar"
+# Sidecar file of a partitioned dataset directory.
+PARTITIONED_SIDECAR_NAME = "_features.arrow"
+
+
+def sidecar_path(dataset_path: Path) -> Path:
+    """``<name>.arrow`` next to a dataset file, or ``_features.arrow`` inside a dataset directory."""
+    if dataset_path.is_dir():
+        return dataset_path / PARTITIONED_SIDECAR_NAME
+    return dataset_path.with_suffix(".arrow")
+
+
+def write_sidecar(dataset_path: Path) -> Path:
+    """Write the uncompressed Arrow IPC feature sidecar of a dataset.
+
+    The features are stored row-major as a single ``fixed_size_list`` column
+    in one record batch, next to the ``default`` target, so a memory-mapped
+    reader can view them as one 2D NumPy array. The dataset's
+    ``(mtime_ns, size)`` signature is recorded so a sidecar left behind by a
+    rewritten dataset is ignored.
+    """
+    X, y = split_features(read_dataset(dataset_path, columns=model_columns(dataset_path)))
+    dtype = np.result_type(*X.dtypes) if len(X.columns) else np.float32
+    values = np.ascontiguousarray(X.to_numpy(dtype=dtype))
+    features = pa.FixedSizeListArray.from_arrays(pa.array(values.ravel()), values.shape[1])
+    metadata = {
+        "feature_names": list(X.columns),
+        "dataset_signature": list(dataset_signature(dataset_path)),
+    }
+    table = pa.table({"features": features, TARGET_COLUMN: pa.array(y)}).replace_schema_metadata(
+        {SIDECAR_METADATA_KEY: json.dumps(metadata).encode()}
+    )
+
+    path = sidecar_path(dataset_path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table, max_chunksize=max(len(table), 1))
+    except Exception:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_sidecar(dataset_path: Path) -> tuple[pd.DataFrame, np.ndarray] | None:
+    """Memory-map the sidecar of a dataset and return zero-copy ``(X, y)`` views.
+
+    ``X`` is a DataFrame over one read-only row-major array backed by the
+    mapped file, so every process reading the same sidecar shares its page
+    cache pages. Returns ``None`` if there is no sidecar or it was built from
+    another version of the dataset.
+    """
+    path = sidecar_path(dataset_path)
+    if not path.exists():
+        return None
+
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    metadata = json.loads(table.schema.metadata[SIDECAR_METADATA_KEY])
+    if tuple(metadata["dataset_signature"]) != dataset_signature(dataset_path):
+        return None
+
+    features = table.column("features")
+    target = table.column(TARGET_COLUMN)
+    if features.num_chunks != 1:
+        return None
+    names = metadata["feature_names"]
+    values = features.chunk(0).flatten().to_numpy(zero_copy_only=True).reshape(len(table), len(names))
+    y = target.chunk(0).to_numpy(zero_copy_only=True)
+    return pd.DataFrame(values, columns=names, copy=False), y
@@ -29,7 +29,13 @@ def get_session() -> Session:
     return SessionLocal()
 
 
-def log_dataset(name: str, rows: int, macro: dict[str, Any]) -> None:
+def log_dataset(
+    name: str,
+    rows: int,
+    macro: dict[str, Any],
+    content_hash: str | None = None,
+    stats: dict[str, Any] | None = None,
+) -> None:
     """Log dataset artifact to database."""
     session = get_session()
     try:
@@ -37,6 +43,8 @@ def log_dataset(name: str, rows: int, macro: dict[str, Any]) -> None:
             name=name,
             rows=rows,
             macro=macro,
+            content_hash=content_hash,
+            stats=stats,
         )
         session.add(record)
         session.commit()
@@ -49,17 +57,87 @@ def log_dataset(name: str, rows: int, macro: dict[str, Any]) -> None:
         session.close()
 
 
-def log_model(name: str, dataset_name: str, timestamp: datetime | None = None) -> None:
-    """Log model artifact to database."""
+def log_datasets(datasets: list[dict[str, Any]]) -> None:
+    """Log several dataset artifacts to database in a single transaction.
+
+    Each entry holds the ``log_dataset`` keyword arguments.
+    """
+    session = get_session()
+    try:
+        session.add_all([DatasetRecord(**dataset) for dataset in datasets])
+        session.commit()
+        logger.info("Logged %d datasets to database", len(datasets))
+    except Exception as e:
+        session.rollback()
+        logger.error("Failed to log %d datasets: %s", len(datasets), e)
+        raise
+    finally:
+        session.close()
+
+
+def find_dataset_by_hash(content_hash: str) -> DatasetRecord | None:
+    """Return the most recent dataset generated with the given content hash."""
+    session = get_session()
+    try:
+        return (
+            session.query(DatasetRecord)
+            .filter(DatasetRecord.content_hash == content_hash)
+            .order_by(DatasetRecord.id.desc())
+            .first()
+        )
+    finally:
+        session.close()
+
+
+def get_dataset_stats(name: str) -> dict[str, Any] | None:
+    """Return the summary statistics stored with dataset ``name``.
+
+    ``None`` if the dataset is unknown or was logged without statistics.
+    """
+    session = get_session()
+    try:
+        row = session.query(DatasetRecord.stats).filter(DatasetRecord.name == name).first()
+        return row.stats if row is not None else None
+    finally:
+        session.close()
+
+
+def log_model(
+    name: str,
+    dataset_name: str,
+    timestamp: datetime | None = None,
+    estimator: str | None = None,
+    params: dict[str, Any] | None = None,
+    search: dict[str, Any] | None = None,
+    cv: dict[str, Any] | None = None,
+    training_key: str | None = None,
+    parent_name: str | None = None,
+) -> None:
+    """Log model artifact to database with its estimator, and its hyperparameter search or cross-validation if any.
+
+    A model warm-started from ``parent_name`` is linked to it; an unknown
+    parent is logged without the link.
+    """
     session = get_session()
     try:
         dataset = session.query(DatasetRecord).filter(DatasetRecord.name == dataset_name).first()
         if not dataset:
             raise ValueError(f"Dataset '{dataset_name}' not found in database")
+        parent = None
+        if parent_name is not None:
+            parent = session.query(ModelRecord).filter(ModelRecord.name == parent_name).first()
+            if parent is None:
+                logger.warning("Parent model %s of %s not found in database", parent_name, name)
 
         record = ModelRecord(
             name=name,
             dataset_id=dataset.id,
+            estimator=estimator,
+            params=params,
+            search=search,
+            cv=cv,
+            training_key=training_key,
+            parent_id=parent.id if parent is not None else None,
             created_at=timestamp or datetime.now(UTC),
         )
         session.add(record)
@@ -73,8 +151,40 @@ def log_model(name: str, dataset_name: str, timestamp: datetime | None = None) -
         session.close()
 
 
-def log_evaluation(model_name: str, dataset_name: str, auc: float) -> None:
-    """Log evaluation result to database."""
+def find_model_by_training_key(training_key: str) -> ModelRecord | None:
+    """Return the most recent model trained with the given training key."""
+    session = get_session()
+    try:
+        return (
+            session.query(ModelRecord)
+            .filter(ModelRecord.training_key == training_key)
+            .order_by(ModelRecord.id.desc())
+            .first()
+        )
+    finally:
+        session.close()
+
+
+def count_model_cache_hit(name: str) -> int:
+    """Record that model ``name`` was reused instead of retrained; return its hit count."""
+    session = get_session()
+    try:
+        session.query(ModelRecord).filter(ModelRecord.name == name).update(
+            {ModelRecord.cache_hits: ModelRecord.cache_hits + 1}
+        )
+        session.commit()
+        return session.query(ModelRecord.cache_hits).filter(ModelRecord.name == name).scalar() or 0
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def log_evaluation(
+    model_name: str, dataset_name: str, auc: float, metrics: dict[str, Any] | None = None
+) -> None:
+    """Log evaluation result to database, with the full metrics report if any."""
     session = get_session()
     try:
         model = session.query(ModelRecord).filter(ModelRecord.name == model_name).first()
@@ -89,6 +199,7 @@ def log_evaluation(model_name: str, dataset_name: str, auc: float) -> None:
             model_id=model.id,
             dataset_id=dataset.id,
             auc=auc,
+            metrics=metrics,
         )
         session.add(record)
         session.commit()
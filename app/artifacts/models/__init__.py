@@ -6,6 +6,7 @@ from .artifacts import (
     PrunedModelRecord,
     get_session_factory,
     init_db,
+    upgrade_db,
 )
 
 __all__ = [
@@ -16,5 +17,6 @@ __all__ = [
     "PrunedModelRecord",
     "get_session_factory",
     "init_db",
+    "upgrade_db",
 ]
 
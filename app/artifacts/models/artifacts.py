@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, JSON, create_engine
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, JSON, create_engine, inspect, text
 from sqlalchemy.orm import DeclarativeBase, relationship, sessionmaker
 
 from settings import settings
@@ -12,6 +12,23 @@ class Base(DeclarativeBase):
     pass
 
 
+# Columns added after the tables were first created, as (table, column, DDL).
+# ``create_all`` never alters existing tables, so ``init_db`` adds the ones a
+# database is missing. Append here whenever a column is added to a record.
+COLUMN_UPGRADES = (
+    ("datasets", "content_hash", "VARCHAR(64)"),
+    ("datasets", "stats", "JSON"),
+    ("models", "estimator", "VARCHAR"),
+    ("models", "params", "JSON"),
+    ("models", "search", "JSON"),
+    ("models", "cv", "JSON"),
+    ("models", "training_key", "VARCHAR(64)"),
+    ("models", "cache_hits", "INTEGER NOT NULL DEFAULT 0"),
+    ("models", "parent_id", "INTEGER REFERENCES models(id)"),
+    ("evaluations", "metrics", "JSON"),
+)
+
+
 class DatasetRecord(Base):
     """Dataset artifact metadata."""
     __tablename__ = "datasets"
@@ -20,6 +37,8 @@ class DatasetRecord(Base):
     name = Column(String, unique=True, nullable=False, index=True)
     rows = Column(Integer, nullable=False)
     macro = Column(JSON, nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)
+    stats = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
 
     models = relationship("ModelRecord", back_populates="dataset")
@@ -33,9 +52,18 @@ class ModelRecord(Base):
     id = Column(Integer, primary_key=True)
     name = Column(String, unique=True, nullable=False, index=True)
     dataset_id = Column(Integer, ForeignKey("datasets.id"), nullable=False, index=True)
+    estimator = Column(String, nullable=True)
+    params = Column(JSON, nullable=True)
+    search = Column(JSON, nullable=True)
+    cv = Column(JSON, nullable=True)
+    training_key = Column(String(64), nullable=True, index=True)
+    cache_hits = Column(Integer, default=0, nullable=False)
+    parent_id = Column(Integer, ForeignKey("models.id"), nullable=True, index=True)
     created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
 
     dataset = relationship("DatasetRecord", back_populates="models")
+    parent = relationship("ModelRecord", remote_side=[id], back_populates="children")
+    children = relationship("ModelRecord", back_populates="parent")
     evaluations = relationship("EvaluationRecord", back_populates="model")
     pruned_models = relationship("PrunedModelRecord", back_populates="base_model")
 
@@ -48,6 +76,7 @@ class EvaluationRecord(Base):
     model_id = Column(Integer, ForeignKey("models.id"), nullable=False, index=True)
     dataset_id = Column(Integer, ForeignKey("datasets.id"), nullable=False, index=True)
     auc = Column(Float, nullable=False)
+    metrics = Column(JSON, nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now(UTC), nullable=False)
 
     model = relationship("ModelRecord", back_populates="evaluations")
@@ -85,8 +114,28 @@ def get_session_factory():
     return sessionmaker(bind=engine)
 
 
+def upgrade_db(engine) -> list[str]:
+    """Add the ``COLUMN_UPGRADES`` columns and indexes an existing database is missing.
+
+    Idempotent: columns and indexes that already exist are left alone.
+    Returns the ``table.column`` names that were added.
+    """
+    inspector = inspect(engine)
+    added = []
+    with engine.begin() as conn:
+        for table, column, ddl in COLUMN_UPGRADES:
+            if column not in {existing["name"] for existing in inspector.get_columns(table)}:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+                added.append(f"{table}.{column}")
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+    return added
+
+
 def init_db():
-    """Initialize database tables."""
+    """Initialize database tables and add columns missing from existing ones."""
     engine = get_engine()
     Base.metadata.create_all(engine)
+    upgrade_db(engine)
 
@@ -12,29 +12,58 @@ from app.artifacts.infrastructure.repository import (
 )
 from app.evaluate.service import evaluate_workflow
 from app.prune.service import prune_workflow
+from app.train.core import DEFAULT_ESTIMATOR
 from app.train.service import train_workflow
 
 
 @celery_app.task(name="artifacts.log_dataset")
-def log_dataset_async(name: str, rows: int, macro: dict[str, Any]) -> dict[str, Any]:
+def log_dataset_async(
+    name: str,
+    rows: int,
+    macro: dict[str, Any],
+    content_hash: str | None = None,
+    stats: dict[str, Any] | None = None,
+) -> dict[str, Any]:
     """Async task to log dataset to database."""
-    sync_log_dataset(name=name, rows=rows, macro=macro)
+    sync_log_dataset(name=name, rows=rows, macro=macro, content_hash=content_hash, stats=stats)
     return {"status": "success", "artifact": "dataset", "name": name}
 
 
 @celery_app.task(name="artifacts.log_model")
-def log_model_async(name: str, dataset_name: str, timestamp: str | None = None) -> dict[str, Any]:
+def log_model_async(
+    name: str,
+    dataset_name: str,
+    timestamp: str | None = None,
+    estimator: str | None = None,
+    params: dict[str, Any] | None = None,
+    search: dict[str, Any] | None = None,
+    cv: dict[str, Any] | None = None,
+    training_key: str | None = None,
+    parent_name: str | None = None,
+) -> dict[str, Any]:
     """Async task to log model to database."""
     # Convert timestamp string back to datetime if provided
     dt = datetime.fromisoformat(timestamp) if timestamp else None
-    sync_log_model(name=name, dataset_name=dataset_name, timestamp=dt)
+    sync_log_model(
+        name=name,
+        dataset_name=dataset_name,
+        timestamp=dt,
+        estimator=estimator,
+        params=params,
+        search=search,
+        cv=cv,
+        training_key=training_key,
+        parent_name=parent_name,
+    )
     return {"status": "success", "artifact": "model", "name": name}
 
 
 @celery_app.task(name="artifacts.log_evaluation")
-def log_evaluation_async(model_name: str, dataset_name: str, auc: float) -> dict[str, Any]:
+def log_evaluation_async(
+    model_name: str, dataset_name: str, auc: float, metrics: dict[str, Any] | None = None
+) -> dict[str, Any]:
     """Async task to log evaluation to database."""
-    sync_log_evaluation(model_name=model_name, dataset_name=dataset_name, auc=auc)
+    sync_log_evaluation(model_name=model_name, dataset_name=dataset_name, auc=auc, metrics=metrics)
     return {"status": "success", "artifact": "evaluation", "model": model_name, "auc": auc}
 
 
@@ -51,14 +80,36 @@ def log_pruned_model_async(model_name: str, pruned_name: str) -> dict[str, Any]:
 
 
 @celery_app.task(name="ml.train_model", bind=True, max_retries=3)
-def train_model_task(self, dataset_name: str) -> dict[str, Any]:
-    """Async task to train a model on a dataset.
+def train_model_task(
+    self,
+    dataset_name: str,
+    search: dict[str, Any] | None = None,
+    estimator: str = DEFAULT_ESTIMATOR,
+    params: dict[str, Any] | None = None,
+    parent_model: str | None = None,
+) -> dict[str, Any]:
+    """Async task to train ``estimator`` on a dataset, optionally searching ``search`` for the best model
+    or warm-starting from ``parent_model``.
+
+    Cross-validation and search folds are published as they finish through
+    the ``PROGRESS`` state, whose meta ``GET /train/status/{task_id}`` returns.
     
     Returns:
         dict with model_name, dataset_name, and status
     """
+
+    def progress(meta: dict[str, Any]) -> None:
+        self.update_state(state="PROGRESS", meta=meta)
+
     try:
-        model_path = train_workflow(dataset_name)
+        model_path = train_workflow(
+            dataset_name,
+            estimator=estimator,
+            params=params,
+            search=search,
+            progress=progress,
+            parent_model=parent_model,
+        )
         model_name = model_path.stem
         return {
             "status": "success",
@@ -75,19 +126,20 @@ def train_model_task(self, dataset_name: str) -> dict[str, Any]:
 
 
 @celery_app.task(name="ml.evaluate_model", bind=True, max_retries=3)
-def evaluate_model_task(self, model_name: str, dataset_name: str) -> dict[str, Any]:
-    """Async task to evaluate a model on a dataset.
+def evaluate_model_task(self, model_name: str, dataset_name: str, bootstrap: int = 0) -> dict[str, Any]:
+    """Async task to evaluate a model on a dataset, with ``bootstrap`` confidence intervals if requested.
     
     Returns:
-        dict with model_name, dataset_name, auc, and status
+        dict with model_name, dataset_name, auc, metrics, and status
     """
     try:
-        auc = evaluate_workflow(model_name, dataset_name)
+        metrics = evaluate_workflow(model_name, dataset_name, bootstrap=bootstrap)
         return {
             "status": "success",
             "model_name": model_name,
             "dataset_name": dataset_name,
-            "auc": auc,
+            "auc": metrics["auc"],
+            "metrics": metrics,
         }
     except ValueError:
         # Don't retry on validation errors (like "not found")
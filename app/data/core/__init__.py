@@ -1,3 +1,36 @@
-from .fetch import get_macro_data, generate_synthetic_data
+from .fetch import (
+    GENERATOR_VERSION,
+    apply_macro,
+    draw_borrowers,
+    get_macro_data,
+    get_macro_data_as_of,
+    generate_synthetic_data,
+    iter_synthetic_data,
+    macro_cache_stats,
+    refresh_series_store,
+)
+from .fred import CircuitBreaker, CircuitOpenError, FredClient, SingleFlight, get_fred_client
+from .series_store import SeriesStore, get_series_store
+from .stats import ColumnSummary, DatasetSummary, summarize
 
-__all__ = ["get_macro_data", "generate_synthetic_data"]
+__all__ = [
+    "GENERATOR_VERSION",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ColumnSummary",
+    "DatasetSummary",
+    "FredClient",
+    "SeriesStore",
+    "SingleFlight",
+    "apply_macro",
+    "draw_borrowers",
+    "get_fred_client",
+    "get_macro_data",
+    "get_macro_data_as_of",
+    "get_series_store",
+    "generate_synthetic_data",
+    "iter_synthetic_data",
+    "macro_cache_stats",
+    "refresh_series_store",
+    "summarize",
+]
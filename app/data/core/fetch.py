@@ -1,56 +1,296 @@
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from datetime import date
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
-from faker import Faker
-from fredapi import Fred
+import redis
+from faker.providers.person.en_US import Provider as PersonProvider
 from pathlib import Path
 from utils.logger import get_logger
-from utils.cache import load_cache, save_cache
+from utils.cache import CacheBackend, FileCacheBackend, RedisCacheBackend, TTLCache
+from app.data.core.fred import get_fred_client
+from app.data.core.series_store import get_series_store
 from settings import settings
 
 
 MACRO_CACHE_DIR = Path("storage/macro_cache")
 MACRO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Bump whenever a change to the generators alters their output for a given seed.
+GENERATOR_VERSION = 2
+NAME_POOL_SIZE = 5000
+NAME_POOL_SEED = 0
 
 logger = get_logger(__name__)
 
+MACRO_CACHE_EVENTS = ("hits", "stale_hits", "misses", "refreshes", "refresh_failures", "fallbacks")
+FRED_SERIES = {
+    "TDSP": "debt_ratio",
+    "DRCCLACBS": "delinquency",
+    "FEDFUNDS": "interest_rate",
+}
+
+
+_memory_cache = TTLCache()
+_stats: Counter = Counter()
+_stats_lock = threading.Lock()
+_refreshing: set[str] = set()
+_refreshing_lock = threading.Lock()
+_backend: CacheBackend | None = None
+_backend_lock = threading.Lock()
+
+
+def _count(event: str) -> None:
+    with _stats_lock:
+        _stats[event] += 1
+
+
+def macro_cache_stats() -> dict[str, int]:
+    """Return macro cache counters (hits, stale hits, misses, refreshes, ...)."""
+    with _stats_lock:
+        return {event: _stats[event] for event in MACRO_CACHE_EVENTS}
+
+
+def get_macro_cache_backend() -> CacheBackend:
+    """Return the shared macro cache backend, creating it on first use.
+
+    ``settings.macro_cache_backend == "redis"`` shares entries across every
+    API replica and worker through ``settings.redis_url``, falling back to the
+    pickle files under ``MACRO_CACHE_DIR`` while Redis is unreachable.
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            file_backend = FileCacheBackend(MACRO_CACHE_DIR)
+            if settings.macro_cache_backend == "redis":
+                _backend = RedisCacheBackend(
+                    redis.Redis.from_url(settings.redis_url, socket_timeout=1.0, socket_connect_timeout=1.0),
+                    prefix="macro_cache:",
+                    ttl=settings.macro_cache_retention,
+                    fallback=file_backend,
+                )
+            else:
+                _backend = file_backend
+        return _backend
+
+
+def _cached_value(sid: str) -> tuple[float, float] | None:
+    """Return ``(value, age_seconds)`` from memory, falling back to the shared cache.
+
+    Shared entries are promoted into memory with their stored fetch time;
+    entries written without one count as arbitrarily old.
+    """
+    entry = _memory_cache.get(sid)
+    if entry is not None:
+        return entry
+    cache = get_macro_cache_backend().load(sid)
+    if sid not in cache:
+        return None
+    _memory_cache.set(sid, cache[sid], fetched_at=cache.get("fetched_at", 0.0))
+    return _memory_cache.get(sid)
+
+
+def _store(sid: str, val: float) -> None:
+    fetched_at = time.time()
+    get_macro_cache_backend().save(sid, {sid: val, "fetched_at": fetched_at})
+    _memory_cache.set(sid, val, fetched_at=fetched_at)
+
+
+def _refresh_in_background(sid: str) -> None:
+    """Start a refresh of ``sid`` unless one is already running."""
+    with _refreshing_lock:
+        if sid in _refreshing:
+            return
+        _refreshing.add(sid)
+
+    def refresh():
+        try:
+            _store(sid, get_fred_client().get_latest(sid))
+            _count("refreshes")
+        except Exception as e:
+            _count("refresh_failures")
+            logger.warning(f"Background refresh failed for {sid}: {e!r}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(sid)
+
+    threading.Thread(target=refresh, name=f"macro-refresh-{sid}", daemon=True).start()
+
+
 def get_macro_data(fields: list[str] | None = None, use_cache=True) -> dict:
-    fred = Fred(api_key=settings.fred_api_key)
-    mapping = {
-        "TDSP": "debt_ratio",
-        "DRCCLACBS": "delinquency",
-        "FEDFUNDS": "interest_rate",
-    }
-    selected = [sid for sid, name in mapping.items() if not fields or name in fields]
+    """Return the latest value of each requested macro field.
+
+    With ``use_cache`` values are served from the in-process cache, then the
+    on-disk cache, and only then from FRED. Entries older than
+    ``macro_cache_ttl`` are still served, while a single background refresh
+    per series updates them; entries older than ``macro_cache_max_stale`` are
+    refetched synchronously. Without ``use_cache`` every series is fetched.
+
+    Series are requested concurrently through the shared ``FredClient``; any
+    series that fails or times out falls back to its cached value.
+    """
+    selected = [sid for sid, name in FRED_SERIES.items() if not fields or name in fields]
 
     results = {}
+    to_fetch = []
     for sid in selected:
-        try:
-            series = fred.get_series(sid)
-            val = float(series.dropna().iloc[-1])
-            save_cache(MACRO_CACHE_DIR / f"{sid}.pkl", {sid: val})
-            results[mapping[sid]] = val
-        except Exception:
-            cache = load_cache(MACRO_CACHE_DIR / f"{sid}.pkl")
-            results[mapping[sid]] = cache.get(sid, 0.0)
-            logger.warning(f"Fallback for {sid}: {results[mapping[sid]]}")
+        entry = _cached_value(sid) if use_cache else None
+        if entry is None or entry[1] >= settings.macro_cache_max_stale:
+            if use_cache:
+                _count("misses")
+            to_fetch.append(sid)
+            continue
+        val, age = entry
+        results[FRED_SERIES[sid]] = val
+        if age < settings.macro_cache_ttl:
+            _count("hits")
+        else:
+            _count("stale_hits")
+            _refresh_in_background(sid)
+
+    if not to_fetch:
+        return results
+
+    fetched = get_fred_client().get_latest_many(to_fetch)
+    for sid, val in fetched.items():
+        if isinstance(val, Exception):
+            _count("fallbacks")
+            entry = _cached_value(sid)
+            results[FRED_SERIES[sid]] = entry[0] if entry else 0.0
+            logger.warning(f"Fallback for {sid} ({val!r}): {results[FRED_SERIES[sid]]}")
+        else:
+            _store(sid, val)
+            results[FRED_SERIES[sid]] = val
     return results
 
-def generate_synthetic_data(macro_data: dict, n=1000) -> pd.DataFrame:
-    fake = Faker()
-    rows = []
-    for _ in range(n):
-        inc = np.random.normal(4000, 1500)
-        loan = np.random.normal(10000, 5000)
-        util = loan / (inc + 1)
-        risk = util * (1 + macro_data["delinquency"]/100)
-        default = int(risk > np.random.uniform(1, 3))
-        rows.append({
-            "name": fake.name(),
-            "monthly_income": round(inc, 2),
-            "loan_amount": round(loan, 2),
-            "utilization": round(util, 3),
-            "interest_rate": macro_data["interest_rate"],
-            "debt_ratio": macro_data["debt_ratio"],
-            "default": default
-        })
-    return pd.DataFrame(rows)
+def refresh_series_store(fields: list[str] | None = None) -> dict[str, int]:
+    """Incrementally update the local history of each requested FRED series.
+
+    Returns the number of new observations stored per series id.
+    """
+    selected = [sid for sid, name in FRED_SERIES.items() if not fields or name in fields]
+    store = get_series_store()
+    client = get_fred_client()
+    return {sid: store.refresh(sid, client) for sid in selected}
+
+
+def get_macro_data_as_of(as_of: date, fields: list[str] | None = None) -> dict:
+    """Return each requested macro field as observed on ``as_of``.
+
+    Values come from the local series store only; no network I/O is done.
+    Raises ``ValueError`` if a series has no stored observation by that date.
+    """
+    selected = [sid for sid, name in FRED_SERIES.items() if not fields or name in fields]
+    store = get_series_store()
+    return {FRED_SERIES[sid]: store.as_of(sid, as_of) for sid in selected}
+
+
+@lru_cache(maxsize=1)
+def _name_pool() -> tuple[pd.Index, np.ndarray]:
+    """Build a fixed pool of full names and their sampling weights.
+
+    Names are combined from Faker's weighted first/last-name vocabularies
+    once per process with a fixed seed, so every process (and every shard)
+    shares the same categories.
+    """
+    rng = np.random.default_rng(NAME_POOL_SEED)
+    first_names = list(PersonProvider.first_names)
+    last_names = list(PersonProvider.last_names)
+    first_w = np.fromiter(PersonProvider.first_names.values(), dtype=np.float64)
+    last_w = np.fromiter(PersonProvider.last_names.values(), dtype=np.float64)
+    first_w /= first_w.sum()
+    last_w /= last_w.sum()
+
+    pairs = np.unique(
+        rng.choice(len(first_names), NAME_POOL_SIZE, p=first_w) * len(last_names)
+        + rng.choice(len(last_names), NAME_POOL_SIZE, p=last_w)
+    )
+    first_idx, last_idx = np.divmod(pairs, len(last_names))
+    names = pd.Index([f"{first_names[first]} {last_names[last]}" for first, last in zip(first_idx, last_idx)])
+    weights = first_w[first_idx] * last_w[last_idx]
+    return names, weights / weights.sum()
+
+
+def draw_borrowers(n=1000, seed=None) -> dict[str, np.ndarray]:
+    """Draw the macro-independent part of ``n`` synthetic borrowers.
+
+    Returns raw column arrays plus the per-borrower default threshold, so the
+    same draws can be combined with any number of macro scenarios through
+    ``apply_macro``. Every column is drawn in one vectorized call; names are
+    sampled by index from ``_name_pool``.
+    """
+    rng = np.random.default_rng(seed)
+    names, name_weights = _name_pool()
+
+    inc = rng.normal(4000, 1500, size=n)
+    loan = rng.normal(10000, 5000, size=n)
+    threshold = rng.uniform(1, 3, size=n)
+    name = pd.Categorical.from_codes(
+        rng.choice(len(names), size=n, p=name_weights), categories=names
+    )
+    return {
+        "name": name,
+        "monthly_income": inc,
+        "loan_amount": loan,
+        "utilization": loan / (inc + 1),
+        "threshold": threshold,
+    }
+
+
+def apply_macro(draws: dict[str, np.ndarray], macro_data: dict) -> pd.DataFrame:
+    """Build the borrower frame for one macro scenario from ``draw_borrowers`` output.
+
+    Monetary and ratio columns are float32 and ``default`` is int8; values are
+    rounded in float64 first so the stored precision does not depend on the
+    narrower dtype.
+    """
+    n = len(draws["threshold"])
+    risk = draws["utilization"] * (1 + macro_data["delinquency"]/100)
+    default = (risk > draws["threshold"]).astype(np.int8)
+
+    return pd.DataFrame({
+        "name": draws["name"],
+        "monthly_income": np.round(draws["monthly_income"], 2).astype(np.float32),
+        "loan_amount": np.round(draws["loan_amount"], 2).astype(np.float32),
+        "utilization": np.round(draws["utilization"], 3).astype(np.float32),
+        "interest_rate": np.full(n, macro_data["interest_rate"], dtype=np.float32),
+        "debt_ratio": np.full(n, macro_data["debt_ratio"], dtype=np.float32),
+        "default": default,
+    })
+
+
+def generate_synthetic_data(macro_data: dict, n=1000, seed=None) -> pd.DataFrame:
+    """Generate ``n`` synthetic borrowers column-wise from a seeded generator.
+
+    Every column is drawn in one vectorized call, so the cost is dominated by
+    array arithmetic instead of per-row Python objects. Names are stored as a
+    categorical column. Passing the same ``seed`` (an int or a
+    ``SeedSequence``) reproduces the same frame.
+    """
+    return apply_macro(draw_borrowers(n, seed), macro_data)
+
+
+def iter_synthetic_data(
+    macro_data: dict, n: int, chunk_size: int, seed=None
+) -> Iterator[pd.DataFrame]:
+    """Yield ``n`` synthetic borrowers as frames of at most ``chunk_size`` rows.
+
+    Each chunk gets its own child seed spawned from one ``SeedSequence``, so a
+    given ``(seed, chunk_size)`` pair always reproduces the same chunks while
+    only one chunk is held in memory at a time. Raises ``ValueError`` if
+    ``n`` is negative.
+    """
+    if n < 0:
+        raise ValueError(f"Number of borrowers must be non-negative, got {n}")
+    sizes = [chunk_size] * (n // chunk_size)
+    if n % chunk_size or not sizes:
+        sizes.append(n % chunk_size)
+
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    children = seed.spawn(len(sizes))
+    for size, child in zip(sizes, children):
+        yield generate_synthetic_data(macro_data, n=size, seed=child)
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import httpx
+import pandas as pd
+
+from settings import settings
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Observations FRED reports for a date without a value.
+MISSING_VALUE = "."
+# How many of the most recent observations to scan for the latest non-missing value.
+LATEST_WINDOW = 12
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling FRED while the circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a failing dependency until a single probe succeeds.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    every call fails fast with ``CircuitOpenError``. Once ``reset_timeout``
+    seconds have passed it becomes half-open and lets exactly one probe
+    through: success closes it, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def call(self, fn):
+        with self._lock:
+            if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.OPEN or (self.state == self.HALF_OPEN and self._probing):
+                self.rejected += 1
+                raise CircuitOpenError("FRED circuit breaker is open")
+            if self.state == self.HALF_OPEN:
+                self._probing = True
+
+        try:
+            result = fn()
+        except Exception:
+            with self._lock:
+                self.failures += 1
+                self._probing = False
+                if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                    if self.state != self.OPEN:
+                        logger.warning("FRED circuit breaker opened after %d failures", self.failures)
+                    self.state = self.OPEN
+                    self._opened_at = time.monotonic()
+            raise
+
+        with self._lock:
+            if self.state != self.CLOSED:
+                logger.info("FRED circuit breaker closed")
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+        return result
+
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution.
+
+    The first caller runs ``fn``; callers arriving while it is in flight
+    wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._calls: dict = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class FredClient:
+    """Connection-pooled client for the FRED ``series/observations`` endpoint.
+
+    One instance is meant to be shared by the whole process: the underlying
+    ``httpx.Client`` keeps connections alive between calls, and series are
+    fetched concurrently on a small thread pool. ``timeout`` applies to each
+    series request independently.
+
+    Identical concurrent requests share one in-flight call, and every request
+    goes through a ``CircuitBreaker`` so that an unreachable FRED fails fast
+    and callers fall back to their caches.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None,
+        base_url: str = "https://api.stlouisfed.org/fred",
+        timeout: float = 10.0,
+        max_workers: int = 4,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        self.api_key = api_key
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self._flight = SingleFlight()
+        self._http = httpx.Client(
+            base_url=base_url,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_workers, max_keepalive_connections=max_workers),
+        )
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fred")
+
+    def get_series(self, series_id: str, **params) -> pd.Series:
+        """Return observations of ``series_id`` as a float series indexed by date."""
+        key = (series_id, tuple(sorted(params.items())))
+        return self._flight.do(key, lambda: self.breaker.call(lambda: self._get_series(series_id, params)))
+
+    def _get_series(self, series_id: str, params: dict) -> pd.Series:
+        response = self._http.get(
+            "/series/observations",
+            params={
+                "series_id": series_id,
+                "api_key": self.api_key,
+                "file_type": "json",
+                **params,
+            },
+        )
+        response.raise_for_status()
+        observations = response.json()["observations"]
+        return pd.Series(
+            [
+                float("nan") if obs["value"] == MISSING_VALUE else float(obs["value"])
+                for obs in observations
+            ],
+            index=pd.to_datetime([obs["date"] for obs in observations]),
+            name=series_id,
+            dtype="float64",
+        )
+
+    def get_latest(self, series_id: str) -> float:
+        """Return the most recent non-missing observation of ``series_id``."""
+        series = self.get_series(series_id, sort_order="desc", limit=LATEST_WINDOW).dropna()
+        if series.empty:
+            raise ValueError(f"No observations for FRED series '{series_id}'")
+        return float(series.iloc[0])
+
+    def get_latest_many(self, series_ids: list[str]) -> dict[str, float | Exception]:
+        """Fetch the latest value of every series concurrently.
+
+        Failures are returned in place of the value instead of being raised,
+        so one slow or broken series does not hide the others.
+        """
+        futures = {sid: self._pool.submit(self.get_latest, sid) for sid in series_ids}
+        results: dict[str, float | Exception] = {}
+        for sid, future in futures.items():
+            try:
+                results[sid] = future.result()
+            except Exception as e:
+                results[sid] = e
+        return results
+
+    def stats(self) -> dict:
+        """Return circuit breaker state and single-flight counters."""
+        return {
+            "breaker_state": self.breaker.state,
+            "consecutive_failures": self.breaker.failures,
+            "rejected_calls": self.breaker.rejected,
+            "coalesced_waiters": self._flight.coalesced,
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+        self._http.close()
+
+
+_client: FredClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_fred_client() -> FredClient:
+    """Return the process-wide FRED client, creating it on first use."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = FredClient(
+                api_key=settings.fred_api_key,
+                base_url=settings.fred_base_url,
+                timeout=settings.fred_timeout,
+                failure_threshold=settings.fred_breaker_failures,
+                reset_timeout=settings.fred_breaker_reset_timeout,
+            )
+        return _client
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+SERIES_DIR = Path("storage/fred_series")
+
+
+class SeriesStore:
+    """Local Parquet store of full FRED observation histories, one file per series.
+
+    Each series is loaded once into an in-memory index of sorted dates and
+    non-missing values, so ``latest`` and ``as_of`` lookups are a binary
+    search with no network I/O. The index is reloaded only when the file's
+    mtime changes, e.g. after another process refreshed it. ``refresh`` only
+    requests observations newer than the last stored date.
+    """
+
+    def __init__(self, root: Path = SERIES_DIR):
+        self.root = root
+        self._index: dict[str, tuple[float, np.ndarray, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, series_id: str) -> Path:
+        return self.root / f"{series_id}.parquet"
+
+    def read(self, series_id: str) -> pd.Series:
+        """Return the stored history of ``series_id`` (empty if never fetched)."""
+        path = self._path(series_id)
+        if not path.exists():
+            return pd.Series(dtype="float64", index=pd.DatetimeIndex([], name="date"), name=series_id)
+        df = pd.read_parquet(path)
+        return df.set_index("date")["value"].rename(series_id)
+
+    def _write(self, series_id: str, series: pd.Series) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(series_id)
+        # Each writer uses its own temporary file, as in ``save_cache``: concurrent
+        # refreshes never interleave, and the last rename wins.
+        fd, tmp = tempfile.mkstemp(dir=self.root, prefix=f".{series_id}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                series.rename("value").rename_axis("date").reset_index().to_parquet(f, index=False)
+            Path(tmp).replace(path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _load_index(self, series_id: str) -> tuple[np.ndarray, np.ndarray]:
+        path = self._path(series_id)
+        mtime = path.stat().st_mtime if path.exists() else None
+        with self._lock:
+            entry = self._index.get(series_id)
+            if entry is None or entry[0] != mtime:
+                series = self.read(series_id).dropna()
+                entry = (mtime, series.index.values.astype("datetime64[D]"), series.to_numpy())
+                self._index[series_id] = entry
+            return entry[1], entry[2]
+
+    def refresh(self, series_id: str, client) -> int:
+        """Fetch observations newer than the last stored date and append them.
+
+        Returns the number of new observations stored.
+        """
+        stored = self.read(series_id)
+        params = {}
+        if not stored.empty:
+            params["observation_start"] = (stored.index.max() + timedelta(days=1)).strftime("%Y-%m-%d")
+
+        new = client.get_series(series_id, **params)
+        if not stored.empty:
+            new = new[new.index > stored.index.max()]
+        if not new.empty:
+            self._write(series_id, pd.concat([stored, new]).sort_index() if not stored.empty else new)
+        logger.info("Refreshed FRED series %s: %d new observations", series_id, len(new))
+        return len(new)
+
+    def latest(self, series_id: str) -> float:
+        """Return the most recent stored non-missing value of ``series_id``."""
+        dates, values = self._load_index(series_id)
+        if not len(values):
+            raise ValueError(f"No stored observations for FRED series '{series_id}'")
+        return float(values[-1])
+
+    def as_of(self, series_id: str, as_of: date) -> float:
+        """Return the last stored non-missing value observed on or before ``as_of``."""
+        dates, values = self._load_index(series_id)
+        pos = np.searchsorted(dates, np.datetime64(as_of, "D"), side="right") - 1
+        if pos < 0:
+            raise ValueError(f"No stored observations for FRED series '{series_id}' on or before {as_of}")
+        return float(values[pos])
+
+    def last_date(self, series_id: str) -> date | None:
+        dates, _ = self._load_index(series_id)
+        return dates[-1].astype(object) if len(dates) else None
+
+
+_store: SeriesStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_series_store() -> SeriesStore:
+    """Return the process-wide series store, creating it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SeriesStore(SERIES_DIR)
+        return _store
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+# Relative accuracy of the quantile sketch: every reported quantile is within
+# this fraction of a value whose rank is the requested one.
+SKETCH_RELATIVE_ACCURACY = 0.01
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+HISTOGRAM_BINS = 20
+TARGET_COLUMN = "default"
+
+
+class ColumnSummary:
+    """Mergeable one-pass summary of a numeric column.
+
+    Count, mean and variance are accumulated with Chan's parallel update, so
+    summaries of chunks or shards merge exactly. Quantiles and the histogram
+    come from a log-bucket sketch with ``SKETCH_RELATIVE_ACCURACY`` relative
+    accuracy (the DDSketch mapping): positive and negative values are counted
+    in buckets ``ceil(log_gamma |x|)``, which also merge by adding counts.
+    """
+
+    _gamma = (1 + SKETCH_RELATIVE_ACCURACY) / (1 - SKETCH_RELATIVE_ACCURACY)
+    _log_gamma = math.log(_gamma)
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.zeros = 0
+        self.positive: dict[int, int] = {}
+        self.negative: dict[int, int] = {}
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values)
+        if values.dtype.kind == "f":
+            values = values[~np.isnan(values)]
+        if not len(values):
+            return
+        chunk = ColumnSummary()
+        chunk.count = len(values)
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        if chunk.min == chunk.max:
+            # Constant columns (macro values, single-class targets) need no pass over the data.
+            chunk.mean = chunk.min
+            chunk._add_value(chunk.min, chunk.count)
+        else:
+            wide = values.astype(np.float64, copy=False)
+            chunk.mean = float(wide.mean())
+            deviations = wide - chunk.mean
+            chunk.m2 = float(deviations @ deviations)
+            # Bucket keys only need float32 precision; float32 log is several times faster.
+            narrow = values.astype(np.float32, copy=False)
+            chunk.zeros = int(np.count_nonzero(narrow == 0))
+            chunk.positive = self._buckets(narrow[narrow > 0])
+            chunk.negative = self._buckets(-narrow[narrow < 0])
+        self.merge(chunk)
+
+    def _add_value(self, value: float, n: int) -> None:
+        """Count ``n`` copies of ``value`` in the sketch buckets only."""
+        if value == 0:
+            self.zeros += n
+            return
+        buckets = self.positive if value > 0 else self.negative
+        key = math.ceil(math.log(abs(value)) / self._log_gamma)
+        buckets[key] = buckets.get(key, 0) + n
+
+    @classmethod
+    def _buckets(cls, magnitudes: np.ndarray) -> dict[int, int]:
+        if not len(magnitudes):
+            return {}
+        keys = np.ceil(np.log(magnitudes) * np.float32(1 / cls._log_gamma)).astype(np.int64)
+        low = int(keys.min())
+        counts = np.bincount(keys - low)
+        nonzero = np.flatnonzero(counts)
+        return dict(zip((nonzero + low).tolist(), counts[nonzero].tolist()))
+
+    def merge(self, other: ColumnSummary) -> None:
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.zeros += other.zeros
+        for mine, theirs in ((self.positive, other.positive), (self.negative, other.negative)):
+            for key, n in theirs.items():
+                mine[key] = mine.get(key, 0) + n
+
+    def _points(self) -> list[tuple[float, int]]:
+        """Ascending ``(representative value, count)`` of every sketch bucket."""
+        scale = 2 / (1 + self._gamma)
+        points = [(-scale * self._gamma ** key, n) for key, n in sorted(self.negative.items(), reverse=True)]
+        if self.zeros:
+            points.append((0.0, self.zeros))
+        points += [(scale * self._gamma ** key, n) for key, n in sorted(self.positive.items())]
+        return [(min(max(value, self.min), self.max), n) for value, n in points]
+
+    def quantiles(self, qs=QUANTILES) -> dict[str, float]:
+        points = self._points()
+        result = {}
+        for q in qs:
+            rank, seen = q * (self.count - 1), 0
+            for value, n in points:
+                seen += n
+                if seen > rank:
+                    break
+            result[f"p{round(q * 100):02d}"] = value
+        return result
+
+    def histogram(self, bins: int = HISTOGRAM_BINS) -> dict[str, list]:
+        """Counts in ``bins`` equal-width bins between the exact min and max."""
+        if self.min == self.max:
+            return {"edges": [self.min, self.max], "counts": [self.count]}
+        edges = np.linspace(self.min, self.max, bins + 1)
+        counts = [0] * bins
+        width = (self.max - self.min) / bins
+        for value, n in self._points():
+            counts[min(int((value - self.min) / width), bins - 1)] += n
+        return {"edges": edges.tolist(), "counts": counts}
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "std": math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0,
+            "min": self.min,
+            "max": self.max,
+            "quantiles": self.quantiles(),
+            "histogram": self.histogram(),
+        }
+
+
+class DatasetSummary:
+    """Mergeable summary of every numeric column of a dataset, built chunk by chunk."""
+
+    def __init__(self):
+        self.rows = 0
+        self.columns: dict[str, ColumnSummary] = {}
+
+    def update(self, df: pd.DataFrame) -> None:
+        self.rows += len(df)
+        for column in df.select_dtypes("number"):
+            self.columns.setdefault(column, ColumnSummary()).update(df[column].to_numpy())
+
+    def merge(self, other: DatasetSummary) -> None:
+        self.rows += other.rows
+        for column, summary in other.columns.items():
+            self.columns.setdefault(column, ColumnSummary()).merge(summary)
+
+    def to_dict(self) -> dict:
+        """JSON-ready statistics: row count, default rate and per-column summaries."""
+        target = self.columns.get(TARGET_COLUMN)
+        return {
+            "rows": self.rows,
+            "default_rate": target.mean if target is not None and target.count else None,
+            "sketch_relative_accuracy": SKETCH_RELATIVE_ACCURACY,
+            "columns": {column: summary.to_dict() for column, summary in self.columns.items() if summary.count},
+        }
+
+
+def summarize(df: pd.DataFrame) -> DatasetSummary:
+    """Summarize a whole frame in one pass."""
+    summary = DatasetSummary()
+    summary.update(df)
+    return summary
@@ -1,3 +1,3 @@
 """API routes for the data domain."""
 
-__all__ = ["generate"]
+__all__ = ["datasets", "generate", "macro"]
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, HTTPException
+
+from app.artifacts.infrastructure import get_dataset_stats
+from app.data.schemas import DatasetStatsResponse
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/datasets", tags=["Datasets"])
+
+
+@router.get("/{name:path}/stats")
+def dataset_stats(name: str) -> DatasetStatsResponse:
+    """
+    Return the summary statistics computed while the dataset was generated:
+    per-column count, mean, std, min/max, quantiles and histogram, plus the
+    default rate. Served from the dataset record without reading the data.
+    """
+    try:
+        stats = get_dataset_stats(name)
+    except Exception as e:
+        logger.error("Failed to read statistics of dataset %s: %s", name, e)
+        raise HTTPException(status_code=503, detail="Dataset statistics are unavailable")
+    if stats is None:
+        raise HTTPException(status_code=404, detail=f"No statistics for dataset '{name}'")
+    return DatasetStatsResponse(dataset_name=name, **stats)
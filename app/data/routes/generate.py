@@ -1,6 +1,11 @@
-from fastapi import APIRouter
-from app.data.schemas import DatasetRequest, DatasetResponse
-from app.data.service import build_dataset
+from fastapi import APIRouter, HTTPException
+from app.data.schemas import (
+    DatasetRequest,
+    DatasetResponse,
+    ScenarioBatchRequest,
+    ScenarioBatchResponse,
+)
+from app.data.service import build_scenario_batch, expand_macro_grid, stream_dataset
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,20 +16,60 @@ router = APIRouter(prefix="/generate", tags=["Dataset Generation"])
 def generate_dataset(request: DatasetRequest) -> DatasetResponse:
     """
     Generate a synthetic borrower dataset.
-    Optionally override macroeconomic fields in request.
+    Optionally override macroeconomic fields in request. Requests that set
+    ``seed`` reuse an identical, previously generated dataset.
+    The dataset is streamed to disk in chunks; the preview comes from the
+    first chunk, so the full dataset is never held in memory.
+    With ``as_of``, missing macro fields are read from the local FRED
+    series store as of that date. With ``partitioned``, the dataset is
+    written as a directory of one part file per shard plus a manifest.
     """
     user_macro = (
         request.macro_overrides.model_dump(exclude_none=True)
         if request.macro_overrides
         else None
     )
-    dataset_name, df, macro = build_dataset(user_macro, request.n_borrowers)
-    logger.info("Generated dataset %s with shape %s", dataset_name, df.shape)
-    preview = df.head(10).to_dict(orient="records")
+    try:
+        dataset_name, rows, preview_df, macro = stream_dataset(
+            user_macro,
+            request.n_borrowers,
+            seed=request.seed,
+            shards=request.shards,
+            as_of=request.as_of,
+            partitioned=request.partitioned,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.info("Generated dataset %s with %d rows", dataset_name, rows)
+    preview = preview_df.to_dict(orient="records")
 
     return DatasetResponse(
         dataset_name=dataset_name,
-        rows=len(df),
+        rows=rows,
         macro=macro,
         preview=preview,
     )
+
+
+@router.post("/scenarios")
+def generate_scenarios(request: ScenarioBatchRequest) -> ScenarioBatchResponse:
+    """
+    Generate one borrower population under many macro scenarios.
+    Scenarios are the explicit list followed by the cartesian product of
+    ``grid``; scenario ids follow that order.
+    """
+    scenarios = [s.model_dump(exclude_none=True) for s in request.scenarios]
+    if request.grid:
+        scenarios += expand_macro_grid(request.grid.model_dump(exclude_none=True))
+    if not scenarios:
+        raise HTTPException(status_code=400, detail="No scenarios given")
+
+    try:
+        dataset_name, summaries = build_scenario_batch(
+            scenarios, request.n_borrowers, seed=request.seed, as_of=request.as_of
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    logger.info("Generated scenario batch %s with %d scenarios", dataset_name, len(summaries))
+
+    return ScenarioBatchResponse(dataset_name=dataset_name, scenarios=summaries)
@@ -0,0 +1,44 @@
+import httpx
+from fastapi import APIRouter, HTTPException
+from app.data.core import CircuitOpenError, get_fred_client, macro_cache_stats, refresh_series_store
+from app.data.schemas import FredClientStats, MacroCacheStats, SeriesRefreshResponse
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+router = APIRouter(prefix="/macro", tags=["Macro Data"])
+
+
+@router.get("/cache/stats")
+def cache_stats() -> MacroCacheStats:
+    """
+    Report macro cache counters for this process.
+    Hits and stale hits never touch the network; misses and fallbacks do.
+    """
+    return MacroCacheStats(**macro_cache_stats())
+
+
+@router.get("/fred/stats")
+def fred_stats() -> FredClientStats:
+    """
+    Report the FRED circuit breaker state (closed, open, half_open) and how
+    many callers joined an already in-flight request instead of calling FRED.
+    """
+    return FredClientStats(**get_fred_client().stats())
+
+
+@router.post("/series/refresh")
+def series_refresh() -> SeriesRefreshResponse:
+    """
+    Pull observations newer than the last stored date for every FRED series
+    into the local series store used by as-of dataset generation.
+    Answers 503 while FRED is unreachable or its circuit breaker is open.
+    """
+    try:
+        new_observations = refresh_series_store()
+    except CircuitOpenError as e:
+        logger.warning("FRED series refresh rejected: %s", e)
+        raise HTTPException(status_code=503, detail="FRED is unavailable (circuit breaker open), retry later")
+    except httpx.HTTPError as e:
+        logger.error("FRED series refresh failed: %s", e)
+        raise HTTPException(status_code=503, detail="FRED series refresh failed, retry later")
+    return SeriesRefreshResponse(new_observations=new_observations)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import Optional, List, Dict, Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from settings import settings
 
 
 class MacroOverrides(BaseModel):
@@ -12,8 +15,12 @@ class MacroOverrides(BaseModel):
 
 
 class DatasetRequest(BaseModel):
-    n_borrowers: int = 1000
+    n_borrowers: int = Field(default=1000, ge=0)
     macro_overrides: Optional[MacroOverrides] = None
+    shards: int = Field(default=1, ge=1, le=settings.dataset_max_shards)
+    seed: Optional[int] = None
+    as_of: Optional[date] = None
+    partitioned: bool = False
 
 
 class DatasetResponse(BaseModel):
@@ -23,8 +30,87 @@ class DatasetResponse(BaseModel):
     preview: List[Dict[str, Any]]
 
 
+class MacroGrid(BaseModel):
+    debt_ratio: Optional[List[float]] = None
+    delinquency: Optional[List[float]] = None
+    interest_rate: Optional[List[float]] = None
+
+
+class ScenarioBatchRequest(BaseModel):
+    n_borrowers: int = Field(default=1000, ge=0)
+    scenarios: List[MacroOverrides] = Field(default_factory=list)
+    grid: Optional[MacroGrid] = None
+    seed: Optional[int] = None
+    as_of: Optional[date] = None
+
+
+class ScenarioSummary(BaseModel):
+    scenario_id: int
+    macro: Dict[str, float]
+    rows: int
+    default_rate: float
+
+
+class ScenarioBatchResponse(BaseModel):
+    dataset_name: str
+    scenarios: List[ScenarioSummary]
+
+
+class MacroCacheStats(BaseModel):
+    hits: int
+    stale_hits: int
+    misses: int
+    refreshes: int
+    refresh_failures: int
+    fallbacks: int
+
+
+class FredClientStats(BaseModel):
+    breaker_state: str
+    consecutive_failures: int
+    rejected_calls: int
+    coalesced_waiters: int
+
+
+class SeriesRefreshResponse(BaseModel):
+    new_observations: Dict[str, int]
+
+
+class Histogram(BaseModel):
+    edges: List[float]
+    counts: List[int]
+
+
+class ColumnStats(BaseModel):
+    count: int
+    mean: float
+    std: float
+    min: float
+    max: float
+    quantiles: Dict[str, float]
+    histogram: Histogram
+
+
+class DatasetStatsResponse(BaseModel):
+    dataset_name: str
+    rows: int
+    default_rate: Optional[float] = None
+    sketch_relative_accuracy: float
+    columns: Dict[str, ColumnStats]
+
+
 __all__ = [
     "MacroOverrides",
     "DatasetRequest",
     "DatasetResponse",
+    "MacroGrid",
+    "ScenarioBatchRequest",
+    "ScenarioSummary",
+    "ScenarioBatchResponse",
+    "MacroCacheStats",
+    "FredClientStats",
+    "SeriesRefreshResponse",
+    "Histogram",
+    "ColumnStats",
+    "DatasetStatsResponse",
 ]
@@ -1,3 +1,3 @@
-from .generate import build_dataset
+from .generate import build_dataset, build_scenario_batch, expand_macro_grid, stream_dataset
 
-__all__ = ["build_dataset"]
+__all__ = ["build_dataset", "build_scenario_batch", "expand_macro_grid", "stream_dataset"]
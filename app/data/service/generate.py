@@ -1,37 +1,432 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import product, repeat
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from uuid import uuid4
 
-from app.artifacts.infrastructure import log_dataset
-from app.data.core import get_macro_data, generate_synthetic_data
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from app.artifacts.infrastructure import (
+    DatasetWriter,
+    ParquetWriteOptions,
+    dataset_metadata,
+    expand_constants,
+    find_dataset_by_hash,
+    log_dataset,
+    log_datasets,
+    read_manifest,
+    resolve_dataset,
+    write_dataset,
+    write_manifest,
+    write_sidecar,
+)
+from app.data.core import (
+    GENERATOR_VERSION,
+    DatasetSummary,
+    apply_macro,
+    draw_borrowers,
+    get_macro_data,
+    get_macro_data_as_of,
+    generate_synthetic_data,
+    iter_synthetic_data,
+    summarize,
+)
+from settings import settings
 from utils.logger import get_logger
 
 
 DATASET_DIR = Path("storage/datasets")
 DATASET_DIR.mkdir(parents=True, exist_ok=True)
+PREVIEW_ROWS = 10
+REQUIRED_MACRO = {"debt_ratio", "delinquency", "interest_rate"}
 logger = get_logger(__name__)
 
 
-def build_dataset(macro_overrides: dict | None, n_borrowers: int):
+def _fetch_macro(fields: list[str], as_of: date | None = None) -> dict:
+    logger.info(f"Fetching missing macro fields: {fields}")
+    if as_of is not None:
+        return get_macro_data_as_of(as_of, fields)
+    return get_macro_data(fields, use_cache=True)
+
+
+def _resolve_macro(macro_overrides: dict | None, as_of: date | None = None) -> dict:
+    """Merge user overrides with FRED values for any missing macro fields.
+
+    With ``as_of`` the missing fields come from the local series store as
+    observed on that date instead of the latest FRED values.
+    """
     user_macro = macro_overrides or {}
-    required = {"debt_ratio", "delinquency", "interest_rate"}
-    missing = list(required - set(user_macro.keys()))
+    missing = list(REQUIRED_MACRO - set(user_macro.keys()))
 
     if missing:
-        logger.info(f"Fetching missing macro fields: {missing}")
-        fetched = get_macro_data(missing, use_cache=False)
-        macro = {**fetched, **user_macro}
-    else:
-        macro = user_macro
+        fetched = _fetch_macro(missing, as_of)
+        return {**fetched, **user_macro}
+    return user_macro
+
+
+def _log_dataset(dataset_name: str, rows: int, macro: dict, **extra) -> None:
+    try:
+        log_dataset(name=dataset_name, rows=rows, macro=macro, **extra)
+    except Exception as e:
+        logger.warning("Failed to log dataset to database: %s", e)
+
+
+def _write_sidecar(dataset_path: Path) -> None:
+    """Write the memory-mappable feature sidecar when ``DATASET_IPC_SIDECAR`` is enabled.
+
+    The sidecar is only an accelerator: readers fall back to Parquet without it.
+    """
+    if not settings.dataset_ipc_sidecar:
+        return
+    try:
+        write_sidecar(dataset_path)
+    except Exception as e:
+        logger.warning("Failed to write feature sidecar for %s: %s", dataset_path, e)
+
+
+def dataset_content_hash(
+    macro: dict, n_borrowers: int, seed: int, shards: int, chunk_size: int, partitioned: bool = False
+) -> str:
+    """Hash every input that determines the contents and layout of a seeded dataset."""
+    payload = {
+        "generator_version": GENERATOR_VERSION,
+        "macro": {key: float(value) for key, value in sorted(macro.items())},
+        "n_borrowers": n_borrowers,
+        "seed": seed,
+        "shards": shards,
+        "chunk_size": chunk_size,
+        "layout": "partitioned" if partitioned else "file",
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _find_cached_dataset(content_hash: str) -> tuple[str, int, Path] | None:
+    """Return (name, rows, path) of an existing dataset with this hash, if still on disk."""
+    try:
+        record = find_dataset_by_hash(content_hash)
+    except Exception as e:
+        logger.warning("Failed to look up dataset hash in database: %s", e)
+        return None
+    path = resolve_dataset(DATASET_DIR, record.name) if record is not None else None
+    if path is None:
+        return None
+    return record.name, record.rows, path
+
+
+def _read_preview(path: Path) -> pd.DataFrame:
+    if path.is_dir():
+        parts = read_manifest(path)["parts"]
+        if not parts:
+            return pd.DataFrame()
+        path = path / parts[0]["file"]
+    parquet_file = pq.ParquetFile(path)
+    batch = next(parquet_file.iter_batches(batch_size=PREVIEW_ROWS), None)
+    if batch is None:
+        return pd.DataFrame()
+    return expand_constants(batch.to_pandas(), dataset_metadata(parquet_file.schema_arrow))
+
+
+def build_dataset(macro_overrides: dict | None, n_borrowers: int):
+    macro = _resolve_macro(macro_overrides)
 
     df = generate_synthetic_data(macro, n=n_borrowers)
     dataset_name = f"dataset_{uuid4().hex[:8]}"
     file_path = DATASET_DIR / f"{dataset_name}.parquet"
-    df.to_parquet(file_path, index=False)
+    write_dataset(df, file_path)
     logger.info("Saved dataset %s -> %s", dataset_name, file_path)
+    _write_sidecar(file_path)
+
+    _log_dataset(dataset_name, len(df), macro, stats=summarize(df).to_dict())
+
+    return dataset_name, df, macro
+
+
+def _write_chunks(
+    path: Path, chunks, options: ParquetWriteOptions
+) -> tuple[int, pd.DataFrame, DatasetSummary]:
+    """Append every chunk to ``path`` through a single ``DatasetWriter``.
+
+    Each chunk becomes one or more row groups of at most
+    ``options.row_group_rows`` rows, and is folded into the dataset summary
+    while it is still in memory.
+    """
+    preview = None
+    summary = DatasetSummary()
+    with DatasetWriter(path, options) as writer:
+        for chunk in chunks:
+            if preview is None:
+                preview = chunk.head(PREVIEW_ROWS)
+            summary.update(chunk)
+            writer.write(chunk)
+    return writer.rows, preview, summary
+
+
+def _write_shard(
+    path: Path,
+    macro: dict,
+    n: int,
+    chunk_size: int,
+    seed: np.random.SeedSequence,
+    options: ParquetWriteOptions,
+) -> tuple[int, pd.DataFrame, DatasetSummary]:
+    """Process-pool entry point: stream one shard to its own part file."""
+    return _write_chunks(path, iter_synthetic_data(macro, n, chunk_size, seed=seed), options)
+
+
+def _shard_sizes(n: int, shards: int) -> list[int]:
+    base, extra = divmod(n, shards)
+    return [base + (i < extra) for i in range(shards)]
+
+
+def _write_shards(
+    parts_dir: Path,
+    macro: dict,
+    n: int,
+    chunk_size: int,
+    seed: int | None,
+    shards: int,
+    workers: int | None,
+    options: ParquetWriteOptions,
+) -> tuple[list[Path], int, pd.DataFrame, DatasetSummary]:
+    """Generate shards in a process pool, one ``part-<k>.parquet`` file each.
+
+    Every shard draws from its own child of one ``SeedSequence``, so the output
+    depends only on ``(seed, shards, chunk_size)`` and not on ``workers`` or on
+    scheduling order. Returns the part paths in shard order, the total row
+    count, the preview of the first shard and the merged shard summaries.
+    """
+    shards = max(1, min(shards, n))
+    children = np.random.SeedSequence(seed).spawn(shards)
+    workers = min(shards, workers or os.cpu_count() or 1)
+
+    part_paths = [parts_dir / f"part-{i:05d}.parquet" for i in range(shards)]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        results = list(pool.map(
+            _write_shard,
+            part_paths,
+            repeat(macro),
+            _shard_sizes(n, shards),
+            repeat(chunk_size),
+            children,
+            repeat(options),
+        ))
+    summary = DatasetSummary()
+    for _, _, shard_summary in results:
+        summary.merge(shard_summary)
+    return part_paths, sum(part_rows for part_rows, _, _ in results), results[0][1], summary
+
+
+def _write_parallel(
+    path: Path,
+    macro: dict,
+    n: int,
+    chunk_size: int,
+    seed: int | None,
+    shards: int,
+    workers: int | None,
+    options: ParquetWriteOptions,
+) -> tuple[int, pd.DataFrame, DatasetSummary]:
+    """Generate shards in parallel, then merge the parts in shard order into ``path``."""
+    with TemporaryDirectory(dir=path.parent, prefix=f".{path.stem}.") as parts_dir:
+        part_paths, rows, preview, summary = _write_shards(
+            Path(parts_dir), macro, n, chunk_size, seed, shards, workers, options
+        )
+        with DatasetWriter(path, options) as writer:
+            for part in part_paths:
+                parquet_file = pq.ParquetFile(part)
+                for i in range(parquet_file.num_row_groups):
+                    writer.write_table(parquet_file.read_row_group(i))
+
+    return rows, preview, summary
+
+
+def _write_partitioned(
+    directory: Path,
+    macro: dict,
+    n: int,
+    chunk_size: int,
+    seed: int | None,
+    shards: int,
+    workers: int | None,
+    options: ParquetWriteOptions,
+) -> tuple[int, pd.DataFrame, DatasetSummary]:
+    """Write one part file per shard into ``directory``, then its manifest.
+
+    A single shard draws from ``seed`` directly, exactly like a single-file
+    dataset with the same inputs.
+    """
+    directory.mkdir(parents=True)
+    if shards > 1:
+        _, rows, preview, summary = _write_shards(
+            directory, macro, n, chunk_size, seed, shards, workers, options
+        )
+    else:
+        chunks = iter_synthetic_data(macro, n, chunk_size, seed=seed)
+        rows, preview, summary = _write_chunks(directory / "part-00000.parquet", chunks, options)
+    write_manifest(directory)
+    return rows, preview, summary
+
+
+def stream_dataset(
+    macro_overrides: dict | None,
+    n_borrowers: int,
+    chunk_size: int | None = None,
+    seed: int | None = None,
+    shards: int = 1,
+    workers: int | None = None,
+    as_of: date | None = None,
+    partitioned: bool = False,
+) -> tuple[str, int, pd.DataFrame, dict]:
+    """Generate a dataset chunk by chunk, appending each chunk as row groups.
+
+    Peak memory is bounded by ``chunk_size`` rather than ``n_borrowers``. The
+    file is written under a temporary name and renamed once complete, so a
+    partially written dataset is never visible to readers.
+
+    With ``shards > 1`` the borrowers are split into that many shards which
+    are generated in parallel by up to ``workers`` processes and merged into
+    the same single file.
+
+    With ``partitioned`` the dataset is a ``<name>/`` directory holding one
+    part file per shard and a manifest instead of a single file, and shards
+    are not merged.
+
+    When ``seed`` is given the output is fully determined by its inputs, so
+    they are hashed and an existing dataset with the same hash is returned
+    without generating anything.
+
+    ``as_of`` resolves missing macro fields from the local FRED series store
+    as of that date, without network I/O.
+
+    Summary statistics of every numeric column are accumulated from the
+    chunks as they are written and logged with the dataset record.
+
+    Returns the dataset name, the total row count, a preview taken from the
+    first chunk, and the resolved macro values.
+    """
+    macro = _resolve_macro(macro_overrides, as_of)
+    chunk_size = chunk_size or settings.dataset_chunk_size
+    options = ParquetWriteOptions.from_settings()
+
+    content_hash = None
+    if seed is not None:
+        content_hash = dataset_content_hash(macro, n_borrowers, seed, shards, chunk_size, partitioned)
+        cached = _find_cached_dataset(content_hash)
+        if cached is not None:
+            dataset_name, rows, path = cached
+            logger.info("Reusing dataset %s for content hash %s", dataset_name, content_hash)
+            return dataset_name, rows, _read_preview(path), macro
+
+    dataset_name = f"dataset_{uuid4().hex[:8]}"
+    if partitioned:
+        file_path = DATASET_DIR / dataset_name
+        tmp_path = DATASET_DIR / f".{dataset_name}.tmp"
+    else:
+        file_path = DATASET_DIR / f"{dataset_name}.parquet"
+        tmp_path = file_path.with_suffix(".parquet.tmp")
 
     try:
-        log_dataset(name=dataset_name, rows=len(df), macro=macro)
+        if partitioned:
+            rows, preview, summary = _write_partitioned(
+                tmp_path, macro, n_borrowers, chunk_size, seed, shards, workers, options
+            )
+        elif shards > 1:
+            rows, preview, summary = _write_parallel(
+                tmp_path, macro, n_borrowers, chunk_size, seed, shards, workers, options
+            )
+        else:
+            chunks = iter_synthetic_data(macro, n_borrowers, chunk_size, seed=seed)
+            rows, preview, summary = _write_chunks(tmp_path, chunks, options)
+    except Exception:
+        if tmp_path.is_dir():
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        else:
+            tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(file_path)
+    logger.info("Streamed dataset %s (%d rows) -> %s", dataset_name, rows, file_path)
+    _write_sidecar(file_path)
+
+    _log_dataset(dataset_name, rows, macro, content_hash=content_hash, stats=summary.to_dict())
+
+    return dataset_name, rows, preview, macro
+
+
+def expand_macro_grid(grid: dict[str, list[float]]) -> list[dict]:
+    """Expand ``{field: [values, ...]}`` into the cartesian product of overrides."""
+    fields = sorted(field for field, values in grid.items() if values)
+    return [dict(zip(fields, combo)) for combo in product(*(grid[field] for field in fields))]
+
+
+def build_scenario_batch(
+    scenarios: list[dict],
+    n_borrowers: int,
+    seed: int | None = None,
+    as_of: date | None = None,
+) -> tuple[str, list[dict]]:
+    """Generate one borrower population under many macro scenarios in one pass.
+
+    Borrowers are drawn once and only the macro-dependent columns are
+    recomputed per scenario. Output is a single Hive-partitioned dataset,
+    ``<name>/scenario_id=<k>/part-0.parquet``. Every scenario directory
+    gets its own manifest and is logged as ``<name>/scenario_id=<k>`` in one
+    bulk database write, so it can be trained, evaluated and pruned by that
+    name. Missing macro fields are fetched once for the whole batch.
+
+    Returns the batch name and one summary per scenario.
+    """
+    missing = sorted({field for scenario in scenarios for field in REQUIRED_MACRO - scenario.keys()})
+    fetched = _fetch_macro(missing, as_of) if missing else {}
+    macros = [{**fetched, **scenario} for scenario in scenarios]
+
+    draws = draw_borrowers(n_borrowers, seed)
+    batch_name = f"scenarios_{uuid4().hex[:8]}"
+    batch_dir = DATASET_DIR / batch_name
+    tmp_dir = DATASET_DIR / f".{batch_name}.tmp"
+
+    summaries = []
+    stats = []
+    try:
+        for scenario_id, macro in enumerate(macros):
+            df = apply_macro(draws, macro)
+            part_dir = tmp_dir / f"scenario_id={scenario_id}"
+            part_dir.mkdir(parents=True)
+            write_dataset(df, part_dir / "part-0.parquet", constants=())
+            # Every scenario is a partitioned dataset of its own, so its logged name resolves.
+            write_manifest(part_dir)
+            stats.append(summarize(df).to_dict())
+            summaries.append({
+                "scenario_id": scenario_id,
+                "macro": macro,
+                "rows": len(df),
+                "default_rate": float(df["default"].mean()) if len(df) else 0.0,
+            })
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    tmp_dir.replace(batch_dir)
+    logger.info("Saved %d scenarios of %d rows -> %s", len(macros), n_borrowers, batch_dir)
+
+    try:
+        log_datasets([
+            {
+                "name": f"{batch_name}/scenario_id={summary['scenario_id']}",
+                "rows": summary["rows"],
+                "macro": summary["macro"],
+                "stats": scenario_stats,
+            }
+            for summary, scenario_stats in zip(summaries, stats)
+        ])
     except Exception as e:
-        logger.warning("Failed to log dataset to database: %s", e)
+        logger.warning("Failed to log scenario batch to database: %s", e)
 
-    return dataset_name, df, macro
+    return batch_name, summaries
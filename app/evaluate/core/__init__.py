@@ -1,3 +1,4 @@
-from .evaluate import evaluate_model
+from .evaluate import evaluate_metrics
+from .metrics import CAPACITIES, SortedScores, score_metrics
 
-__all__ = ["evaluate_model"]
+__all__ = ["CAPACITIES", "SortedScores", "evaluate_metrics", "score_metrics"]
@@ -1,15 +1,20 @@
 import pandas as pd
 import joblib
-from sklearn.metrics import roc_auc_score
 from utils.logger import get_logger
 
+from .metrics import CAPACITIES, score_metrics
+
 logger = get_logger(__name__)
 
-def evaluate_model(df: pd.DataFrame, model_path) -> float:
-    y = df["default"]
-    X = df.drop(columns=["name", "default"])
+def evaluate_metrics(
+    X: pd.DataFrame, y, model_path, capacities=CAPACITIES, bootstrap: int = 0, n_jobs: int = -1
+) -> dict:
+    """Score the dataset once and compute every review metric from the sorted scores."""
     model = joblib.load(model_path)
     preds = model.predict_proba(X)[:, 1]
-    auc = roc_auc_score(y, preds)
-    logger.info(f"AUC Score: {auc:.3f}")
-    return auc
+    metrics = score_metrics(y, preds, capacities=capacities, bootstrap=bootstrap, n_jobs=n_jobs)
+    logger.info(
+        f"AUC {metrics['auc']:.3f}, KS {metrics['ks']:.3f}, Brier {metrics['brier']:.4f} "
+        f"({bootstrap} bootstrap replicates)"
+    )
+    return metrics
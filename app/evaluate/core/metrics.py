@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+
+# Review capacities: fractions of the portfolio, highest scores first, that
+# precision is reported for.
+CAPACITIES = (0.05, 0.1, 0.2)
+CALIBRATION_BINS = 10
+CONFIDENCE = 0.95
+EPSILON = 1e-15
+
+
+class SortedScores:
+    """Labels and scores sorted once by descending score, with everything the metrics share.
+
+    ``ends`` marks the last row of every run of tied scores, so ROC points
+    are taken between distinct thresholds only and ties count half, as in
+    ``roc_auc_score``. Per-row Brier and log-loss terms are computed once.
+    Every metric is then a weighted sum or cumulative sum over this order,
+    and a bootstrap replicate only changes the weights.
+    """
+
+    def __init__(self, y, scores):
+        scores = np.asarray(scores, dtype=np.float64)
+        order = np.argsort(-scores, kind="stable")
+        self.scores = scores[order]
+        self.y = np.asarray(y, dtype=np.float64)[order]
+        self.ends = np.append(np.flatnonzero(np.diff(self.scores)), len(self.scores) - 1)
+        clipped = np.clip(self.scores, EPSILON, 1 - EPSILON)
+        self.brier = (self.scores - self.y) ** 2
+        self.log_loss = -(self.y * np.log(clipped) + (1 - self.y) * np.log1p(-clipped))
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def metrics(self, weights: np.ndarray | None = None, capacities=CAPACITIES) -> dict[str, float]:
+        """Scalar metrics, each row counted ``weights`` times (once by default).
+
+        Raises ``ValueError`` if the rows hold a single class. A weighted
+        (bootstrap) draw of a single class returns ``{}`` instead, and is skipped.
+        """
+        weighted = weights is not None
+        if not weighted:
+            weights = np.ones(len(self))
+        positives = np.cumsum(weights * self.y)
+        seen = np.cumsum(weights)
+        negatives = seen - positives
+        total, n_pos = seen[-1], positives[-1]
+        n_neg = total - n_pos
+        if not n_pos or not n_neg:
+            if weighted:
+                return {}
+            raise ValueError("Only one class present in y_true. ROC AUC score is not defined in that case.")
+        tpr = np.concatenate(([0.0], positives[self.ends] / n_pos))
+        fpr = np.concatenate(([0.0], negatives[self.ends] / n_neg))
+        auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2)
+        result = {
+            "auc": auc,
+            "gini": 2 * auc - 1,
+            "ks": float(np.max(tpr - fpr)),
+            "brier": float(weights @ self.brier / total),
+            "log_loss": float(weights @ self.log_loss / total),
+        }
+        for capacity in capacities:
+            cutoff = min(int(np.searchsorted(seen, capacity * total)), len(seen) - 1)
+            result[f"precision_at_{capacity:g}"] = float(positives[cutoff] / seen[cutoff])
+        return result
+
+    def calibration(self, bins: int = CALIBRATION_BINS) -> list[dict]:
+        """Equal-count bins in ascending score order: mean score against observed default rate."""
+        return [
+            {
+                "mean_score": float(self.scores[rows].mean()),
+                "default_rate": float(self.y[rows].mean()),
+                "rows": len(rows),
+            }
+            for rows in reversed(np.array_split(np.arange(len(self)), min(bins, len(self))))
+            if len(rows)
+        ]
+
+
+def _replicates(sorted_scores: SortedScores, indices, seed: int, capacities) -> list[dict[str, float]]:
+    n = len(sorted_scores)
+    results = []
+    for i in indices:
+        # Resampling n rows with replacement is counting how often each row is drawn.
+        weights = np.bincount(np.random.default_rng([seed, i]).integers(0, n, n), minlength=n).astype(np.float64)
+        results.append(sorted_scores.metrics(weights, capacities))
+    return results
+
+
+def score_metrics(
+    y,
+    scores,
+    capacities=CAPACITIES,
+    bootstrap: int = 0,
+    n_jobs: int = -1,
+    seed: int = 42,
+) -> dict:
+    """AUC, Gini, KS, Brier, log-loss, precision at each capacity and calibration bins from one sort.
+
+    With ``bootstrap`` replicates, ``intervals`` holds percentile confidence
+    intervals of every scalar metric. Replicates reuse the sorted scores and
+    only redraw row weights; replicate ``i`` is seeded by ``(seed, i)``, so
+    intervals do not depend on ``n_jobs``. They run on ``n_jobs`` threads in
+    chunks, for the same reasons as cross-validation in training.
+    """
+    sorted_scores = SortedScores(y, scores)
+    result = {
+        "rows": len(sorted_scores),
+        "default_rate": float(sorted_scores.y.mean()),
+        **sorted_scores.metrics(capacities=capacities),
+        "calibration": sorted_scores.calibration(),
+    }
+    if bootstrap:
+        chunks = np.array_split(np.arange(bootstrap), min(bootstrap, effective_n_jobs(n_jobs)))
+        replicates = [
+            replicate
+            for chunk in Parallel(n_jobs=n_jobs, prefer="threads")(
+                delayed(_replicates)(sorted_scores, chunk, seed, capacities) for chunk in chunks
+            )
+            for replicate in chunk
+            if replicate
+        ]
+        tail = (1 - CONFIDENCE) / 2 * 100
+        result["intervals"] = {
+            "confidence": CONFIDENCE,
+            "replicates": len(replicates),
+            **{
+                key: np.percentile([replicate[key] for replicate in replicates], [tail, 100 - tail]).tolist()
+                for key in (replicates[0] if replicates else {})
+            },
+        }
+    return result
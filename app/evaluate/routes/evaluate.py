@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 from celery.result import AsyncResult
 from pathlib import Path
 
+from app.artifacts.infrastructure import resolve_dataset
 from app.artifacts.infrastructure.celery_app import celery_app
 from app.artifacts.service.tasks import evaluate_model_task
 from app.evaluate.schemas import (
@@ -26,15 +27,17 @@ def evaluate_endpoint(request: EvaluateRequest) -> EvaluateResponse:
     """
     # Validate artifacts exist before submitting task
     model_path = MODEL_DIR / f"{request.model_name}.pkl"
-    dataset_path = DATASET_DIR / f"{request.dataset_name}.parquet"
     
     if not model_path.exists():
         raise HTTPException(status_code=404, detail=f"Model '{request.model_name}' not found")
-    if not dataset_path.exists():
+    if resolve_dataset(DATASET_DIR, request.dataset_name) is None:
         raise HTTPException(status_code=404, detail=f"Dataset '{request.dataset_name}' not found")
     
     # Submit async task
-    task = evaluate_model_task.delay(request.model_name, request.dataset_name)
+    if request.bootstrap:
+        task = evaluate_model_task.delay(request.model_name, request.dataset_name, bootstrap=request.bootstrap)
+    else:
+        task = evaluate_model_task.delay(request.model_name, request.dataset_name)
     logger.info("Submitted evaluation task %s for model %s on dataset %s", task.id, request.model_name, request.dataset_name)
     
     return EvaluateResponse(
@@ -53,7 +56,7 @@ def evaluate_status(task_id: str) -> EvaluateStatusResponse:
     Status values:
     - PENDING: Task is waiting to be processed
     - STARTED: Task is currently running
-    - SUCCESS: Task completed successfully (result contains auc)
+    - SUCCESS: Task completed successfully (result contains auc and metrics)
     - FAILURE: Task failed
     """
     result = AsyncResult(task_id, app=celery_app)
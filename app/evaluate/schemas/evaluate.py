@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class EvaluateRequest(BaseModel):
     model_name: str
     dataset_name: str
+    bootstrap: int = Field(default=0, ge=0, le=10_000)
 
 
 class EvaluateResponse(BaseModel):
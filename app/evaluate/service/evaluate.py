@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-import pandas as pd
 from pathlib import Path
 
-from app.artifacts.infrastructure import log_evaluation
-from app.evaluate.core import evaluate_model
+from app.artifacts.infrastructure import load_training_data, log_evaluation, resolve_dataset
+from app.evaluate.core import evaluate_metrics
+from settings import settings
 from utils.logger import get_logger
 
 
@@ -15,32 +15,43 @@ MODEL_DIR = Path("storage/models")
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def evaluate_workflow(model_name: str | None, dataset_name: str | None) -> float:
-    """Evaluate a trained model on a dataset identified by name."""
+def evaluate_workflow(model_name: str | None, dataset_name: str | None, bootstrap: int = 0) -> dict:
+    """Evaluate a trained model on a dataset identified by name.
+
+    Returns every review metric (``auc`` included) from a single scoring
+    pass, with ``bootstrap`` confidence intervals if requested.
+    """
 
     if not model_name or not dataset_name:
         raise ValueError("Missing model_name or dataset_name")
 
     model_path = MODEL_DIR / f"{model_name}.pkl"
-    dataset_path = DATASET_DIR / f"{dataset_name}.parquet"
+    dataset_path = resolve_dataset(DATASET_DIR, dataset_name)
 
     if not model_path.exists():
         raise ValueError(f"Model '{model_name}' not found")
-    if not dataset_path.exists():
+    if dataset_path is None:
         raise ValueError(f"Dataset '{dataset_name}' not found")
 
-    df = pd.read_parquet(dataset_path)
+    X, y = load_training_data(dataset_path)
     logger.info(
         "Evaluating model %s on dataset %s (shape %s)",
         model_name,
         dataset_name,
-        df.shape,
+        X.shape,
+    )
+    metrics = evaluate_metrics(
+        X,
+        y,
+        model_path,
+        capacities=settings.evaluate_capacities,
+        bootstrap=bootstrap,
+        n_jobs=settings.evaluate_bootstrap_jobs,
     )
-    auc = evaluate_model(df, model_path)
 
     try:
-        log_evaluation(model_name=model_name, dataset_name=dataset_name, auc=auc)
+        log_evaluation(model_name=model_name, dataset_name=dataset_name, auc=metrics["auc"], metrics=metrics)
     except Exception as e:
         logger.warning("Failed to log evaluation to database: %s", e)
 
-    return auc
+    return metrics
@@ -3,7 +3,9 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from app.artifacts.models import init_db
+from app.data.routes import datasets as data_datasets
 from app.data.routes import generate as data_generate
+from app.data.routes import macro as data_macro
 from app.train.routes import train as train_routes
 from app.evaluate.routes import evaluate as evaluate_routes
 from app.prune.routes import prune as prune_routes
@@ -25,6 +27,8 @@ app = FastAPI(
 
 
 app.include_router(data_generate.router)
+app.include_router(data_datasets.router)
+app.include_router(data_macro.router)
 app.include_router(train_routes.router)
 app.include_router(evaluate_routes.router)
 app.include_router(prune_routes.router)
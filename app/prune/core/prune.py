@@ -1,20 +1,37 @@
+from functools import partial
+
+import numpy as np
 import pandas as pd
 import joblib
 from sklearn.feature_selection import SelectFromModel
-from sklearn.linear_model import LogisticRegression
+from sklearn.inspection import permutation_importance
 from pathlib import Path
+
+from app.train.core import estimator_name, estimator_params, fit_estimator
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-def prune_model(df: pd.DataFrame, model_path: Path) -> Path:
-    y = df["default"]
-    X = df.drop(columns=["name", "default"])
 
+def _fixed_importances(estimator, importances: np.ndarray) -> np.ndarray:
+    return importances
+
+
+def _selector(base, X: pd.DataFrame, y) -> SelectFromModel:
+    """Select features by coefficient or importance, or by permutation importance for models without either."""
+    if hasattr(base, "coef_") or hasattr(base, "feature_importances_"):
+        return SelectFromModel(base, prefit=True, threshold="mean")
+    importances = permutation_importance(base, X, y, scoring="roc_auc", n_repeats=3, random_state=42)
+    getter = partial(_fixed_importances, importances=importances.importances_mean)
+    return SelectFromModel(base, prefit=True, threshold="mean", importance_getter=getter)
+
+
+def prune_model(X: pd.DataFrame, y, model_path: Path) -> Path:
+    """Select features with the base model and refit its backend, with its hyperparameters, on them."""
     base = joblib.load(model_path)
-    selector = SelectFromModel(base, prefit=True, threshold="mean")
+    selector = _selector(base, X, y).set_output(transform="pandas")
     Xr = selector.transform(X)
-    pruned = LogisticRegression(max_iter=500, solver="liblinear").fit(Xr, y)
+    pruned = fit_estimator(estimator_name(base), Xr, y, estimator_params(base))
 
     pruned_path = model_path.with_name(model_path.stem + "_pruned.pkl")
     joblib.dump((selector, pruned), pruned_path)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException
 from celery.result import AsyncResult
 from pathlib import Path
 
+from app.artifacts.infrastructure import resolve_dataset
 from app.artifacts.infrastructure.celery_app import celery_app
 from app.artifacts.service.tasks import prune_model_task
 from app.prune.schemas import PruneRequest, PruneResponse, PruneStatusResponse
@@ -22,11 +23,10 @@ def prune_endpoint(request: PruneRequest) -> PruneResponse:
     """
     # Validate artifacts exist before submitting task
     model_path = MODEL_DIR / f"{request.model_name}.pkl"
-    dataset_path = DATASET_DIR / f"{request.dataset_name}.parquet"
     
     if not model_path.exists():
         raise HTTPException(status_code=404, detail=f"Model '{request.model_name}' not found")
-    if not dataset_path.exists():
+    if resolve_dataset(DATASET_DIR, request.dataset_name) is None:
         raise HTTPException(status_code=404, detail=f"Dataset '{request.dataset_name}' not found")
     
     # Submit async task
@@ -2,9 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import pandas as pd
-
-from app.artifacts.infrastructure import log_pruned_model
+from app.artifacts.infrastructure import load_training_data, log_pruned_model, resolve_dataset
 from app.prune.core import prune_model
 from utils.logger import get_logger
 
@@ -23,21 +21,21 @@ def prune_workflow(model_name: str | None, dataset_name: str | None) -> Path:
         raise ValueError("Missing model_name or dataset_name")
 
     model_path = MODEL_DIR / f"{model_name}.pkl"
-    dataset_path = DATASET_DIR / f"{dataset_name}.parquet"
+    dataset_path = resolve_dataset(DATASET_DIR, dataset_name)
 
     if not model_path.exists():
         raise ValueError(f"Model '{model_name}' not found")
-    if not dataset_path.exists():
+    if dataset_path is None:
         raise ValueError(f"Dataset '{dataset_name}' not found")
 
-    df = pd.read_parquet(dataset_path)
+    X, y = load_training_data(dataset_path)
     logger.info(
         "Pruning model %s using dataset %s (shape %s)",
         model_name,
         dataset_name,
-        df.shape,
+        X.shape,
     )
-    pruned_path = prune_model(df, model_path)
+    pruned_path = prune_model(X, y, model_path)
     pruned_name = pruned_path.stem
 
     try:
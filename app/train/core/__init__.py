@@ -1,3 +1,19 @@
-from .train import train_model
+from .cross_validation import cross_validate_model
+from .estimators import DEFAULT_ESTIMATOR, ESTIMATORS, EstimatorBackend, estimator_name, estimator_params, fit_estimator
+from .search import search_model
+from .train import TRAINING_VERSION, StreamingValidation, train_model, train_model_incremental
 
-__all__ = ["train_model"]
+__all__ = [
+    "DEFAULT_ESTIMATOR",
+    "ESTIMATORS",
+    "EstimatorBackend",
+    "StreamingValidation",
+    "TRAINING_VERSION",
+    "cross_validate_model",
+    "estimator_name",
+    "estimator_params",
+    "fit_estimator",
+    "search_model",
+    "train_model",
+    "train_model_incremental",
+]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.preprocessing import StandardScaler
+
+DEFAULT_ESTIMATOR = "liblinear"
+# Parameters the backends set themselves, which a fitted model's parameters must not override.
+MANAGED_PARAMS = ("solver", "loss", "warm_start")
+
+
+class EstimatorBackend:
+    """A named way to build and fit a classifier.
+
+    ``factory`` builds an unfitted estimator from hyperparameters. Linear
+    backends other than liblinear are fitted on standardized features with
+    the scaling folded back into their coefficients, so every fitted model
+    takes raw features and works with evaluation and pruning unchanged.
+    ``warm_start`` backends can start from a parent model's coefficients.
+    """
+
+    def __init__(self, factory: Callable[..., Any], scale: bool = False, warm_start: bool = False):
+        self.factory = factory
+        self.scale = scale
+        self.warm_start = warm_start
+
+    def make(self, params: dict[str, Any] | None = None):
+        try:
+            return self.factory(**(params or {}))
+        except TypeError as e:
+            raise ValueError(f"Invalid estimator parameters {params}: {e}") from e
+
+
+ESTIMATORS: dict[str, EstimatorBackend] = {
+    "liblinear": EstimatorBackend(
+        lambda **params: LogisticRegression(**{"max_iter": 500, **params, "solver": "liblinear"})
+    ),
+    "lbfgs": EstimatorBackend(
+        lambda **params: LogisticRegression(**{"max_iter": 500, **params, "solver": "lbfgs"}),
+        scale=True,
+        warm_start=True,
+    ),
+    "saga": EstimatorBackend(
+        lambda **params: LogisticRegression(**{"max_iter": 500, **params, "solver": "saga"}),
+        scale=True,
+        warm_start=True,
+    ),
+    "sgd": EstimatorBackend(
+        lambda **params: SGDClassifier(**{"random_state": 42, **params, "loss": "log_loss"}),
+        scale=True,
+        warm_start=True,
+    ),
+    "hist_gradient_boosting": EstimatorBackend(
+        lambda **params: HistGradientBoostingClassifier(**{"random_state": 42, **params})
+    ),
+}
+
+
+def fold_scaling(model, scaler: StandardScaler):
+    """Rewrite a linear model fitted on ``scaler``-standardized features to take raw features."""
+    model.coef_ = model.coef_ / scaler.scale_
+    model.intercept_ = model.intercept_ - model.coef_ @ scaler.mean_
+    return model
+
+
+def _check_parent(name: str, backend: EstimatorBackend, parent, X: pd.DataFrame) -> None:
+    if not backend.warm_start:
+        warm = sorted(key for key, other in ESTIMATORS.items() if other.warm_start)
+        raise ValueError(f"Estimator '{name}' cannot be warm-started, expected one of {warm}")
+    if not hasattr(parent, "coef_"):
+        raise ValueError(f"Parent {type(parent).__name__} has no coefficients to start from")
+    if list(getattr(parent, "feature_names_in_", [])) != list(X.columns):
+        raise ValueError("Parent model was trained on different features")
+
+
+def fit_estimator(name: str, X: pd.DataFrame, y, params: dict[str, Any] | None = None, parent=None):
+    """Fit backend ``name`` of ``ESTIMATORS`` with ``params`` on ``(X, y)``.
+
+    With a fitted linear ``parent`` on the same features, a warm-start
+    backend starts from the parent's coefficients, mapped into the new
+    standardized space, instead of from zero.
+    """
+    backend = ESTIMATORS.get(name)
+    if backend is None:
+        raise ValueError(f"Unknown estimator '{name}', expected one of {sorted(ESTIMATORS)}")
+    if parent is not None:
+        _check_parent(name, backend, parent, X)
+    model = backend.make(params)
+    if not backend.scale:
+        return model.fit(X, y)
+    scaler = StandardScaler().set_output(transform="pandas").fit(X)
+    X_scaled = scaler.transform(X)
+    if parent is None:
+        model.fit(X_scaled, y)
+    else:
+        # The inverse of fold_scaling: the parent's decision function on standardized features.
+        coef = parent.coef_ * scaler.scale_
+        intercept = parent.intercept_ + parent.coef_ @ scaler.mean_
+        if isinstance(model, SGDClassifier):
+            model.fit(X_scaled, y, coef_init=coef, intercept_init=intercept)
+        else:
+            model.set_params(warm_start=True)
+            model.coef_, model.intercept_ = coef, intercept
+            model.fit(X_scaled, y).set_params(warm_start=False)
+    return fold_scaling(model, scaler)
+
+
+def estimator_name(model) -> str:
+    """The ``ESTIMATORS`` backend a fitted model came from."""
+    if isinstance(model, LogisticRegression) and model.solver in ESTIMATORS:
+        return model.solver
+    if isinstance(model, SGDClassifier):
+        return "sgd"
+    if isinstance(model, HistGradientBoostingClassifier):
+        return "hist_gradient_boosting"
+    raise ValueError(f"No estimator backend for {type(model).__name__}")
+
+
+def estimator_params(model) -> dict[str, Any]:
+    """Hyperparameters to refit a fitted model with ``fit_estimator(estimator_name(model), ...)``."""
+    return {key: value for key, value in model.get_params().items() if key not in MANAGED_PARAMS}
@@ -1,22 +1,28 @@
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
 import joblib
+import numpy as np
 import pandas as pd
-from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import SGDClassifier
 from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
 from utils.logger import get_logger
 
-logger = get_logger(__name__)
+from .estimators import DEFAULT_ESTIMATOR, fit_estimator, fold_scaling
 
+logger = get_logger(__name__)
 
-def train_model(df: pd.DataFrame, output_dir: Path = Path("models")) -> Path:
-    y = df["default"]
-    X = df.drop(columns=["name", "default"])
-    Xtr, Xte, ytr, yte = train_test_split(X, y, test_size=0.2, stratify=y, random_state=42)
+# Bump whenever a change to training alters the model fitted for the same inputs.
+TRAINING_VERSION = 1
+CLASSES = np.array([0, 1])
+# Score bins of the streaming validation AUC.
+AUC_BINS = 1024
 
-    model = LogisticRegression(max_iter=500, solver="liblinear").fit(Xtr, ytr)
 
+def _save_model(model, output_dir: Path) -> Path:
     output_dir.mkdir(exist_ok=True)
     model_name = f"model_{uuid4().hex[:8]}"
     model_path = output_dir / f"{model_name}.pkl"
@@ -24,3 +30,117 @@ def train_model(df: pd.DataFrame, output_dir: Path = Path("models")) -> Path:
 
     logger.info(f"Trained model saved -> {model_path}")
     return model_path
+
+
+def train_model(
+    X: pd.DataFrame,
+    y,
+    output_dir: Path = Path("models"),
+    estimator: str = DEFAULT_ESTIMATOR,
+    params: dict[str, Any] | None = None,
+    parent=None,
+) -> Path:
+    Xtr, Xte, ytr, yte = train_test_split(X, y, test_size=0.2, stratify=y, random_state=42)
+
+    model = fit_estimator(estimator, Xtr, ytr, params, parent)
+    if parent is not None:
+        logger.info("Warm-started %s from parent model in %s iterations", estimator, np.max(model.n_iter_))
+
+    return _save_model(model, output_dir)
+
+
+class StreamingValidation:
+    """Log-loss, accuracy and binned ROC AUC accumulated batch by batch.
+
+    Scores are counted in ``AUC_BINS`` equal-width probability bins per
+    class, so memory does not grow with the validation set; ties within a
+    bin count half, which bounds the AUC error by the bin width.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.loss = 0.0
+        self.correct = 0
+        self.positive = np.zeros(AUC_BINS, dtype=np.int64)
+        self.negative = np.zeros(AUC_BINS, dtype=np.int64)
+
+    def update(self, y: np.ndarray, proba: np.ndarray) -> None:
+        clipped = np.clip(proba, 1e-15, 1 - 1e-15)
+        self.count += len(y)
+        self.loss -= float(np.sum(np.where(y == 1, np.log(clipped), np.log1p(-clipped))))
+        self.correct += int(np.count_nonzero((proba >= 0.5) == (y == 1)))
+        bins = np.minimum((proba * AUC_BINS).astype(np.int64), AUC_BINS - 1)
+        self.positive += np.bincount(bins[y == 1], minlength=AUC_BINS)
+        self.negative += np.bincount(bins[y != 1], minlength=AUC_BINS)
+
+    def auc(self) -> float:
+        positives, negatives = self.positive.sum(), self.negative.sum()
+        if not positives or not negatives:
+            return float("nan")
+        below = np.cumsum(self.negative) - self.negative
+        return float((self.positive * (below + 0.5 * self.negative)).sum() / (positives * negatives))
+
+    def result(self) -> dict[str, float]:
+        return {
+            "rows": self.count,
+            "log_loss": self.loss / self.count if self.count else float("nan"),
+            "accuracy": self.correct / self.count if self.count else float("nan"),
+            "auc": self.auc(),
+        }
+
+
+def _validation_mask(n: int, batch_index: int, fraction: float, seed: int) -> np.ndarray:
+    """The same held-out rows of a batch on every pass."""
+    return np.random.default_rng([seed, batch_index]).random(n) < fraction
+
+
+def train_model_incremental(
+    batches: Callable[[], Iterable[tuple[pd.DataFrame, np.ndarray]]],
+    output_dir: Path = Path("models"),
+    epochs: int = 5,
+    validation_fraction: float = 0.2,
+    tol: float = 1e-4,
+    seed: int = 42,
+) -> Path:
+    """Fit a logistic model with SGD one batch at a time, for datasets larger than memory.
+
+    ``batches`` returns a fresh iterable of ``(X, y)`` batches in the same
+    order on every call; it is called once per pass. A seeded, per-batch
+    fraction of rows is held out for validation. Features are standardized
+    online: the scaler is updated from each training batch during the first
+    pass, just before the model sees it. Training stops after ``epochs``
+    passes, or earlier once the validation log-loss improves by less than
+    ``tol``.
+
+    The scaling is folded into the saved ``SGDClassifier``'s coefficients,
+    so the artifact takes raw features like the in-memory models and works
+    with evaluation and pruning unchanged.
+    """
+    scaler = StandardScaler().set_output(transform="pandas")
+    model = SGDClassifier(loss="log_loss", random_state=seed)
+    best_loss = np.inf
+    for epoch in range(epochs):
+        for i, (X, y) in enumerate(batches()):
+            train = ~_validation_mask(len(y), i, validation_fraction, seed)
+            if not train.any():
+                continue
+            X_train = X[train]
+            if epoch == 0:
+                scaler.partial_fit(X_train)
+            model.partial_fit(scaler.transform(X_train), y[train], classes=CLASSES)
+
+        validation = StreamingValidation()
+        for i, (X, y) in enumerate(batches()):
+            held_out = _validation_mask(len(y), i, validation_fraction, seed)
+            if held_out.any():
+                validation.update(y[held_out], model.predict_proba(scaler.transform(X[held_out]))[:, 1])
+        metrics = validation.result()
+        logger.info(
+            "Epoch %d: validation log-loss %.4f, accuracy %.4f, AUC %.4f on %d rows",
+            epoch + 1, metrics["log_loss"], metrics["accuracy"], metrics["auc"], metrics["rows"],
+        )
+        if best_loss - metrics["log_loss"] < tol:
+            break
+        best_loss = metrics["log_loss"]
+
+    return _save_model(fold_scaling(model, scaler), output_dir)
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, HTTPException
 from celery.result import AsyncResult
 
+from app.artifacts.infrastructure import resolve_dataset
 from app.artifacts.service.tasks import train_model_task
+from app.train.core import DEFAULT_ESTIMATOR
 from app.train.schemas import TrainRequest, TrainResponse, TrainStatusResponse
 from utils.logger import get_logger
 
@@ -18,12 +20,20 @@ def train_endpoint(request: TrainRequest) -> TrainResponse:
     # Validate dataset exists before submitting task
     from pathlib import Path
     
-    dataset_path = Path("storage/datasets") / f"{request.dataset_name}.parquet"
-    if not dataset_path.exists():
+    if resolve_dataset(Path("storage/datasets"), request.dataset_name) is None:
         raise HTTPException(status_code=404, detail=f"Dataset '{request.dataset_name}' not found")
     
-    # Submit async task
-    task = train_model_task.delay(request.dataset_name)
+    # Submit async task, passing only options that differ from the defaults
+    options = {}
+    if request.search is not None:
+        options["search"] = request.search.model_dump()
+    if request.estimator != DEFAULT_ESTIMATOR:
+        options["estimator"] = request.estimator
+    if request.params:
+        options["params"] = request.params
+    if request.parent_model is not None:
+        options["parent_model"] = request.parent_model
+    task = train_model_task.delay(request.dataset_name, **options)
     logger.info("Submitted training task %s for dataset %s", task.id, request.dataset_name)
     
     return TrainResponse(
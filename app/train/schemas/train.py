@@ -1,10 +1,40 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from typing import Any, List, Literal
+
+from pydantic import BaseModel, Field, PositiveFloat, model_validator
+
+Estimator = Literal["liblinear", "lbfgs", "saga", "sgd", "hist_gradient_boosting"]
+WARM_START_ESTIMATORS = ("lbfgs", "saga", "sgd")
+
+
+class SearchSpace(BaseModel):
+    C: List[PositiveFloat] = Field(min_length=1)
+    penalty: List[Literal["l1", "l2"]] = Field(default=["l2"], min_length=1)
+    cv: int = Field(default=3, ge=2)
 
 
 class TrainRequest(BaseModel):
     dataset_name: str
+    estimator: Estimator = "liblinear"
+    params: dict[str, Any] = Field(default_factory=dict)
+    search: SearchSpace | None = None
+    parent_model: str | None = None
+
+    @model_validator(mode="after")
+    def check_search(self) -> TrainRequest:
+        if self.search is not None and (self.estimator != "liblinear" or self.params or self.parent_model):
+            raise ValueError(
+                "search picks its own logistic regression solver and cannot be combined with "
+                "estimator, params or parent_model"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def check_parent_model(self) -> TrainRequest:
+        if self.parent_model is not None and self.estimator not in WARM_START_ESTIMATORS:
+            raise ValueError(f"parent_model needs a warm-start estimator: {', '.join(WARM_START_ESTIMATORS)}")
+        return self
 
 
 class TrainResponse(BaseModel):
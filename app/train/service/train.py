@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+import hashlib
+import json
+from collections.abc import Callable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any
 
-import pandas as pd
+import joblib
+import numpy as np
+import sklearn
 
-from app.artifacts.infrastructure import log_model
-from app.train.core import train_model
+from app.artifacts.infrastructure import (
+    count_model_cache_hit,
+    dataset_fingerprint,
+    dataset_rows,
+    find_model_by_training_key,
+    iter_dataset,
+    load_training_data,
+    log_model,
+    model_columns,
+    resolve_dataset,
+    split_features,
+)
+from app.train.core import (
+    DEFAULT_ESTIMATOR,
+    TRAINING_VERSION,
+    cross_validate_model,
+    search_model,
+    train_model,
+    train_model_incremental,
+)
+from settings import settings
 from utils.logger import get_logger
 
 
@@ -17,24 +42,162 @@ MODEL_DIR = Path("storage/models")
 MODEL_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def training_key(
+    dataset_hash: str,
+    estimator: str,
+    params: dict[str, Any] | None = None,
+    search: dict | None = None,
+    out_of_core_epochs: int | None = None,
+    parent_model: str | None = None,
+) -> str:
+    """Hash every input that determines the model trained on a dataset."""
+    payload = {
+        "training_version": TRAINING_VERSION,
+        "sklearn_version": sklearn.__version__,
+        "dataset": dataset_hash,
+        "estimator": estimator,
+        "params": params or {},
+        "search": search,
+        "out_of_core_epochs": out_of_core_epochs,
+        "parent_model": parent_model,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def _find_cached_model(key: str) -> Path | None:
+    """Path of a model already trained with ``key``, if still on disk; counts and logs the hit."""
+    try:
+        record = find_model_by_training_key(key)
+    except Exception as e:
+        logger.warning("Failed to look up training key in database: %s", e)
+        return None
+    if record is None or not (MODEL_DIR / f"{record.name}.pkl").exists():
+        return None
+    try:
+        hits = count_model_cache_hit(record.name)
+    except Exception as e:
+        logger.warning("Failed to count cache hit for model %s: %s", record.name, e)
+        hits = None
+    logger.info("Training cache hit: reusing model %s for key %s (%s hits)", record.name, key[:12], hits)
+    return MODEL_DIR / f"{record.name}.pkl"
+
+
+def _cross_validate(
+    X,
+    y,
+    dataset_name: str,
+    estimator: str,
+    params: dict[str, Any] | None,
+    parent,
+    progress: Callable[[dict], None] | None,
+) -> dict | None:
+    """``TRAIN_CV_FOLDS``-fold cross-validation of ``estimator``, or None if disabled or too few rows."""
+    folds = settings.train_cv_folds
+    if folds < 2:
+        return None
+    if np.bincount(np.asarray(y), minlength=2).min() < folds:
+        logger.warning("Skipping cross-validation of %s: fewer than %d rows of a class", dataset_name, folds)
+        return None
+    report = None if progress is None else lambda fold: progress({"stage": "cross_validation", **fold})
+    return cross_validate_model(
+        X, y, estimator, params, folds=folds, n_jobs=settings.train_cv_jobs, progress=report, parent=parent
+    )
+
+
 def train_workflow(
     dataset_name: str,
+    estimator: str = DEFAULT_ESTIMATOR,
+    params: dict[str, Any] | None = None,
+    search: dict | None = None,
+    progress: Callable[[dict], None] | None = None,
+    parent_model: str | None = None,
 ) -> Path:
-    """Load training data by name and delegate to the core training routine."""
+    """Load training data by name and fit ``estimator`` (an ``ESTIMATORS`` backend) with ``params``.
 
-    dataset_path = DATASET_DIR / f"{dataset_name}.parquet"
-    if not dataset_path.exists():
-        raise ValueError(f"Dataset '{dataset_name}' not found")
+    Datasets with more than ``TRAIN_OUT_OF_CORE_ROWS`` rows are never loaded
+    whole: they are streamed row group by row group into the incremental
+    trainer, which always fits SGD.
 
-    df = pd.read_parquet(dataset_path)
-    logger.info("Training dataset %s loaded from %s with shape %s", dataset_name, dataset_path, df.shape)
+    With a ``search`` space the dataset is loaded once and the best model of
+    a cross-validated search is kept; every trial is logged with the model.
+    Otherwise the estimator is cross-validated over ``TRAIN_CV_FOLDS``
+    folds before the final fit, and the fold AUCs are logged with it.
+    ``progress`` is called with each finished fold or search job.
+
+    With a ``parent_model``, the estimator (lbfgs, saga or sgd) starts from
+    that model's coefficients, and the new model is logged as its child.
+
+    With ``TRAIN_RESULT_CACHE`` enabled, a model already trained on the same
+    dataset content with the same estimator, parameters, search, parent and
+    training version is returned instead of fitting a new one.
+    """
+
+    dataset_path = resolve_dataset(DATASET_DIR, dataset_name)
+    if dataset_path is None:
+        raise ValueError(f"Dataset '{dataset_name}' not found")
 
-    model_path = train_model(df, output_dir=MODEL_DIR)
+    rows = dataset_rows(dataset_path)
+    summary = cv = key = None
+    if search is not None and rows > settings.train_out_of_core_rows:
+        raise ValueError(
+            f"Dataset '{dataset_name}' has {rows} rows, too many for an in-memory hyperparameter search"
+        )
+    parent = None
+    if parent_model is not None:
+        parent_path = MODEL_DIR / f"{parent_model}.pkl"
+        if not parent_path.exists():
+            raise ValueError(f"Parent model '{parent_model}' not found")
+        if search is not None or rows > settings.train_out_of_core_rows:
+            raise ValueError("Warm starts from a parent model need in-memory training without a search")
+        parent = joblib.load(parent_path)
+    if settings.train_result_cache:
+        out_of_core_epochs = settings.train_out_of_core_epochs if rows > settings.train_out_of_core_rows else None
+        key = training_key(
+            dataset_fingerprint(dataset_path), estimator, params, search, out_of_core_epochs, parent_model
+        )
+        cached = _find_cached_model(key)
+        if cached is not None:
+            return cached
+    if rows > settings.train_out_of_core_rows:
+        if estimator != "sgd":
+            logger.warning("Dataset %s is trained out of core with sgd instead of %s", dataset_name, estimator)
+        estimator, params = "sgd", None
+        logger.info("Training dataset %s (%d rows) out of core from %s", dataset_name, rows, dataset_path)
+        columns = model_columns(dataset_path)
+        model_path = train_model_incremental(
+            lambda: (split_features(df) for df in iter_dataset(dataset_path, columns)),
+            output_dir=MODEL_DIR,
+            epochs=settings.train_out_of_core_epochs,
+        )
+    else:
+        X, y = load_training_data(dataset_path)
+        logger.info("Training dataset %s loaded from %s with shape %s", dataset_name, dataset_path, X.shape)
+        if search is not None:
+            report = None if progress is None else lambda job: progress({"stage": "search", **job})
+            model_path, summary = search_model(
+                X, y, search, output_dir=MODEL_DIR, n_jobs=settings.train_search_jobs, progress=report
+            )
+            estimator, params = summary["estimator"], summary["best_params"]
+        else:
+            cv = _cross_validate(X, y, dataset_name, estimator, params, parent, progress)
+            model_path = train_model(
+                X, y, output_dir=MODEL_DIR, estimator=estimator, params=params, parent=parent
+            )
     model_name = model_path.stem
     timestamp = datetime.now(UTC)
 
     try:
-        log_model(name=model_name, dataset_name=dataset_name, timestamp=timestamp)
+        log_model(
+            name=model_name,
+            dataset_name=dataset_name,
+            timestamp=timestamp,
+            estimator=estimator,
+            params=params,
+            search=summary,
+            cv=cv,
+            training_key=key,
+            parent_name=parent_model,
+        )
     except Exception as e:
         logger.warning("Failed to log model to database: %s", e)
 
@@ -0,0 +1,94 @@
+"""Storage benchmark for the compact dataset schema.
+
+Writes the same seeded borrowers once with the original float64/int64 schema
+(every column stored) and once with the compact schema (float32/int8, macro
+constants in file metadata), then reports Parquet size, read time and the
+AUC of the training routine on each. Run from the project root:
+
+    python -m benchmarks.bench_dataset_dtypes --sizes 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from app.artifacts.infrastructure import read_dataset, split_features, storage_table
+from app.data.core import apply_macro, draw_borrowers
+from app.evaluate.core import evaluate_metrics
+from app.train.core import train_model
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def legacy_frame(draws: dict, macro_data: dict) -> pd.DataFrame:
+    """The float64/int64 frame ``apply_macro`` produced before the compact schema."""
+    n = len(draws["threshold"])
+    risk = draws["utilization"] * (1 + macro_data["delinquency"]/100)
+    return pd.DataFrame({
+        "name": draws["name"],
+        "monthly_income": np.round(draws["monthly_income"], 2),
+        "loan_amount": np.round(draws["loan_amount"], 2),
+        "utilization": np.round(draws["utilization"], 3),
+        "interest_rate": np.full(n, macro_data["interest_rate"], dtype=np.float64),
+        "debt_ratio": np.full(n, macro_data["debt_ratio"], dtype=np.float64),
+        "default": (risk > draws["threshold"]).astype(np.int64),
+    })
+
+
+def _read_seconds(path: Path, reader, repeat: int) -> tuple[float, pd.DataFrame]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = reader(path)
+        best = min(best, time.perf_counter() - start)
+    return best, df
+
+
+def _auc(df: pd.DataFrame, workdir: Path) -> float:
+    X, y = split_features(df)
+    model_path = train_model(X, y, output_dir=workdir / "models")
+    return evaluate_metrics(X, y, model_path)["auc"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N read timing")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'schema':>8} {'MiB':>8} {'read s':>8} {'AUC':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        for n in args.sizes:
+            draws = draw_borrowers(n, seed=0)
+            legacy_path = workdir / f"legacy_{n}.parquet"
+            compact_path = workdir / f"compact_{n}.parquet"
+            legacy_frame(draws, MACRO).to_parquet(legacy_path, index=False)
+            pq.write_table(storage_table(apply_macro(draws, MACRO)), compact_path)
+
+            rows = []
+            for schema, path, reader in (
+                ("legacy", legacy_path, pd.read_parquet),
+                ("compact", compact_path, read_dataset),
+            ):
+                seconds, loaded = _read_seconds(path, reader, args.repeat)
+                rows.append((schema, path.stat().st_size / 2**20, seconds, _auc(loaded, workdir)))
+
+            for schema, mib, seconds, auc in rows:
+                print(f"{n:>10} {schema:>8} {mib:>8.2f} {seconds:>8.3f} {auc:>8.4f}")
+            (_, legacy_mib, legacy_s, _), (_, compact_mib, compact_s, _) = rows
+            print(
+                f"{n:>10} {'ratio':>8} {legacy_mib / compact_mib:>7.2f}x "
+                f"{legacy_s / compact_s:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Memory benchmark for dataset loading: Parquet versus the mapped Arrow IPC sidecar.
+
+Each loader runs in a fresh process that loads ``(X, y)`` and touches every
+feature value, then reports its peak RSS growth and the anonymous (heap)
+memory it holds afterwards. Pages of a memory-mapped sidecar are file-backed
+page cache shared by every worker on the node, so they count towards RSS but
+not towards anonymous memory. Run from the project root:
+
+    python -m benchmarks.bench_dataset_memory --sizes 1000000 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from app.artifacts.infrastructure import read_dataset, read_sidecar, split_features, write_sidecar
+from app.data.service.generate import stream_dataset
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def _load_pandas(path: Path):
+    df = pd.read_parquet(path)
+    return df.drop(columns=["name", "default"]), df["default"]
+
+
+def _load_dataset(path: Path):
+    return split_features(read_dataset(path))
+
+
+def _load_sidecar(path: Path):
+    return read_sidecar(path)
+
+
+LOADERS = {
+    "pd.read_parquet": _load_pandas,
+    "read_dataset": _load_dataset,
+    "mmap sidecar": _load_sidecar,
+}
+
+
+def _proc_mib(path: str, field: str) -> float:
+    with open(path) as proc:
+        for line in proc:
+            if line.startswith(field):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _measure(loader: str, path: Path) -> tuple[float, float]:
+    """Process-pool entry point: (peak RSS growth MiB, anonymous MiB growth)."""
+    # ru_maxrss survives exec, so a spawned child would inherit the parent's
+    # peak; reset the high-water mark instead and read VmHWM.
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")
+    baseline_peak = _proc_mib("/proc/self/status", "VmHWM:")
+    baseline_anon = _proc_mib("/proc/self/smaps_rollup", "Anonymous:")
+    X, y = LOADERS[loader](path)
+    float(np.asarray(X).sum()) + float(np.asarray(y).sum())
+    peak = _proc_mib("/proc/self/status", "VmHWM:")
+    return peak - baseline_peak, _proc_mib("/proc/self/smaps_rollup", "Anonymous:") - baseline_anon
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    args = parser.parse_args()
+
+    import app.data.service.generate as generate_service
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'rows':>10} {'loader':<16} {'peak RSS MiB':>13} {'anon MiB':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        generate_service.DATASET_DIR = Path(tmp)
+        generate_service._log_dataset = lambda *args, **kwargs: None
+        generate_service.find_dataset_by_hash = lambda content_hash: None
+        for n in args.sizes:
+            name, _, _, _ = stream_dataset(MACRO, n, seed=0)
+            path = Path(tmp) / f"{name}.parquet"
+            write_sidecar(path)
+            for loader in LOADERS:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    peak, anon = pool.submit(_measure, loader, path).result()
+                print(f"{n:>10} {loader:<16} {peak:>13.1f} {anon:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
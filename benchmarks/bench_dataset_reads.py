@@ -0,0 +1,74 @@
+"""Read benchmark for column projection and predicate pushdown on dataset reads.
+
+Writes one seeded dataset (10M rows by default) twice: as generated, and
+sorted by ``monthly_income`` so row-group statistics are clustered. Each
+read is timed best-of-N and reports the rows returned and the size of the
+resulting frame. Filters on randomly ordered columns still scan every row
+group; on the clustered copy most row groups are skipped. Run from the
+project root:
+
+    python -m benchmarks.bench_dataset_reads --rows 10000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from app.artifacts.infrastructure import DatasetWriter, model_columns, read_dataset
+from app.data.core import generate_synthetic_data
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+CHUNK_ROWS = 1_000_000
+
+
+def _best(fn, repeat: int) -> tuple[float, pd.DataFrame]:
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N timing")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "dataset.parquet"
+        with DatasetWriter(path) as writer:
+            for start in range(0, args.rows, CHUNK_ROWS):
+                n = min(CHUNK_ROWS, args.rows - start)
+                writer.write(generate_synthetic_data(MACRO, n=n, seed=start))
+        clustered = Path(tmp) / "clustered.parquet"
+        with DatasetWriter(clustered) as writer:
+            writer.write(read_dataset(path).sort_values("monthly_income", ignore_index=True))
+
+        columns = model_columns(path)
+        threshold = float(read_dataset(path, columns=["monthly_income"])["monthly_income"].quantile(0.9))
+        top_decile = [("monthly_income", ">=", threshold)]
+        reads = {
+            "pd.read_parquet": lambda: pd.read_parquet(path),
+            "read_dataset": lambda: read_dataset(path),
+            "model columns": lambda: read_dataset(path, columns=columns),
+            "model columns, top decile": lambda: read_dataset(path, columns=columns, filters=top_decile),
+            "clustered, top decile": lambda: read_dataset(clustered, columns=columns, filters=top_decile),
+        }
+
+        print(f"{'read':<28} {'seconds':>9} {'rows':>11} {'frame MiB':>10}")
+        for label, read in reads.items():
+            seconds, df = _best(read, args.repeat)
+            mib = df.memory_usage(deep=True).sum() / 2**20
+            print(f"{label:<28} {seconds:>9.3f} {len(df):>11} {mib:>10.1f}")
+            del df
+
+
+if __name__ == "__main__":
+    main()
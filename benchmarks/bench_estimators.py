@@ -0,0 +1,60 @@
+"""Estimator backend matrix: fit time, predict throughput, artifact size and AUC.
+
+For each dataset size, every backend in ``ESTIMATORS`` is fitted on 80% of
+one seeded dataset with its default parameters and scored on the other
+20%. Fit time is wall time of ``fit_estimator``; predict throughput is
+holdout rows per second of ``predict_proba``; artifact size is the
+``joblib`` pickle the training task would save. Run from the project root:
+
+    python -m benchmarks.bench_estimators --rows 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+
+import joblib
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
+
+from app.artifacts.infrastructure import split_features
+from app.data.core import generate_synthetic_data
+from app.train.core import ESTIMATORS, fit_estimator
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def _artifact_kib(model) -> float:
+    buffer = io.BytesIO()
+    joblib.dump(model, buffer)
+    return buffer.tell() / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--estimators", nargs="+", choices=sorted(ESTIMATORS), default=list(ESTIMATORS))
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'estimator':<23} {'fit s':>8} {'predict rows/s':>15} {'artifact KiB':>13} {'ROC AUC':>8}")
+    for rows in args.rows:
+        X, y = split_features(generate_synthetic_data(MACRO, n=rows, seed=0))
+        Xtr, Xte, ytr, yte = train_test_split(X, y, test_size=0.2, stratify=y, random_state=42)
+        for name in args.estimators:
+            start = time.perf_counter()
+            model = fit_estimator(name, Xtr, ytr)
+            fit_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            proba = model.predict_proba(Xte)[:, 1]
+            throughput = len(Xte) / (time.perf_counter() - start)
+            auc = roc_auc_score(yte, proba)
+            print(
+                f"{rows:>9} {name:<23} {fit_seconds:>8.2f} {throughput:>15,.0f} "
+                f"{_artifact_kib(model):>13.1f} {auc:>8.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Evaluation metrics benchmark: one sorted pass against separate scikit-learn calls.
+
+Scores a seeded dataset (1M rows by default) with a trained default model,
+then times the metrics computed by separate ``sklearn.metrics`` calls (one
+sort each) against ``score_metrics``, which sorts once, and the bootstrap
+confidence intervals for each ``--jobs`` value. Run from the project root:
+
+    python -m benchmarks.bench_evaluate_metrics --rows 1000000 --bootstrap 200 --jobs 1 2 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+from sklearn.metrics import brier_score_loss, log_loss, roc_auc_score, roc_curve
+
+from app.artifacts.infrastructure import split_features
+from app.data.core import generate_synthetic_data
+from app.evaluate.core import score_metrics
+from app.train.core import train_model
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def _separate(y: np.ndarray, scores: np.ndarray) -> dict[str, float]:
+    fpr, tpr, _ = roc_curve(y, scores)
+    auc = roc_auc_score(y, scores)
+    top = np.argsort(-scores, kind="stable")
+    return {
+        "auc": auc,
+        "gini": 2 * auc - 1,
+        "ks": float(np.max(tpr - fpr)),
+        "brier": brier_score_loss(y, scores),
+        "log_loss": log_loss(y, scores),
+        **{f"precision_at_{c:g}": float(y[top[: int(c * len(y))]].mean()) for c in (0.05, 0.1, 0.2)},
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--bootstrap", type=int, default=200)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    X, y = split_features(generate_synthetic_data(MACRO, n=args.rows, seed=0))
+    with tempfile.TemporaryDirectory() as tmp:
+        model = joblib.load(train_model(X, y, output_dir=Path(tmp)))
+    scores = model.predict_proba(X)[:, 1]
+    target = np.asarray(y)
+    print(f"{os.cpu_count()} CPUs, {args.rows} rows")
+
+    start = time.perf_counter()
+    separate = _separate(target, scores)
+    separate_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    single = score_metrics(target, scores)
+    single_seconds = time.perf_counter() - start
+    print(f"{'pass':>10} {'seconds':>9} {'ROC AUC':>8} {'KS':>7}")
+    print(f"{'separate':>10} {separate_seconds:>9.2f} {separate['auc']:>8.4f} {separate['ks']:>7.4f}")
+    print(f"{'single':>10} {single_seconds:>9.2f} {single['auc']:>8.4f} {single['ks']:>7.4f}")
+
+    print(f"\n{args.bootstrap} bootstrap replicates")
+    print(f"{'n_jobs':>6} {'seconds':>9} {'AUC interval':>18}")
+    for jobs in args.jobs:
+        start = time.perf_counter()
+        low, high = score_metrics(target, scores, bootstrap=args.bootstrap, n_jobs=jobs)["intervals"]["auc"]
+        print(f"{jobs:>6} {time.perf_counter() - start:>9.2f} {f'[{low:.4f}, {high:.4f}]':>18}")
+
+
+if __name__ == "__main__":
+    main()
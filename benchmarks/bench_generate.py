@@ -0,0 +1,85 @@
+"""Throughput benchmark for synthetic borrower generation.
+
+Compares the columnar ``generate_synthetic_data`` against the original
+row-by-row loop it replaced, reporting rows/s and the resulting Parquet
+size. Run from the project root:
+
+    python -m benchmarks.bench_generate --sizes 10000 100000 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import time
+
+import numpy as np
+import pandas as pd
+from faker import Faker
+
+from app.data.core import generate_synthetic_data
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def legacy_generate_synthetic_data(macro_data: dict, n=1000) -> pd.DataFrame:
+    """Per-row reference implementation kept for comparison only."""
+    fake = Faker()
+    rows = []
+    for _ in range(n):
+        inc = np.random.normal(4000, 1500)
+        loan = np.random.normal(10000, 5000)
+        util = loan / (inc + 1)
+        risk = util * (1 + macro_data["delinquency"]/100)
+        default = int(risk > np.random.uniform(1, 3))
+        rows.append({
+            "name": fake.name(),
+            "monthly_income": round(inc, 2),
+            "loan_amount": round(loan, 2),
+            "utilization": round(util, 3),
+            "interest_rate": macro_data["interest_rate"],
+            "debt_ratio": macro_data["debt_ratio"],
+            "default": default
+        })
+    return pd.DataFrame(rows)
+
+
+def _measure(fn, n: int) -> tuple[float, float]:
+    """Return (rows per second, Parquet size in MiB) for one generation run."""
+    start = time.perf_counter()
+    df = fn(MACRO, n=n)
+    rate = n / (time.perf_counter() - start)
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    return rate, buffer.tell() / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=100_000,
+        help="skip the legacy loop above this many rows",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'rows':>10} {'legacy rows/s':>15} {'columnar rows/s':>17} {'speedup':>8} "
+        f"{'legacy MiB':>11} {'columnar MiB':>13}"
+    )
+    for n in args.sizes:
+        columnar, columnar_mib = _measure(generate_synthetic_data, n)
+        if n <= args.legacy_max:
+            legacy, legacy_mib = _measure(legacy_generate_synthetic_data, n)
+            print(
+                f"{n:>10} {legacy:>15,.0f} {columnar:>17,.0f} {columnar / legacy:>7.1f}x "
+                f"{legacy_mib:>11.2f} {columnar_mib:>13.2f}"
+            )
+        else:
+            print(f"{n:>10} {'-':>15} {columnar:>17,.0f} {'-':>8} {'-':>11} {columnar_mib:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
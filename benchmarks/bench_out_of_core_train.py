@@ -0,0 +1,101 @@
+"""Memory benchmark for training: in-memory liblinear versus out-of-core SGD.
+
+Each mode trains in a fresh process on the same seeded dataset and reports
+wall time, peak RSS growth during training and ROC AUC on a separate
+500k-row holdout. Run from the project root:
+
+    python -m benchmarks.bench_out_of_core_train --sizes 1000000 5000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import joblib
+from sklearn.metrics import roc_auc_score
+
+from app.artifacts.infrastructure import (
+    DatasetWriter,
+    iter_dataset,
+    load_training_data,
+    model_columns,
+    read_dataset,
+    split_features,
+)
+from app.data.core import generate_synthetic_data
+from app.train.core import train_model, train_model_incremental
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+CHUNK_ROWS = 1_000_000
+HOLDOUT_ROWS = 500_000
+
+
+def _write(path: Path, rows: int, seed: int) -> None:
+    with DatasetWriter(path) as writer:
+        for start in range(0, rows, CHUNK_ROWS):
+            writer.write(generate_synthetic_data(MACRO, n=min(CHUNK_ROWS, rows - start), seed=[seed, start]))
+
+
+def _peak_mib() -> float:
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _in_memory(path: Path, output_dir: Path) -> Path:
+    X, y = load_training_data(path)
+    return train_model(X, y, output_dir)
+
+
+def _out_of_core(path: Path, output_dir: Path) -> Path:
+    columns = model_columns(path)
+    return train_model_incremental(lambda: (split_features(df) for df in iter_dataset(path, columns)), output_dir)
+
+
+MODES = {"in-memory liblinear": _in_memory, "out-of-core SGD": _out_of_core}
+
+
+def _measure(mode: str, path: Path, holdout: Path) -> tuple[float, float, float]:
+    """Process-pool entry point: (seconds, peak RSS growth MiB, holdout AUC)."""
+    # ru_maxrss survives exec, so reset the high-water mark and read VmHWM.
+    with open("/proc/self/clear_refs", "w") as clear_refs:
+        clear_refs.write("5")
+    baseline = _peak_mib()
+    start = time.perf_counter()
+    model_path = MODES[mode](path, path.parent / "models")
+    seconds = time.perf_counter() - start
+    peak = _peak_mib() - baseline
+
+    X, y = split_features(read_dataset(holdout, columns=model_columns(holdout)))
+    auc = roc_auc_score(y, joblib.load(model_path).predict_proba(X)[:, 1])
+    return seconds, peak, auc
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    print(f"{'rows':>10} {'mode':<20} {'seconds':>9} {'peak RSS MiB':>13} {'AUC':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        holdout = Path(tmp) / "holdout.parquet"
+        _write(holdout, HOLDOUT_ROWS, seed=1)
+        for n in args.sizes:
+            path = Path(tmp) / f"dataset_{n}.parquet"
+            _write(path, n, seed=0)
+            for mode in MODES:
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    seconds, peak, auc = pool.submit(_measure, mode, path, holdout).result()
+                print(f"{n:>10} {mode:<20} {seconds:>9.2f} {peak:>13.1f} {auc:>7.4f}")
+
+
+if __name__ == "__main__":
+    main()
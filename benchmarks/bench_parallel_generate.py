@@ -0,0 +1,67 @@
+"""Scaling benchmark for sharded parallel dataset generation.
+
+Generates the same dataset with a fixed shard count and 1, 2, 4 and 8
+workers, reporting wall time, rows/s and speedup, and checks that every run
+produced a bit-identical file. Run from the project root:
+
+    python -m benchmarks.bench_parallel_generate --rows 2000000 --shards 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from app.data.service import generate as generate_service
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--shards", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    # Measure generation only: no database writes or content-hash lookups.
+    generate_service._log_dataset = lambda *args, **kwargs: None
+    generate_service.find_dataset_by_hash = lambda content_hash: None
+
+    print(f"{'workers':>8} {'seconds':>9} {'rows/s':>12} {'speedup':>8}  sha256")
+    baseline = None
+    digests = set()
+    with TemporaryDirectory() as tmp:
+        generate_service.DATASET_DIR = Path(tmp)
+        for workers in args.workers:
+            start = time.perf_counter()
+            name, rows, _, _ = generate_service.stream_dataset(
+                MACRO,
+                args.rows,
+                chunk_size=args.chunk_size,
+                seed=args.seed,
+                shards=args.shards,
+                workers=workers,
+            )
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+
+            path = Path(tmp) / f"{name}.parquet"
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            digests.add(digest)
+            path.unlink()
+            print(
+                f"{workers:>8} {elapsed:>9.2f} {rows / elapsed:>12,.0f} "
+                f"{baseline / elapsed:>7.2f}x  {digest[:12]}"
+            )
+
+    print("output identical across worker counts:", len(digests) == 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Write/read benchmark for dataset Parquet writer configurations.
+
+Writes the same seeded borrowers with each ``ParquetWriteOptions``
+configuration and reports write throughput, read throughput (through
+``read_dataset``) and file size. Run from the project root:
+
+    python -m benchmarks.bench_parquet_writer --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from app.artifacts.infrastructure import ParquetWriteOptions, read_dataset, write_dataset
+from app.data.core import generate_synthetic_data
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+CONFIGS = {
+    "pyarrow snappy": dict(compression="snappy", byte_stream_split=False),
+    "pyarrow lz4": dict(compression="lz4", byte_stream_split=False),
+    "pyarrow zstd": dict(compression="zstd", byte_stream_split=False),
+    "pyarrow zstd+bss": dict(compression="zstd"),
+    "pyarrow zstd9+bss": dict(compression="zstd", compression_level=9),
+    "pyarrow zstd+bss rg=20k": dict(compression="zstd", row_group_rows=20_000),
+    "pyarrow zstd+bss no stats": dict(compression="zstd", statistics=False),
+    "pyarrow none": dict(compression="none", byte_stream_split=False),
+    "fastparquet snappy": dict(engine="fastparquet", compression="snappy"),
+    "fastparquet zstd": dict(engine="fastparquet", compression="zstd"),
+}
+
+
+def _best(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3, help="best-of-N timing")
+    parser.add_argument("--configs", nargs="+", choices=sorted(CONFIGS), default=list(CONFIGS))
+    args = parser.parse_args()
+
+    df = generate_synthetic_data(MACRO, n=args.rows, seed=0)
+
+    print(f"{'config':<28} {'write rows/s':>14} {'read rows/s':>14} {'MiB':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for label in args.configs:
+            options = ParquetWriteOptions(**CONFIGS[label])
+            path = Path(tmp) / f"{label.replace(' ', '_')}.parquet"
+
+            def write():
+                path.unlink(missing_ok=True)
+                write_dataset(df, path, options)
+
+            write_s = _best(write, args.repeat)
+            read_s = _best(lambda: read_dataset(path), args.repeat)
+            print(
+                f"{label:<28} {args.rows / write_s:>14,.0f} {args.rows / read_s:>14,.0f} "
+                f"{path.stat().st_size / 2**20:>8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
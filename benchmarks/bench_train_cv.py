@@ -0,0 +1,41 @@
+"""Cross-validation benchmark: fold-level parallelism in the training task.
+
+Cross-validates the default model on one seeded dataset (1M rows by
+default) for each ``--jobs`` value and reports wall time, the summed fold
+fit time and the mean fold ROC AUC. With enough cores, wall time drops
+towards the slowest fold as ``n_jobs`` approaches the number of folds.
+Run from the project root:
+
+    python -m benchmarks.bench_train_cv --rows 1000000 --folds 5 --jobs 1 2 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+from app.artifacts.infrastructure import split_features
+from app.data.core import generate_synthetic_data
+from app.train.core import cross_validate_model
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 5])
+    args = parser.parse_args()
+
+    X, y = split_features(generate_synthetic_data(MACRO, n=args.rows, seed=0))
+    print(f"{os.cpu_count()} CPUs, {args.rows} rows, {args.folds} folds")
+    print(f"{'n_jobs':>6} {'seconds':>9} {'fold seconds':>13} {'ROC AUC':>8}")
+    for jobs in args.jobs:
+        cv = cross_validate_model(X, y, folds=args.folds, n_jobs=jobs)
+        fold_seconds = sum(result["fit_time"] for result in cv["fold_results"])
+        print(f"{jobs:>6} {cv['elapsed']:>9.2f} {fold_seconds:>13.2f} {cv['mean_auc']:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
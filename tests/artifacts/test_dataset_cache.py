@@ -0,0 +1,78 @@
+import os
+
+import pandas as pd
+
+from app.artifacts.infrastructure import DatasetCache, write_dataset
+
+
+def _write(path, n, default=0):
+    df = pd.DataFrame({
+        "name": ["A"] * n,
+        "monthly_income": [1000.0] * n,
+        "interest_rate": [4.0] * n,
+        "default": [default] * n,
+    })
+    write_dataset(df, path)
+
+
+def test_dataset_cache_returns_features_and_counts_hits(tmp_path):
+    path = tmp_path / "dataset_a.parquet"
+    _write(path, 10)
+    cache = DatasetCache(max_bytes=1 << 20)
+
+    X, y = cache.get(path)
+    X_again, y_again = cache.get(path)
+
+    assert list(X.columns) == ["monthly_income", "interest_rate"]
+    assert y.tolist() == [0] * 10
+    assert X_again is X and y_again is y
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 0.5
+    assert stats["bytes"] > 0
+
+
+def test_dataset_cache_reloads_rewritten_dataset(tmp_path):
+    path = tmp_path / "dataset_a.parquet"
+    _write(path, 10)
+    cache = DatasetCache(max_bytes=1 << 20)
+    cache.get(path)
+
+    _write(path, 20, default=1)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    X, y = cache.get(path)
+
+    assert len(X) == 20 and y.tolist() == [1] * 20
+    assert cache.stats()["entries"] == 1
+
+
+def test_dataset_cache_evicts_least_recently_used_within_budget(tmp_path):
+    paths = [tmp_path / f"dataset_{i}.parquet" for i in range(3)]
+    for path in paths:
+        _write(path, 1000)
+    entry_bytes = DatasetCache(max_bytes=1 << 30)
+    entry_bytes.get(paths[0])
+    cache = DatasetCache(max_bytes=2 * entry_bytes.stats()["bytes"])
+
+    cache.get(paths[0])
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])
+
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["evictions"] == 1
+    assert stats["bytes"] <= cache.max_bytes
+    cache.get(paths[0])
+    assert cache.stats()["hits"] == 2
+
+
+def test_dataset_cache_skips_datasets_larger_than_budget(tmp_path):
+    path = tmp_path / "dataset_a.parquet"
+    _write(path, 1000)
+    cache = DatasetCache(max_bytes=1)
+
+    X, _ = cache.get(path)
+
+    assert len(X) == 1000
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
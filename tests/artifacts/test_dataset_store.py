@@ -0,0 +1,79 @@
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from app.artifacts.infrastructure import (
+    ParquetWriteOptions,
+    model_columns,
+    read_dataset,
+    read_dataset_table,
+    write_dataset,
+    write_manifest,
+)
+
+
+def _frame(n, start=0):
+    return pd.DataFrame({
+        "name": pd.Categorical([f"borrower_{i % 7}" for i in range(start, start + n)]),
+        "monthly_income": [float(i) for i in range(start, start + n)],
+        "interest_rate": [4.5] * n,
+        "default": [i % 2 for i in range(start, start + n)],
+    })
+
+
+def _spy_row_groups(monkeypatch):
+    calls = []
+    read_row_groups = pq.ParquetFile.read_row_groups
+
+    def spy(self, row_groups, *args, **kwargs):
+        calls.append(list(row_groups))
+        return read_row_groups(self, row_groups, *args, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+    return calls
+
+
+def test_read_dataset_projects_model_columns(tmp_path):
+    path = tmp_path / "dataset_a.parquet"
+    write_dataset(_frame(30), path)
+
+    columns = model_columns(path)
+    df = read_dataset(path, columns=columns)
+
+    assert columns == ["monthly_income", "interest_rate", "default"]
+    assert read_dataset_table(path, columns=columns).column_names == ["monthly_income", "default"]
+    assert df.equals(read_dataset(path).drop(columns=["name"]))
+
+
+def test_read_dataset_skips_row_groups_ruled_out_by_statistics(monkeypatch, tmp_path):
+    path = tmp_path / "dataset_a.parquet"
+    write_dataset(_frame(100), path, ParquetWriteOptions(row_group_rows=10))
+    calls = _spy_row_groups(monkeypatch)
+
+    df = read_dataset(path, columns=["monthly_income", "default"], filters=[("monthly_income", ">=", 85.0)])
+
+    assert calls == [[8, 9]]
+    assert df["monthly_income"].tolist() == [float(i) for i in range(85, 100)]
+    assert list(df.columns) == ["monthly_income", "default"]
+
+    assert len(read_dataset(path, filters=[("interest_rate", "==", 4.5), ("default", "==", 1)])) == 50
+    empty = read_dataset(path, columns=["interest_rate", "default"], filters=[("interest_rate", "!=", 4.5)])
+    assert calls[-1] == [] and empty.empty and list(empty.columns) == ["interest_rate", "default"]
+    with pytest.raises(ValueError, match="Unknown filter column"):
+        read_dataset(path, filters=[("missing", "==", 1)])
+
+
+def test_read_dataset_skips_parts_ruled_out_by_manifest(monkeypatch, tmp_path):
+    directory = tmp_path / "dataset_parts"
+    directory.mkdir()
+    for i in range(3):
+        write_dataset(_frame(10, start=10 * i), directory / f"part-{i:05d}.parquet")
+    write_manifest(directory)
+    calls = _spy_row_groups(monkeypatch)
+
+    df = read_dataset(directory, filters=[("monthly_income", "<", 12.0)])
+    assert len(calls) == 2
+    assert df["monthly_income"].tolist() == [float(i) for i in range(12)]
+
+    none = read_dataset(directory, filters=[("monthly_income", ">", 100.0)])
+    assert none.empty and list(none.columns) == list(_frame(1).columns)
@@ -0,0 +1,64 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from app.artifacts.infrastructure import (
+    DatasetCache,
+    read_dataset,
+    read_sidecar,
+    sidecar_path,
+    split_features,
+    write_dataset,
+    write_sidecar,
+)
+from app.data.core import generate_synthetic_data
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def _dataset(tmp_path, n=500):
+    path = tmp_path / "dataset_a.parquet"
+    write_dataset(generate_synthetic_data(MACRO, n=n, seed=1), path)
+    return path
+
+
+def test_read_sidecar_returns_zero_copy_views(tmp_path):
+    path = _dataset(tmp_path)
+    assert write_sidecar(path) == sidecar_path(path) == tmp_path / "dataset_a.arrow"
+
+    X, y = read_sidecar(path)
+    expected_X, expected_y = split_features(read_dataset(path))
+
+    assert X.equals(expected_X)
+    assert np.array_equal(y, expected_y)
+    values = X.to_numpy()
+    assert not values.flags.owndata and not values.flags.writeable
+    assert values.flags.c_contiguous
+    assert not y.flags.writeable
+
+
+def test_read_sidecar_ignores_sidecar_of_rewritten_dataset(tmp_path):
+    path = _dataset(tmp_path)
+    write_sidecar(path)
+
+    write_dataset(generate_synthetic_data(MACRO, n=20, seed=2), path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert read_sidecar(path) is None
+    assert read_sidecar(tmp_path / "missing.parquet") is None
+
+
+def test_dataset_cache_prefers_mapped_sidecar(tmp_path):
+    path = _dataset(tmp_path)
+    write_sidecar(path)
+    cache = DatasetCache(max_bytes=1 << 20)
+
+    X, _ = cache.get(path)
+
+    stats = cache.stats()
+    assert not X.to_numpy().flags.owndata
+    assert stats["bytes"] == 0
+    assert stats["mapped_bytes"] == X.to_numpy().nbytes + 500
+    assert isinstance(X, pd.DataFrame) and "name" not in X.columns
@@ -0,0 +1,34 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app.artifacts.models import init_db, upgrade_db
+from app.artifacts.models import artifacts as artifacts_module
+
+# The tables as first created, before any of the added columns.
+BASELINE_SCHEMA = [
+    "CREATE TABLE datasets (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL UNIQUE, rows INTEGER NOT NULL, "
+    "macro JSON NOT NULL, created_at DATETIME NOT NULL)",
+    "CREATE TABLE models (id INTEGER PRIMARY KEY, name VARCHAR NOT NULL UNIQUE, "
+    "dataset_id INTEGER NOT NULL REFERENCES datasets(id), created_at DATETIME NOT NULL)",
+    "CREATE TABLE evaluations (id INTEGER PRIMARY KEY, model_id INTEGER NOT NULL REFERENCES models(id), "
+    "dataset_id INTEGER NOT NULL REFERENCES datasets(id), auc FLOAT NOT NULL, created_at DATETIME NOT NULL)",
+    "INSERT INTO datasets VALUES (1, 'dataset_old', 10, '{}', '2024-01-01')",
+    "INSERT INTO models VALUES (1, 'model_old', 1, '2024-01-01')",
+]
+
+
+def test_init_db_upgrades_existing_tables(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'artifacts.db'}")
+    with engine.begin() as conn:
+        for statement in BASELINE_SCHEMA:
+            conn.execute(text(statement))
+    monkeypatch.setattr(artifacts_module, "get_engine", lambda: engine)
+
+    init_db()
+
+    inspector = inspect(engine)
+    for table, column, _ in artifacts_module.COLUMN_UPGRADES:
+        assert column in {existing["name"] for existing in inspector.get_columns(table)}
+    assert "ix_models_training_key" in {index["name"] for index in inspector.get_indexes("models")}
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT cache_hits FROM models")).scalar_one() == 0
+    assert upgrade_db(engine) == []
@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+from app.data.core import DatasetSummary, summarize
+from app.data.core.stats import SKETCH_RELATIVE_ACCURACY
+
+
+def _frame(n, seed):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "name": pd.Categorical(["A"] * n),
+        "monthly_income": rng.normal(4000, 1500, n).astype(np.float32),
+        "utilization": rng.normal(1, 3, n),
+        "default": (rng.uniform(size=n) < 0.3).astype(np.int8),
+    })
+
+
+def test_merged_chunk_summaries_match_whole_frame():
+    df = pd.concat([_frame(1000, 1), _frame(10, 2), _frame(2500, 3)], ignore_index=True)
+    merged = DatasetSummary()
+    for start, stop in [(0, 1000), (1000, 1010), (1010, len(df))]:
+        merged.merge(summarize(df.iloc[start:stop]))
+
+    whole = summarize(df).to_dict()
+    stats = merged.to_dict()
+
+    assert stats["rows"] == whole["rows"] == len(df)
+    assert stats["columns"]["utilization"]["quantiles"] == whole["columns"]["utilization"]["quantiles"]
+    assert stats["columns"]["utilization"]["histogram"] == whole["columns"]["utilization"]["histogram"]
+    assert np.isclose(stats["columns"]["utilization"]["std"], df["utilization"].std())
+    assert np.isclose(stats["default_rate"], df["default"].mean())
+    assert set(stats["columns"]) == {"monthly_income", "utilization", "default"}
+
+
+def test_quantiles_are_within_sketch_accuracy():
+    values = _frame(20_000, 4)["utilization"].to_numpy()
+    stats = summarize(pd.DataFrame({"utilization": values})).to_dict()["columns"]["utilization"]
+
+    for key, q in [("p05", 0.05), ("p50", 0.5), ("p95", 0.95)]:
+        lower, upper = np.quantile(values, [q - 0.001, q + 0.001])
+        estimate = stats["quantiles"][key]
+        assert lower - SKETCH_RELATIVE_ACCURACY * abs(lower) <= estimate <= upper + SKETCH_RELATIVE_ACCURACY * abs(upper)
+    assert sum(stats["histogram"]["counts"]) == len(values)
+    assert stats["histogram"]["edges"][0] == values.min() and stats["histogram"]["edges"][-1] == values.max()
+
+
+def test_constant_and_empty_columns():
+    stats = summarize(pd.DataFrame({"interest_rate": np.full(5, 4.5, dtype=np.float32), "x": [np.nan] * 5})).to_dict()
+
+    assert stats["columns"]["interest_rate"]["quantiles"]["p50"] == 4.5
+    assert stats["columns"]["interest_rate"]["histogram"] == {"edges": [4.5, 4.5], "counts": [5]}
+    assert "x" not in stats["columns"]
+    assert stats["default_rate"] is None
@@ -0,0 +1,121 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.data.core import FredClient
+from app.data.core import fetch as fetch_module
+from utils.cache import FileCacheBackend
+
+
+OBSERVATIONS = {
+    "TDSP": [("2024-10-01", "11.3"), ("2025-01-01", "11.5")],
+    "DRCCLACBS": [("2024-10-01", "3.1"), ("2025-01-01", ".")],
+    "FEDFUNDS": [("2025-01-01", "4.33"), ("2025-02-01", "4.33")],
+}
+
+
+class FakeFredHandler(BaseHTTPRequestHandler):
+    """Mimics GET /series/observations of the FRED API."""
+
+    delays: dict = {}
+    requests: list = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        self.requests.append(params)
+        series_id = params.get("series_id")
+        time.sleep(self.delays.get(series_id, 0.0))
+
+        if url.path != "/series/observations" or series_id not in OBSERVATIONS:
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        observations = [{"date": d, "value": v} for d, v in OBSERVATIONS[series_id]]
+        if params.get("sort_order") == "desc":
+            observations.reverse()
+        observations = observations[: int(params.get("limit", len(observations)))]
+        body = json.dumps({"observations": observations}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def fred_server():
+    FakeFredHandler.delays = {}
+    FakeFredHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeFredHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", FakeFredHandler
+    server.shutdown()
+    server.server_close()
+
+
+def test_get_latest_skips_missing_observations(fred_server):
+    base_url, _ = fred_server
+    client = FredClient(api_key="key", base_url=base_url)
+    try:
+        assert client.get_latest("TDSP") == 11.5
+        assert client.get_latest("DRCCLACBS") == 3.1
+    finally:
+        client.close()
+
+
+def test_get_latest_many_fetches_concurrently(fred_server):
+    base_url, handler = fred_server
+    handler.delays = {sid: 0.3 for sid in OBSERVATIONS}
+    client = FredClient(api_key="key", base_url=base_url)
+    try:
+        start = time.perf_counter()
+        results = client.get_latest_many(list(OBSERVATIONS))
+        elapsed = time.perf_counter() - start
+    finally:
+        client.close()
+
+    assert results == {"TDSP": 11.5, "DRCCLACBS": 3.1, "FEDFUNDS": 4.33}
+    assert elapsed < 0.8
+    assert all(params["api_key"] == "key" for params in handler.requests)
+
+
+def test_get_macro_data_falls_back_to_cache_on_timeout(fred_server, monkeypatch, tmp_path):
+    base_url, handler = fred_server
+    handler.delays = {"FEDFUNDS": 1.0}
+    client = FredClient(api_key="key", base_url=base_url, timeout=0.2)
+    backend = FileCacheBackend(tmp_path)
+    monkeypatch.setattr(fetch_module, "get_macro_cache_backend", lambda: backend)
+    monkeypatch.setattr(fetch_module, "_memory_cache", fetch_module.TTLCache())
+    monkeypatch.setattr(fetch_module, "get_fred_client", lambda: client)
+    backend.save("FEDFUNDS", {"FEDFUNDS": 5.0})
+    try:
+        macro = fetch_module.get_macro_data(use_cache=False)
+    finally:
+        client.close()
+
+    assert macro == {"debt_ratio": 11.5, "delinquency": 3.1, "interest_rate": 5.0}
+    assert backend.load("TDSP")["TDSP"] == 11.5
+
+
+def test_breaker_stops_calling_failing_fred(fred_server):
+    base_url, handler = fred_server
+    client = FredClient(api_key="key", base_url=base_url, failure_threshold=2, reset_timeout=60)
+    try:
+        results = [client.get_latest_many(["UNKNOWN"])["UNKNOWN"] for _ in range(4)]
+    finally:
+        client.close()
+
+    assert len(handler.requests) == 2
+    assert all(isinstance(r, Exception) for r in results)
+    assert client.stats()["breaker_state"] == "open"
+    assert client.stats()["rejected_calls"] == 2
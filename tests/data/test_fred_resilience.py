@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+from app.data.core import CircuitBreaker, CircuitOpenError, SingleFlight
+
+
+def test_single_flight_coalesces_concurrent_callers():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow_fetch():
+        calls.append(1)
+        release.wait(timeout=2)
+        return 4.33
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(flight.do("FEDFUNDS", slow_fetch)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for _ in range(200):
+        if flight.coalesced == 4:
+            break
+        time.sleep(0.005)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == [4.33] * 5
+    assert flight.coalesced == 4
+
+
+def test_circuit_breaker_opens_and_recovers_after_probe():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    calls = []
+
+    def failing():
+        calls.append(1)
+        raise ConnectionError("FRED down")
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            breaker.call(failing)
+    assert breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.call(failing)
+    assert len(calls) == 2
+    assert breaker.rejected == 1
+
+    time.sleep(0.06)
+    assert breaker.call(lambda: 1.0) == 1.0
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+
+
+def test_circuit_breaker_reopens_when_probe_fails():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05)
+    with pytest.raises(ConnectionError):
+        breaker.call(lambda: (_ for _ in ()).throw(ConnectionError()))
+
+    time.sleep(0.06)
+    with pytest.raises(ConnectionError):
+        breaker.call(lambda: (_ for _ in ()).throw(ConnectionError()))
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.call(lambda: 1.0)
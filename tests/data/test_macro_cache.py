@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from app.data.core import fetch as fetch_module
+from utils.cache import FileCacheBackend, TTLCache
+
+
+class FakeFredClient:
+    def __init__(self, values):
+        self.values = values
+        self.calls = []
+        self.refreshed = threading.Event()
+
+    def get_latest(self, series_id):
+        self.calls.append(series_id)
+        self.refreshed.set()
+        return self.values[series_id]
+
+    def get_latest_many(self, series_ids):
+        self.calls.extend(series_ids)
+        return {sid: self.values[sid] for sid in series_ids}
+
+
+@pytest.fixture
+def fred(monkeypatch, tmp_path):
+    client = FakeFredClient({"TDSP": 11.5, "DRCCLACBS": 3.1, "FEDFUNDS": 4.33})
+    backend = FileCacheBackend(tmp_path)
+    monkeypatch.setattr(fetch_module, "get_macro_cache_backend", lambda: backend)
+    monkeypatch.setattr(fetch_module, "_memory_cache", TTLCache())
+    monkeypatch.setattr(fetch_module, "_stats", fetch_module.Counter())
+    monkeypatch.setattr(fetch_module, "get_fred_client", lambda: client)
+    return client
+
+
+def test_fresh_cache_does_not_touch_network(fred):
+    first = fetch_module.get_macro_data()
+    second = fetch_module.get_macro_data(["interest_rate"])
+
+    assert first == {"debt_ratio": 11.5, "delinquency": 3.1, "interest_rate": 4.33}
+    assert second == {"interest_rate": 4.33}
+    assert len(fred.calls) == 3
+    stats = fetch_module.macro_cache_stats()
+    assert stats["misses"] == 3
+    assert stats["hits"] == 1
+
+
+def test_shared_cache_is_promoted_without_fetching(fred):
+    fetch_module.get_macro_cache_backend().save("FEDFUNDS", {"FEDFUNDS": 5.0, "fetched_at": time.time()})
+
+    assert fetch_module.get_macro_data(["interest_rate"]) == {"interest_rate": 5.0}
+    assert fred.calls == []
+
+
+def test_stale_entry_is_served_while_refreshing(fred, monkeypatch):
+    monkeypatch.setattr(fetch_module.settings, "macro_cache_ttl", 60.0)
+    fetch_module._memory_cache.set("FEDFUNDS", 4.0, fetched_at=time.time() - 120)
+
+    assert fetch_module.get_macro_data(["interest_rate"]) == {"interest_rate": 4.0}
+    assert fred.refreshed.wait(timeout=2)
+    for _ in range(100):
+        if fetch_module.macro_cache_stats()["refreshes"]:
+            break
+        time.sleep(0.01)
+
+    assert fetch_module.get_macro_data(["interest_rate"]) == {"interest_rate": 4.33}
+    assert fred.calls == ["FEDFUNDS"]
+    assert fetch_module.macro_cache_stats()["stale_hits"] == 1
+
+
+def test_use_cache_false_always_fetches(fred):
+    fetch_module.get_macro_data()
+    fetch_module.get_macro_data(use_cache=False)
+
+    assert len(fred.calls) == 6
@@ -0,0 +1,100 @@
+import threading
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from app.data.core import SeriesStore
+from app.data.core import fetch as fetch_module
+
+
+HISTORY = pd.Series(
+    [3.0, float("nan"), 3.4, 3.1],
+    index=pd.to_datetime(["2024-01-01", "2024-04-01", "2024-07-01", "2024-10-01"]),
+)
+
+
+class FakeFredClient:
+    def __init__(self, history):
+        self.history = history
+        self.calls = []
+
+    def get_series(self, series_id, observation_start=None):
+        self.calls.append((series_id, observation_start))
+        if observation_start is None:
+            return self.history
+        return self.history[self.history.index >= observation_start]
+
+
+def test_refresh_only_requests_new_observations(tmp_path):
+    client = FakeFredClient(HISTORY.iloc[:2])
+    store = SeriesStore(tmp_path)
+
+    assert store.refresh("DRCCLACBS", client) == 2
+    client.history = HISTORY
+    assert store.refresh("DRCCLACBS", client) == 2
+    assert store.refresh("DRCCLACBS", client) == 0
+
+    assert client.calls == [
+        ("DRCCLACBS", None),
+        ("DRCCLACBS", "2024-04-02"),
+        ("DRCCLACBS", "2024-10-02"),
+    ]
+    assert SeriesStore(tmp_path).read("DRCCLACBS").equals(HISTORY.rename("DRCCLACBS").rename_axis("date"))
+
+
+def test_latest_and_as_of_lookups(tmp_path):
+    store = SeriesStore(tmp_path)
+    store.refresh("DRCCLACBS", FakeFredClient(HISTORY))
+
+    assert store.latest("DRCCLACBS") == 3.1
+    assert store.as_of("DRCCLACBS", date(2024, 5, 15)) == 3.0
+    assert store.as_of("DRCCLACBS", date(2024, 7, 1)) == 3.4
+    assert store.last_date("DRCCLACBS") == date(2024, 10, 1)
+    with pytest.raises(ValueError):
+        store.as_of("DRCCLACBS", date(2023, 12, 31))
+
+
+def test_get_macro_data_as_of_uses_only_the_store(monkeypatch, tmp_path):
+    store = SeriesStore(tmp_path)
+    for sid in fetch_module.FRED_SERIES:
+        store.refresh(sid, FakeFredClient(HISTORY))
+
+    def no_network():
+        raise AssertionError("as-of lookups must not touch FRED")
+
+    monkeypatch.setattr(fetch_module, "get_series_store", lambda: store)
+    monkeypatch.setattr(fetch_module, "get_fred_client", no_network)
+
+    assert fetch_module.get_macro_data_as_of(date(2024, 8, 1), ["interest_rate"]) == {"interest_rate": 3.4}
+
+
+def test_concurrent_writes_do_not_collide(tmp_path):
+    store = SeriesStore(tmp_path)
+    errors = []
+
+    def writer(offset):
+        try:
+            for _ in range(20):
+                store._write("FEDFUNDS", HISTORY + offset)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(offset,)) for offset in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert store.read("FEDFUNDS").iloc[0] - HISTORY.iloc[0] in range(4)
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_failed_write_leaves_no_temporary_file(tmp_path):
+    store = SeriesStore(tmp_path)
+
+    with pytest.raises(Exception):
+        store._write("FEDFUNDS", pd.Series([object()], index=pd.to_datetime(["2024-01-01"])))
+
+    assert list(tmp_path.iterdir()) == []
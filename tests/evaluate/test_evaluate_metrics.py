@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from sklearn.metrics import brier_score_loss, log_loss, roc_auc_score, roc_curve
+
+from app.artifacts.infrastructure import split_features
+from app.data.core import generate_synthetic_data
+from app.evaluate.core import evaluate_metrics, score_metrics
+from app.train.core import train_model
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def _scores(n=5_000, seed=0):
+    rng = np.random.default_rng(seed)
+    y = rng.integers(0, 2, n)
+    # Rounded scores so that many rows tie.
+    return y, np.round(np.clip(0.3 * y + rng.uniform(0, 0.7, n), 0, 1), 2)
+
+
+def test_score_metrics_match_reference_implementations():
+    y, scores = _scores()
+
+    metrics = score_metrics(y, scores, capacities=(0.1,))
+
+    fpr, tpr, _ = roc_curve(y, scores)
+    assert metrics["auc"] == pytest.approx(roc_auc_score(y, scores))
+    assert metrics["gini"] == pytest.approx(2 * roc_auc_score(y, scores) - 1)
+    assert metrics["ks"] == pytest.approx(np.max(tpr - fpr))
+    assert metrics["brier"] == pytest.approx(brier_score_loss(y, scores))
+    assert metrics["log_loss"] == pytest.approx(log_loss(y, scores))
+    top = np.argsort(-scores, kind="stable")[:500]
+    assert metrics["precision_at_0.1"] == pytest.approx(y[top].mean())
+    assert metrics["rows"] == 5_000 and metrics["default_rate"] == pytest.approx(y.mean())
+
+    calibration = metrics["calibration"]
+    assert len(calibration) == 10 and sum(bin_["rows"] for bin_ in calibration) == 5_000
+    assert [bin_["mean_score"] for bin_ in calibration] == sorted(bin_["mean_score"] for bin_ in calibration)
+    assert "intervals" not in metrics
+
+
+def test_score_metrics_bootstrap_intervals():
+    y, scores = _scores(seed=1)
+
+    threaded = score_metrics(y, scores, bootstrap=100, n_jobs=3)
+    sequential = score_metrics(y, scores, bootstrap=100, n_jobs=1)
+
+    intervals = threaded["intervals"]
+    assert intervals == sequential["intervals"]
+    assert intervals["replicates"] == 100 and intervals["confidence"] == 0.95
+    for key in ("auc", "gini", "ks", "brier", "log_loss", "precision_at_0.05"):
+        low, high = intervals[key]
+        assert low <= threaded[key] <= high
+    assert intervals["auc"][1] - intervals["auc"][0] < 0.05
+
+
+def test_score_metrics_rejects_a_single_class():
+    with pytest.raises(ValueError, match="Only one class present"):
+        score_metrics(np.zeros(10), np.linspace(0, 1, 10))
+
+
+def test_score_metrics_skips_single_class_replicates():
+    y = np.zeros(20)
+    y[0] = 1
+    # About a third of the replicates never draw the only positive row.
+    metrics = score_metrics(y, np.linspace(1, 0, 20), bootstrap=50, n_jobs=1)
+
+    assert 0 < metrics["intervals"]["replicates"] < 50
+    assert metrics["intervals"]["auc"] == pytest.approx([1.0, 1.0])
+
+
+def test_evaluate_metrics_scores_saved_model(tmp_path):
+    X, y = split_features(generate_synthetic_data(MACRO, n=3_000, seed=4))
+    model_path = train_model(X, y, output_dir=tmp_path)
+
+    metrics = evaluate_metrics(X, y, model_path, bootstrap=20, n_jobs=2)
+
+    assert metrics["auc"] > 0.9 and metrics["ks"] > 0.5
+    assert metrics["intervals"]["replicates"] == 20
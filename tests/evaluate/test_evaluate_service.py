@@ -1,11 +1,13 @@
 import pytest
+import numpy as np
 import pandas as pd
 
 from app.evaluate.service import evaluate as evaluate_service
 
 
 def test_evaluate_workflow_loads_data_and_calls_core(monkeypatch, tmp_path):
-    df = pd.DataFrame({"default": [0], "name": ["A"], "feature": [1]})
+    X = pd.DataFrame({"feature": [1]})
+    y = np.array([0])
     dataset_dir = tmp_path / "datasets"
     dataset_dir.mkdir()
     model_dir = tmp_path / "models"
@@ -17,27 +19,32 @@ def test_evaluate_workflow_loads_data_and_calls_core(monkeypatch, tmp_path):
     model_path = model_dir / f"{model_name}.pkl"
     model_path.touch()
 
-    def fake_read_parquet(path):
+    def fake_load_training_data(path):
         assert path == dataset_path
-        return df
+        return X, y
 
-    def fake_evaluate_model(dataframe, loaded_model_path):
-        assert dataframe is df
+    def fake_evaluate_metrics(features, target, loaded_model_path, capacities, bootstrap, n_jobs):
+        assert features is X
+        assert target is y
         assert loaded_model_path == model_path
-        return 0.9
+        assert bootstrap == 0
+        return {"auc": 0.9, "ks": 0.6}
 
-    def fake_log_evaluation(model_name, dataset_name, auc):
+    logged = {}
+
+    def fake_log_evaluation(model_name, dataset_name, auc, metrics=None):
         # Mock database call - doesn't actually hit DB
-        pass
+        logged.update(auc=auc, metrics=metrics)
 
     monkeypatch.setattr(evaluate_service, "DATASET_DIR", dataset_dir, raising=False)
     monkeypatch.setattr(evaluate_service, "MODEL_DIR", model_dir, raising=False)
-    monkeypatch.setattr(evaluate_service.pd, "read_parquet", fake_read_parquet)
-    monkeypatch.setattr(evaluate_service, "evaluate_model", fake_evaluate_model)
+    monkeypatch.setattr(evaluate_service, "load_training_data", fake_load_training_data)
+    monkeypatch.setattr(evaluate_service, "evaluate_metrics", fake_evaluate_metrics)
     monkeypatch.setattr(evaluate_service, "log_evaluation", fake_log_evaluation)
 
-    auc = evaluate_service.evaluate_workflow(model_name, dataset_name)
-    assert auc == 0.9
+    metrics = evaluate_service.evaluate_workflow(model_name, dataset_name)
+    assert metrics == {"auc": 0.9, "ks": 0.6}
+    assert logged == {"auc": 0.9, "metrics": metrics}
 
 
 def test_evaluate_workflow_requires_names(monkeypatch, tmp_path):
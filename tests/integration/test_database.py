@@ -7,6 +7,10 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from app.artifacts.infrastructure.repository import (
+    count_model_cache_hit,
+    find_dataset_by_hash,
+    find_model_by_training_key,
+    get_dataset_stats,
     log_dataset,
     log_evaluation,
     log_model,
@@ -228,3 +232,103 @@ def test_query_by_name_lookup(db_session):
     assert dataset_a.rows == 1000
     assert dataset_b is not None
     assert dataset_b.rows == 2000
+
+
+def test_find_dataset_by_hash(db_session):
+    macro = {"debt_ratio": 0.5, "delinquency": 0.1, "interest_rate": 0.02}
+
+    log_dataset(name="dataset_hashed", rows=100, macro=macro, content_hash="a" * 64)
+    log_dataset(name="dataset_plain", rows=100, macro=macro)
+
+    record = find_dataset_by_hash("a" * 64)
+    assert record is not None
+    assert record.name == "dataset_hashed"
+    assert find_dataset_by_hash("b" * 64) is None
+
+
+def test_get_dataset_stats(db_session):
+    macro = {"debt_ratio": 0.5, "delinquency": 0.1, "interest_rate": 0.02}
+    stats = {"rows": 100, "default_rate": 0.25, "columns": {"default": {"count": 100, "mean": 0.25}}}
+
+    log_dataset(name="dataset_with_stats", rows=100, macro=macro, stats=stats)
+    log_dataset(name="dataset_without_stats", rows=100, macro=macro)
+
+    assert get_dataset_stats("dataset_with_stats") == stats
+    assert get_dataset_stats("dataset_without_stats") is None
+    assert get_dataset_stats("dataset_unknown") is None
+
+
+def test_find_model_by_training_key_and_count_hits(db_session):
+    macro = {"debt_ratio": 0.5, "delinquency": 0.1, "interest_rate": 0.02}
+    log_dataset(name="dataset_keyed", rows=100, macro=macro)
+    log_model(name="model_keyed", dataset_name="dataset_keyed", estimator="lbfgs", training_key="c" * 64)
+
+    record = find_model_by_training_key("c" * 64)
+    assert record is not None
+    assert record.name == "model_keyed"
+    assert record.estimator == "lbfgs"
+    assert find_model_by_training_key("d" * 64) is None
+    assert count_model_cache_hit("model_keyed") == 1
+    assert count_model_cache_hit("model_keyed") == 2
+
+
+def test_log_model_links_parent(db_session):
+    macro = {"debt_ratio": 0.5, "delinquency": 0.1, "interest_rate": 0.02}
+    log_dataset(name="dataset_parent", rows=100, macro=macro)
+    log_model(name="model_parent", dataset_name="dataset_parent")
+    log_model(name="model_child", dataset_name="dataset_parent", parent_name="model_parent")
+    log_model(name="model_orphan", dataset_name="dataset_parent", parent_name="model_unknown")
+
+    parent = db_session.query(ModelRecord).filter_by(name="model_parent").first()
+    child = db_session.query(ModelRecord).filter_by(name="model_child").first()
+    assert child.parent_id == parent.id
+    assert [model.name for model in parent.children] == ["model_child"]
+    assert db_session.query(ModelRecord).filter_by(name="model_orphan").first().parent_id is None
+
+
+def test_log_evaluation_stores_metrics(db_session):
+    macro = {"debt_ratio": 0.5, "delinquency": 0.1, "interest_rate": 0.02}
+    metrics = {"auc": 0.9, "ks": 0.65, "calibration": [{"mean_score": 0.1, "default_rate": 0.12, "rows": 10}]}
+    log_dataset(name="dataset_metrics", rows=100, macro=macro)
+    log_model(name="model_metrics", dataset_name="dataset_metrics")
+    log_evaluation(model_name="model_metrics", dataset_name="dataset_metrics", auc=0.9, metrics=metrics)
+
+    record = db_session.query(EvaluationRecord).first()
+    assert record.auc == 0.9
+    assert record.metrics == metrics
+
+
+def test_upgrade_db_adds_missing_columns(temp_database):
+    from app.artifacts.models import upgrade_db
+    from app.artifacts.models.artifacts import COLUMN_UPGRADES
+
+    schema = f"upgrade_{uuid.uuid4().hex[:8]}"
+    with create_engine(temp_database, echo=False).begin() as conn:
+        conn.execute(text(f'CREATE SCHEMA "{schema}"'))
+    engine = create_engine(temp_database, echo=False, connect_args={"options": f"-csearch_path={schema}"})
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE datasets (id SERIAL PRIMARY KEY, name VARCHAR NOT NULL UNIQUE, rows INTEGER NOT NULL, "
+            "macro JSON NOT NULL, created_at TIMESTAMP NOT NULL)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE models (id SERIAL PRIMARY KEY, name VARCHAR NOT NULL UNIQUE, "
+            "dataset_id INTEGER NOT NULL REFERENCES datasets(id), created_at TIMESTAMP NOT NULL)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE evaluations (id SERIAL PRIMARY KEY, model_id INTEGER NOT NULL REFERENCES models(id), "
+            "dataset_id INTEGER NOT NULL REFERENCES datasets(id), auc FLOAT NOT NULL, created_at TIMESTAMP NOT NULL)"
+        ))
+        conn.execute(text(
+            "CREATE TABLE pruned_models (id SERIAL PRIMARY KEY, pruned_name VARCHAR NOT NULL UNIQUE, "
+            "base_model_id INTEGER NOT NULL REFERENCES models(id), created_at TIMESTAMP NOT NULL)"
+        ))
+
+    try:
+        added = upgrade_db(engine)
+        assert added == [f"{table}.{column}" for table, column, _ in COLUMN_UPGRADES]
+        assert upgrade_db(engine) == []
+    finally:
+        engine.dispose()
+        with create_engine(temp_database, echo=False).begin() as conn:
+            conn.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
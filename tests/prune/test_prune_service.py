@@ -1,12 +1,14 @@
 import pytest
 
+import numpy as np
 import pandas as pd
 
 from app.prune.service import prune as prune_service
 
 
 def test_prune_workflow_loads_data_and_calls_core(monkeypatch, tmp_path):
-    df = pd.DataFrame({"default": [0], "name": ["A"], "feature": [1]})
+    X = pd.DataFrame({"feature": [1]})
+    y = np.array([0])
     dataset_dir = tmp_path / "datasets"
     dataset_dir.mkdir()
     model_dir = tmp_path / "models"
@@ -18,12 +20,13 @@ def test_prune_workflow_loads_data_and_calls_core(monkeypatch, tmp_path):
     model_path = model_dir / f"{model_name}.pkl"
     model_path.touch()
 
-    def fake_read_parquet(path):
+    def fake_load_training_data(path):
         assert path == dataset_path
-        return df
+        return X, y
 
-    def fake_prune_model(dataframe, loaded_model_path):
-        assert dataframe is df
+    def fake_prune_model(features, target, loaded_model_path):
+        assert features is X
+        assert target is y
         assert loaded_model_path == model_path
         return model_dir / "model_v1_pruned.pkl"
 
@@ -33,7 +36,7 @@ def test_prune_workflow_loads_data_and_calls_core(monkeypatch, tmp_path):
 
     monkeypatch.setattr(prune_service, "DATASET_DIR", dataset_dir, raising=False)
     monkeypatch.setattr(prune_service, "MODEL_DIR", model_dir, raising=False)
-    monkeypatch.setattr(prune_service.pd, "read_parquet", fake_read_parquet)
+    monkeypatch.setattr(prune_service, "load_training_data", fake_load_training_data)
     monkeypatch.setattr(prune_service, "prune_model", fake_prune_model)
     monkeypatch.setattr(prune_service, "log_pruned_model", fake_log_pruned_model)
 
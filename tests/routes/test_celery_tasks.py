@@ -1,6 +1,6 @@
 """Test Celery tasks using .apply() (no Redis needed)."""
 
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 import pandas as pd
 
 from app.artifacts.service.tasks import (
@@ -37,7 +37,9 @@ def test_train_model_task_apply(tmp_path, monkeypatch):
         assert task_result["status"] == "success"
         assert task_result["dataset_name"] == "dataset_test123"
         assert "model_name" in task_result
-        mock_workflow.assert_called_once_with("dataset_test123")
+        mock_workflow.assert_called_once_with(
+            "dataset_test123", estimator="liblinear", params=None, search=None, progress=ANY, parent_model=None
+        )
 
 
 def test_train_model_task_handles_missing_dataset(monkeypatch):
@@ -50,6 +52,21 @@ def test_train_model_task_handles_missing_dataset(monkeypatch):
         assert isinstance(result.result, ValueError)
 
 
+def test_train_model_task_publishes_progress(tmp_path):
+    fold = {"stage": "cross_validation", "fold": 2, "auc": 0.91, "folds": 5, "completed": 1, "elapsed": 0.4}
+
+    def fake_workflow(dataset_name, **kwargs):
+        kwargs["progress"](fold)
+        return tmp_path / "model_test456.pkl"
+
+    with patch("app.artifacts.service.tasks.train_workflow", side_effect=fake_workflow), \
+            patch.object(train_model_task, "update_state") as update_state:
+        result = train_model_task.apply(args=["dataset_test123"])
+
+    assert result.successful()
+    update_state.assert_called_once_with(state="PROGRESS", meta=fold)
+
+
 def test_evaluate_model_task_apply(tmp_path, monkeypatch):
     dataset_dir = tmp_path / "storage" / "datasets"
     model_dir = tmp_path / "storage" / "models"
@@ -57,7 +74,7 @@ def test_evaluate_model_task_apply(tmp_path, monkeypatch):
     model_dir.mkdir(parents=True)
     
     with patch("app.artifacts.service.tasks.evaluate_workflow") as mock_workflow:
-        mock_workflow.return_value = 0.85
+        mock_workflow.return_value = {"auc": 0.85, "ks": 0.6}
         
         import app.evaluate.service.evaluate as evaluate_service
         
@@ -73,6 +90,7 @@ def test_evaluate_model_task_apply(tmp_path, monkeypatch):
             assert task_result["model_name"] == "model_test456"
             assert task_result["dataset_name"] == "dataset_test123"
             assert task_result["auc"] == 0.85
+            assert task_result["metrics"] == {"auc": 0.85, "ks": 0.6}
 
 
 def test_prune_model_task_apply(tmp_path, monkeypatch):
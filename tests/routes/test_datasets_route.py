@@ -0,0 +1,43 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.data.routes import datasets as datasets_module
+
+
+client = TestClient(app)
+
+STATS = {
+    "rows": 2,
+    "default_rate": 0.5,
+    "sketch_relative_accuracy": 0.01,
+    "columns": {
+        "monthly_income": {
+            "count": 2,
+            "mean": 3000.0,
+            "std": 1414.2,
+            "min": 2000.0,
+            "max": 4000.0,
+            "quantiles": {"p50": 2000.0},
+            "histogram": {"edges": [2000.0, 3000.0, 4000.0], "counts": [1, 1]},
+        }
+    },
+}
+
+
+def test_dataset_stats_route_serves_stored_stats(monkeypatch):
+    requested = []
+    monkeypatch.setattr(datasets_module, "get_dataset_stats", lambda name: requested.append(name) or STATS)
+
+    response = client.get("/datasets/scenarios_ab12cd34/scenario_id=0/stats")
+
+    assert response.status_code == 200
+    assert response.json() == {"dataset_name": "scenarios_ab12cd34/scenario_id=0", **STATS}
+    assert requested == ["scenarios_ab12cd34/scenario_id=0"]
+
+
+def test_dataset_stats_route_returns_404_without_stats(monkeypatch):
+    monkeypatch.setattr(datasets_module, "get_dataset_stats", lambda name: None)
+
+    response = client.get("/datasets/dataset_missing/stats")
+
+    assert response.status_code == 404
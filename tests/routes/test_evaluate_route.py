@@ -92,6 +92,28 @@ def test_evaluate_endpoint_submits_task(mock_artifacts, monkeypatch):
             monkeypatch.undo()
 
 
+def test_evaluate_endpoint_passes_bootstrap(mock_artifacts):
+    """Test that a bootstrap replicate count is validated and forwarded to the task."""
+    mock_async_result = MagicMock()
+    mock_async_result.id = "task-eval-123"
+
+    with patch("app.evaluate.routes.evaluate.evaluate_model_task") as mock_task:
+        mock_task.delay = MagicMock(return_value=mock_async_result)
+        with patch("pathlib.Path.exists", return_value=True):
+            response = client.post(
+                "/evaluate/",
+                json={"model_name": "model_test456", "dataset_name": "dataset_test123", "bootstrap": 200},
+            )
+            negative = client.post(
+                "/evaluate/",
+                json={"model_name": "model_test456", "dataset_name": "dataset_test123", "bootstrap": -1},
+            )
+
+    assert response.status_code == 200
+    mock_task.delay.assert_called_once_with("model_test456", "dataset_test123", bootstrap=200)
+    assert negative.status_code == 422
+
+
 def test_evaluate_endpoint_returns_404_for_missing_model(monkeypatch):
     """Test that /evaluate endpoint returns 404 when model doesn't exist."""
     from app.evaluate.routes import evaluate as evaluate_module
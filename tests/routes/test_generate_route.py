@@ -3,22 +3,23 @@ from fastapi.testclient import TestClient
 
 from app.main import app
 from app.data.routes import generate as generate_module
+from settings import settings
 
 
 client = TestClient(app)
 
 
 def test_generate_route_returns_preview(monkeypatch):
-    def fake_build_dataset(macro_overrides, n_borrowers):
+    def fake_stream_dataset(macro_overrides, n_borrowers, **kwargs):
         df = pd.DataFrame({"id": [1, 2, 3]})
         macro = {
             "debt_ratio": 0.5,
             "delinquency": 0.1,
             "interest_rate": 0.2,
         }
-        return "dataset_1234", df, macro
+        return "dataset_1234", len(df), df, macro
 
-    monkeypatch.setattr(generate_module, "build_dataset", fake_build_dataset)
+    monkeypatch.setattr(generate_module, "stream_dataset", fake_stream_dataset)
 
     response = client.post(
         "/generate/",
@@ -40,3 +41,63 @@ def test_generate_route_returns_preview(monkeypatch):
         "interest_rate": 0.2,
     }
     assert payload["preview"] == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+
+def test_generate_route_rejects_too_many_shards(monkeypatch):
+    called = []
+    monkeypatch.setattr(generate_module, "stream_dataset", lambda *args, **kwargs: called.append(kwargs))
+
+    response = client.post("/generate/", json={"n_borrowers": 3, "shards": settings.dataset_max_shards + 1})
+
+    assert response.status_code == 422
+    assert called == []
+
+
+def test_generate_routes_reject_negative_borrower_counts(monkeypatch):
+    called = []
+    monkeypatch.setattr(generate_module, "stream_dataset", lambda *args, **kwargs: called.append(kwargs))
+    monkeypatch.setattr(generate_module, "build_scenario_batch", lambda *args, **kwargs: called.append(kwargs))
+
+    single = client.post("/generate/", json={"n_borrowers": -5})
+    batch = client.post("/generate/scenarios", json={"n_borrowers": -5, "scenarios": [{"debt_ratio": 0.3}]})
+
+    assert (single.status_code, batch.status_code) == (422, 422)
+    assert called == []
+
+
+def test_generate_scenarios_route_expands_grid(monkeypatch):
+    received = {}
+
+    def fake_build_scenario_batch(scenarios, n_borrowers, seed=None, as_of=None):
+        received["scenarios"] = scenarios
+        summaries = [
+            {"scenario_id": i, "macro": {**s, "interest_rate": 0.2}, "rows": n_borrowers, "default_rate": 0.1}
+            for i, s in enumerate(scenarios)
+        ]
+        return "scenarios_1234", summaries
+
+    monkeypatch.setattr(generate_module, "build_scenario_batch", fake_build_scenario_batch)
+
+    response = client.post(
+        "/generate/scenarios",
+        json={
+            "n_borrowers": 5,
+            "scenarios": [{"debt_ratio": 0.3, "delinquency": 0.1}],
+            "grid": {"debt_ratio": [0.4, 0.5], "delinquency": [0.1]},
+        },
+    )
+
+    assert response.status_code == 200
+    assert received["scenarios"] == [
+        {"debt_ratio": 0.3, "delinquency": 0.1},
+        {"debt_ratio": 0.4, "delinquency": 0.1},
+        {"debt_ratio": 0.5, "delinquency": 0.1},
+    ]
+    payload = response.json()
+    assert payload["dataset_name"] == "scenarios_1234"
+    assert [s["scenario_id"] for s in payload["scenarios"]] == [0, 1, 2]
+
+
+def test_generate_scenarios_route_requires_scenarios():
+    response = client.post("/generate/scenarios", json={"n_borrowers": 5})
+    assert response.status_code == 400
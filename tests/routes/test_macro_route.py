@@ -0,0 +1,55 @@
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.data.core import CircuitOpenError
+from app.data.routes import macro as macro_module
+
+
+client = TestClient(app)
+
+
+def test_macro_cache_stats_route(monkeypatch):
+    stats = {
+        "hits": 4,
+        "stale_hits": 1,
+        "misses": 3,
+        "refreshes": 1,
+        "refresh_failures": 0,
+        "fallbacks": 0,
+    }
+    monkeypatch.setattr(macro_module, "macro_cache_stats", lambda: stats)
+
+    response = client.get("/macro/cache/stats")
+
+    assert response.status_code == 200
+    assert response.json() == stats
+
+
+def test_series_refresh_route_returns_new_observations(monkeypatch):
+    monkeypatch.setattr(macro_module, "refresh_series_store", lambda: {"TDSP": 2})
+
+    response = client.post("/macro/series/refresh")
+
+    assert response.status_code == 200
+    assert response.json() == {"new_observations": {"TDSP": 2}}
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        CircuitOpenError("FRED circuit breaker is open"),
+        httpx.ConnectError("connection refused"),
+    ],
+)
+def test_series_refresh_route_returns_503_when_fred_fails(monkeypatch, error):
+    def failing_refresh():
+        raise error
+
+    monkeypatch.setattr(macro_module, "refresh_series_store", failing_refresh)
+
+    response = client.post("/macro/series/refresh")
+
+    assert response.status_code == 503
+    assert "retry later" in response.json()["detail"]
@@ -66,6 +66,93 @@ def test_train_endpoint_submits_task(mock_dataset, monkeypatch):
             mock_task.delay.assert_called_once_with("dataset_test123")
 
 
+def test_train_endpoint_accepts_partitioned_dataset(tmp_path, monkeypatch):
+    """Test that /train accepts a dataset directory with a manifest."""
+    dataset_dir = tmp_path / "storage" / "datasets" / "dataset_parts123"
+    dataset_dir.mkdir(parents=True)
+    (dataset_dir / "_manifest.json").write_text("{}")
+    monkeypatch.chdir(tmp_path)
+
+    mock_async_result = MagicMock()
+    mock_async_result.id = "task-abc-123"
+
+    with patch("app.train.routes.train.train_model_task") as mock_task:
+        mock_task.delay = MagicMock(return_value=mock_async_result)
+        response = client.post("/train/", json={"dataset_name": "dataset_parts123"})
+
+    assert response.status_code == 200
+    mock_task.delay.assert_called_once_with("dataset_parts123")
+
+
+def test_train_endpoint_passes_search_space(mock_dataset):
+    """Test that a search space is validated and forwarded to the task."""
+    mock_async_result = MagicMock()
+    mock_async_result.id = "task-abc-123"
+
+    with patch("app.train.routes.train.train_model_task") as mock_task:
+        mock_task.delay = MagicMock(return_value=mock_async_result)
+        with patch("pathlib.Path.exists", return_value=True):
+            response = client.post(
+                "/train/",
+                json={"dataset_name": "dataset_test123", "search": {"C": [0.1, 1.0], "penalty": ["l1", "l2"]}},
+            )
+            invalid = client.post("/train/", json={"dataset_name": "dataset_test123", "search": {"C": []}})
+            non_positive = [
+                client.post("/train/", json={"dataset_name": "dataset_test123", "search": {"C": [1.0, C]}})
+                for C in (0, -0.5)
+            ]
+
+    assert response.status_code == 200
+    mock_task.delay.assert_called_once_with(
+        "dataset_test123", search={"C": [0.1, 1.0], "penalty": ["l1", "l2"], "cv": 3}
+    )
+    assert invalid.status_code == 422
+    assert [response.status_code for response in non_positive] == [422, 422]
+
+
+def test_train_endpoint_passes_estimator(mock_dataset):
+    """Test that a non-default estimator and its parameters are forwarded to the task."""
+    mock_async_result = MagicMock()
+    mock_async_result.id = "task-abc-123"
+
+    with patch("app.train.routes.train.train_model_task") as mock_task:
+        mock_task.delay = MagicMock(return_value=mock_async_result)
+        with patch("pathlib.Path.exists", return_value=True):
+            response = client.post(
+                "/train/",
+                json={"dataset_name": "dataset_test123", "estimator": "hist_gradient_boosting", "params": {"max_iter": 50}},
+            )
+            conflicting = client.post(
+                "/train/",
+                json={"dataset_name": "dataset_test123", "estimator": "sgd", "search": {"C": [1.0]}},
+            )
+
+    assert response.status_code == 200
+    mock_task.delay.assert_called_once_with(
+        "dataset_test123", estimator="hist_gradient_boosting", params={"max_iter": 50}
+    )
+    assert conflicting.status_code == 422
+
+
+def test_train_endpoint_passes_parent_model(mock_dataset):
+    """Test that a parent model is forwarded and needs a warm-start estimator."""
+    mock_async_result = MagicMock()
+    mock_async_result.id = "task-abc-123"
+
+    with patch("app.train.routes.train.train_model_task") as mock_task:
+        mock_task.delay = MagicMock(return_value=mock_async_result)
+        with patch("pathlib.Path.exists", return_value=True):
+            response = client.post(
+                "/train/",
+                json={"dataset_name": "dataset_test123", "estimator": "lbfgs", "parent_model": "model_a1b2c3d4"},
+            )
+            liblinear = client.post("/train/", json={"dataset_name": "dataset_test123", "parent_model": "model_a1b2c3d4"})
+
+    assert response.status_code == 200
+    mock_task.delay.assert_called_once_with("dataset_test123", estimator="lbfgs", parent_model="model_a1b2c3d4")
+    assert liblinear.status_code == 422
+
+
 def test_train_endpoint_returns_404_for_missing_dataset(monkeypatch):
     """Test that /train endpoint returns 404 when dataset doesn't exist."""
     with patch("pathlib.Path.exists") as mock_exists:
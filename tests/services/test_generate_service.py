@@ -20,31 +20,316 @@ def test_build_dataset_persists_named_dataset(monkeypatch, tmp_path):
     def fake_uuid():
         return type("U", (), {"hex": "deadbeefcafebabe"})()
 
-    def fake_log_dataset(name, rows, macro):
+    def fake_log_dataset(name, rows, macro, stats=None):
         # Mock database call - doesn't actually hit DB
         calls["logged_dataset"] = name
+        calls["stats"] = stats
 
     writes = {}
 
-    def fake_to_parquet(self, path, index=False):
+    def fake_write_dataset(df, path):
         writes["path"] = path
-        writes["index"] = index
+        writes["df"] = df
 
     monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
     monkeypatch.setattr(generate_service, "get_macro_data", fake_get_macro_data)
     monkeypatch.setattr(generate_service, "generate_synthetic_data", fake_generate_synthetic_data)
     monkeypatch.setattr(generate_service, "uuid4", fake_uuid)
     monkeypatch.setattr(generate_service, "log_dataset", fake_log_dataset)
-    monkeypatch.setattr(pd.DataFrame, "to_parquet", fake_to_parquet, raising=False)
+    monkeypatch.setattr(generate_service, "write_dataset", fake_write_dataset)
 
     dataset_name, df, macro = generate_service.build_dataset({"debt_ratio": 0.5}, 5)
 
     assert dataset_name == "dataset_deadbeef"
     assert writes["path"] == dataset_dir / "dataset_deadbeef.parquet"
-    assert writes["index"] is False
+    assert writes["df"] is df
     assert set(calls["fields"]) == {"delinquency", "interest_rate"}
     assert calls["n"] == 5
     assert df.equals(pd.DataFrame({"id": [1, 2]}))
     assert macro["debt_ratio"] == 0.5
     assert set(macro.keys()) == {"debt_ratio", "delinquency", "interest_rate"}
     assert calls["logged_dataset"] == "dataset_deadbeef"
+    assert calls["stats"]["rows"] == 2 and calls["stats"]["columns"]["id"]["mean"] == 1.5
+
+
+def test_stream_dataset_writes_row_groups(monkeypatch, tmp_path):
+    import pyarrow.parquet as pq
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    logged = {}
+
+    def fake_log_dataset(name, rows, macro, content_hash=None, stats=None):
+        logged[name] = rows
+
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_dataset", fake_log_dataset)
+    monkeypatch.setattr(generate_service, "find_dataset_by_hash", lambda content_hash: None)
+
+    macro_in = {"debt_ratio": 11.0, "delinquency": 3.0, "interest_rate": 4.0}
+    dataset_name, rows, preview, macro = generate_service.stream_dataset(
+        macro_in, 250, chunk_size=100, seed=1
+    )
+
+    parquet_file = pq.ParquetFile(dataset_dir / f"{dataset_name}.parquet")
+    assert rows == 250
+    assert parquet_file.metadata.num_rows == 250
+    assert [parquet_file.metadata.row_group(i).num_rows for i in range(3)] == [100, 100, 50]
+    assert len(preview) == generate_service.PREVIEW_ROWS
+    assert macro == macro_in
+    assert logged == {dataset_name: 250}
+    assert not list(dataset_dir.glob("*.tmp"))
+
+
+def test_stream_dataset_stores_macro_constants_in_metadata(monkeypatch, tmp_path):
+    import pyarrow.parquet as pq
+
+    from app.artifacts.infrastructure import read_dataset
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_dataset", lambda name, rows, macro, content_hash=None, stats=None: None)
+
+    macro_in = {"debt_ratio": 11.0, "delinquency": 3.0, "interest_rate": 4.5}
+    dataset_name, _, preview, _ = generate_service.stream_dataset(macro_in, 120, chunk_size=50)
+    path = dataset_dir / f"{dataset_name}.parquet"
+
+    assert "interest_rate" not in pq.read_schema(path).names
+    df = read_dataset(path)
+    assert list(df.columns) == list(preview.columns)
+    assert df["interest_rate"].eq(4.5).all() and df["debt_ratio"].eq(11.0).all()
+    assert df["interest_rate"].dtype == "float32"
+    assert len(df) == 120
+
+
+def test_stream_dataset_applies_parquet_write_settings(monkeypatch, tmp_path):
+    import pyarrow.parquet as pq
+
+    from app.artifacts.infrastructure import read_dataset
+    from settings import settings
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_dataset", lambda name, rows, macro, content_hash=None, stats=None: None)
+    monkeypatch.setattr(generate_service, "find_dataset_by_hash", lambda content_hash: None)
+    monkeypatch.setattr(settings, "dataset_row_group_rows", 40)
+
+    macro_in = {"debt_ratio": 11.0, "delinquency": 3.0, "interest_rate": 4.5}
+    frames = []
+    for engine, compression in (("pyarrow", "zstd"), ("fastparquet", "snappy")):
+        monkeypatch.setattr(settings, "dataset_parquet_engine", engine)
+        monkeypatch.setattr(settings, "dataset_parquet_compression", compression)
+        dataset_name, _, _, _ = generate_service.stream_dataset(macro_in, 150, chunk_size=100, seed=2)
+        path = dataset_dir / f"{dataset_name}.parquet"
+
+        metadata = pq.ParquetFile(path).metadata
+        sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        assert sum(sizes) == 150 and max(sizes) <= 40 and len(sizes) == 5
+        column = metadata.row_group(0).column(1)
+        assert column.compression == compression.upper()
+        assert column.statistics.has_min_max
+        frames.append(read_dataset(path))
+
+    assert all(frame["name"].dtype == "category" for frame in frames)
+    assert frames[0].astype({"name": str}).equals(frames[1].astype({"name": str}))
+
+
+def test_stream_dataset_partitioned_layout_matches_single_file(monkeypatch, tmp_path):
+    import json
+
+    from app.artifacts.infrastructure import read_dataset, resolve_dataset
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_dataset", lambda name, rows, macro, content_hash=None, stats=None: None)
+    monkeypatch.setattr(generate_service, "find_dataset_by_hash", lambda content_hash: None)
+
+    macro_in = {"debt_ratio": 11.0, "delinquency": 3.0, "interest_rate": 4.5}
+    file_name, _, _, _ = generate_service.stream_dataset(
+        macro_in, 301, chunk_size=50, seed=9, shards=3, workers=1
+    )
+    dir_name, rows, preview, _ = generate_service.stream_dataset(
+        macro_in, 301, chunk_size=50, seed=9, shards=3, workers=1, partitioned=True
+    )
+
+    directory = resolve_dataset(dataset_dir, dir_name)
+    assert directory == dataset_dir / dir_name
+    manifest = json.loads((directory / "_manifest.json").read_text())
+    assert rows == manifest["rows"] == 301
+    assert [part["rows"] for part in manifest["parts"]] == [101, 100, 100]
+    assert manifest["parts"][0]["stats"]["monthly_income"]["min"] <= manifest["parts"][0]["stats"]["monthly_income"]["max"]
+    assert len(preview) == generate_service.PREVIEW_ROWS
+
+    single = read_dataset(resolve_dataset(dataset_dir, file_name))
+    partitioned = read_dataset(directory)
+    assert partitioned.astype({"name": str}).equals(single.astype({"name": str}))
+    subset = read_dataset(directory, parts=[1, 2])
+    assert subset.astype({"name": str}).equals(single.iloc[101:].reset_index(drop=True).astype({"name": str}))
+    assert not list(dataset_dir.glob(".*"))
+
+
+def test_stream_dataset_logs_stats_merged_across_shards(monkeypatch, tmp_path):
+    from app.artifacts.infrastructure import read_dataset, resolve_dataset
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    logged = {}
+
+    def fake_log_dataset(name, rows, macro, content_hash=None, stats=None):
+        logged[name] = stats
+
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_dataset", fake_log_dataset)
+    monkeypatch.setattr(generate_service, "find_dataset_by_hash", lambda content_hash: None)
+
+    macro_in = {"debt_ratio": 11.0, "delinquency": 3.0, "interest_rate": 4.5}
+    name, _, _, _ = generate_service.stream_dataset(macro_in, 301, chunk_size=50, seed=9, shards=3, workers=1)
+
+    stats = logged[name]
+    df = read_dataset(resolve_dataset(dataset_dir, name))
+    assert stats["rows"] == 301
+    assert stats["default_rate"] == df["default"].mean()
+    assert "name" not in stats["columns"]
+    income = stats["columns"]["monthly_income"]
+    assert income["count"] == 301
+    assert (income["min"], income["max"]) == (df["monthly_income"].min(), df["monthly_income"].max())
+    assert abs(income["mean"] - df["monthly_income"].astype(float).mean()) < 1e-6
+    assert abs(income["std"] - df["monthly_income"].astype(float).std()) < 1e-6
+    assert stats["columns"]["interest_rate"]["std"] == 0.0
+
+
+def test_read_dataset_rejects_parts_that_do_not_match_manifest(tmp_path):
+    import pytest
+
+    from app.artifacts.infrastructure import read_dataset, write_manifest
+
+    directory = tmp_path / "dataset_parts"
+    directory.mkdir()
+    pd.DataFrame({"default": [0, 1]}).to_parquet(directory / "part-00000.parquet", index=False)
+    write_manifest(directory)
+    pd.DataFrame({"default": ["0", "1"]}).to_parquet(directory / "part-00000.parquet", index=False)
+
+    with pytest.raises(ValueError, match="manifest schema"):
+        read_dataset(directory)
+
+
+def test_read_dataset_accepts_files_with_constant_columns(tmp_path):
+    from app.artifacts.infrastructure import read_dataset
+
+    legacy = pd.DataFrame({"name": ["A", "B"], "interest_rate": [4.0, 4.0], "default": [0, 1]})
+    legacy.to_parquet(tmp_path / "legacy.parquet", index=False)
+
+    assert read_dataset(tmp_path / "legacy.parquet").equals(legacy)
+
+
+def test_stream_dataset_parallel_is_independent_of_worker_count(monkeypatch, tmp_path):
+    from app.artifacts.infrastructure import read_dataset
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_dataset", lambda name, rows, macro, content_hash=None, stats=None: None)
+    monkeypatch.setattr(generate_service, "find_dataset_by_hash", lambda content_hash: None)
+
+    macro_in = {"debt_ratio": 11.0, "delinquency": 3.0, "interest_rate": 4.0}
+    frames = []
+    for workers in (1, 3):
+        dataset_name, rows, _, _ = generate_service.stream_dataset(
+            macro_in, 301, chunk_size=50, seed=9, shards=3, workers=workers
+        )
+        assert rows == 301
+        frames.append(read_dataset(dataset_dir / f"{dataset_name}.parquet"))
+
+    assert frames[0].equals(frames[1])
+    assert not list(dataset_dir.glob(".*"))
+
+
+def test_stream_dataset_reuses_dataset_with_same_content_hash(monkeypatch, tmp_path):
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    records = {}
+
+    def fake_log_dataset(name, rows, macro, content_hash=None, stats=None):
+        records[content_hash] = type("Record", (), {"name": name, "rows": rows})()
+
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_dataset", fake_log_dataset)
+    monkeypatch.setattr(generate_service, "find_dataset_by_hash", records.get)
+
+    macro_in = {"debt_ratio": 11.0, "delinquency": 3.0, "interest_rate": 4.0}
+    first_name, rows, first_preview, _ = generate_service.stream_dataset(macro_in, 50, seed=5)
+
+    def fail_generation(*args, **kwargs):
+        raise AssertionError("dataset should have been reused")
+
+    monkeypatch.setattr(generate_service, "iter_synthetic_data", fail_generation)
+    second_name, second_rows, second_preview, _ = generate_service.stream_dataset(macro_in, 50, seed=5)
+
+    assert second_name == first_name
+    assert second_rows == rows == 50
+    assert second_preview.equals(first_preview)
+    assert len(list(dataset_dir.glob("*.parquet"))) == 1
+
+
+def test_build_scenario_batch_reuses_borrower_draws(monkeypatch, tmp_path):
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    bulk_writes = []
+    macro_calls = []
+
+    def fake_get_macro_data(fields, use_cache):
+        macro_calls.append(sorted(fields))
+        return {field: 4.0 for field in fields}
+
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "get_macro_data", fake_get_macro_data)
+    monkeypatch.setattr(generate_service, "log_datasets", bulk_writes.append)
+
+    scenarios = generate_service.expand_macro_grid({"delinquency": [0.0, 500.0], "debt_ratio": [10.0]})
+    batch_name, summaries = generate_service.build_scenario_batch(scenarios, 200, seed=3)
+
+    df = pd.read_parquet(dataset_dir / batch_name)
+    by_scenario = {int(k): g.reset_index(drop=True) for k, g in df.groupby("scenario_id", observed=True)}
+    assert set(by_scenario) == {0, 1}
+    assert by_scenario[0]["monthly_income"].equals(by_scenario[1]["monthly_income"])
+    assert by_scenario[1]["default"].sum() > by_scenario[0]["default"].sum()
+    assert [s["macro"]["delinquency"] for s in summaries] == [0.0, 500.0]
+    assert macro_calls == [["interest_rate"]]
+    assert len(bulk_writes) == 1
+    assert [d["name"] for d in bulk_writes[0]] == [
+        f"{batch_name}/scenario_id=0",
+        f"{batch_name}/scenario_id=1",
+    ]
+
+
+def test_scenario_datasets_can_be_trained_and_evaluated_by_name(monkeypatch, tmp_path):
+    from app.artifacts.infrastructure import resolve_dataset
+    from app.evaluate.service import evaluate as evaluate_service
+    from app.train.service import train as train_service
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    model_dir = tmp_path / "models"
+    bulk_writes = []
+    macro = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+    monkeypatch.setattr(generate_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(generate_service, "log_datasets", bulk_writes.append)
+    for service in (train_service, evaluate_service):
+        monkeypatch.setattr(service, "DATASET_DIR", dataset_dir, raising=False)
+        monkeypatch.setattr(service, "MODEL_DIR", model_dir, raising=False)
+    monkeypatch.setattr(train_service.settings, "train_cv_folds", 0)
+    monkeypatch.setattr(train_service.settings, "train_result_cache", False)
+    monkeypatch.setattr(train_service, "log_model", lambda name, dataset_name, **kwargs: None)
+    monkeypatch.setattr(evaluate_service, "log_evaluation", lambda *args, **kwargs: None)
+
+    generate_service.build_scenario_batch([macro, {**macro, "delinquency": 6.0}], 500, seed=5)
+    names = [dataset["name"] for dataset in bulk_writes[0]]
+
+    assert all(resolve_dataset(dataset_dir, name) is not None for name in names)
+    model_path = train_service.train_workflow(names[0])
+    metrics = evaluate_service.evaluate_workflow(model_path.stem, names[1])
+    assert metrics["rows"] == 500
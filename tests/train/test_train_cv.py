@@ -0,0 +1,29 @@
+import numpy as np
+from app.artifacts.infrastructure import split_features
+from app.data.core import generate_synthetic_data
+from app.train.core import cross_validate_model
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def test_cross_validate_model_reports_each_fold():
+    X, y = split_features(generate_synthetic_data(MACRO, n=3_000, seed=7))
+    updates = []
+
+    cv = cross_validate_model(X, y, folds=4, n_jobs=2, progress=updates.append)
+
+    assert [update["completed"] for update in updates] == [1, 2, 3, 4]
+    assert sorted(update["fold"] for update in updates) == [0, 1, 2, 3]
+    assert all(update["folds"] == 4 and update["elapsed"] >= 0 for update in updates)
+    assert [result["fold"] for result in cv["fold_results"]] == [0, 1, 2, 3]
+    assert np.isclose(cv["mean_auc"], np.mean([update["auc"] for update in updates]))
+    assert cv["mean_auc"] > 0.9
+
+
+def test_cross_validate_model_matches_sequential_folds():
+    X, y = split_features(generate_synthetic_data(MACRO, n=2_000, seed=8))
+    parallel = cross_validate_model(X, y, "lbfgs", folds=3, n_jobs=3)
+    sequential = cross_validate_model(X, y, "lbfgs", folds=3, n_jobs=1)
+
+    assert parallel["fold_results"][0]["auc"] == sequential["fold_results"][0]["auc"]
+    assert parallel["mean_auc"] == sequential["mean_auc"]
@@ -0,0 +1,82 @@
+from typing import get_args
+
+import joblib
+import pytest
+from sklearn.metrics import roc_auc_score
+
+from app.artifacts.infrastructure import split_features
+from app.data.core import generate_synthetic_data
+from app.evaluate.core import evaluate_metrics
+from app.prune.core import prune_model
+from app.train.core import ESTIMATORS, estimator_name, fit_estimator, search_model, train_model
+from app.train.schemas.train import WARM_START_ESTIMATORS, Estimator
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+@pytest.mark.parametrize("name", sorted(ESTIMATORS))
+def test_every_estimator_meets_the_artifact_contract(name, tmp_path):
+    X, y = split_features(generate_synthetic_data(MACRO, n=4_000, seed=9))
+
+    model_path = train_model(X, y, output_dir=tmp_path, estimator=name)
+
+    model = joblib.load(model_path)
+    assert estimator_name(model) == name
+    assert list(model.feature_names_in_) == list(X.columns)
+    assert evaluate_metrics(X, y, model_path)["auc"] > 0.9
+
+    selector, pruned = joblib.load(prune_model(X, y, model_path))
+    assert estimator_name(pruned) == name
+    assert 0 < selector.transform(X).shape[1] <= X.shape[1]
+    assert pruned.predict_proba(selector.transform(X)).shape == (len(X), 2)
+
+
+def test_prune_model_keeps_base_hyperparameters(tmp_path):
+    X, y = split_features(generate_synthetic_data(MACRO, n=2_000, seed=11))
+    model_path, _ = search_model(X, y, {"C": [0.05], "penalty": ["l1"], "cv": 2}, output_dir=tmp_path, n_jobs=1)
+
+    _, pruned = joblib.load(prune_model(X, y, model_path))
+
+    assert (pruned.solver, pruned.penalty, pruned.C) == ("saga", "l1", 0.05)
+    assert not pruned.warm_start
+
+
+def test_fit_estimator_rejects_unknown_backends_and_parameters():
+    X, y = split_features(generate_synthetic_data(MACRO, n=200, seed=10))
+
+    with pytest.raises(ValueError, match="Unknown estimator"):
+        fit_estimator("random_forest", X, y)
+    with pytest.raises(ValueError, match="Invalid estimator parameters"):
+        fit_estimator("lbfgs", X, y, {"learning_rate": 0.1})
+    assert fit_estimator("hist_gradient_boosting", X, y, {"max_iter": 5}).n_iter_ == 5
+
+
+def test_train_request_offers_every_registered_estimator():
+    assert set(get_args(Estimator)) == set(ESTIMATORS)
+
+
+def test_fit_estimator_warm_starts_from_parent():
+    X, y = split_features(generate_synthetic_data(MACRO, n=4_000, seed=11))
+    drifted = {**MACRO, "interest_rate": 4.58, "delinquency": 3.3}
+    X_new, y_new = split_features(generate_synthetic_data(drifted, n=4_000, seed=12))
+    parent = fit_estimator("lbfgs", X, y)
+
+    cold = fit_estimator("lbfgs", X_new, y_new)
+    warm = fit_estimator("lbfgs", X_new, y_new, parent=parent)
+
+    assert warm.n_iter_[0] < cold.n_iter_[0]
+    assert not warm.warm_start
+    warm_auc = roc_auc_score(y_new, warm.predict_proba(X_new)[:, 1])
+    assert abs(warm_auc - roc_auc_score(y_new, cold.predict_proba(X_new)[:, 1])) < 1e-3
+    assert fit_estimator("sgd", X_new, y_new, parent=parent).predict_proba(X_new).shape == (len(X_new), 2)
+
+    with pytest.raises(ValueError, match="cannot be warm-started"):
+        fit_estimator("liblinear", X_new, y_new, parent=parent)
+    with pytest.raises(ValueError, match="no coefficients"):
+        fit_estimator("lbfgs", X_new, y_new, parent=fit_estimator("hist_gradient_boosting", X, y, {"max_iter": 5}))
+    with pytest.raises(ValueError, match="different features"):
+        fit_estimator("lbfgs", X_new.iloc[:, 1:], y_new, parent=parent)
+
+
+def test_train_request_warm_start_estimators_match_registry():
+    assert set(WARM_START_ESTIMATORS) == {name for name, backend in ESTIMATORS.items() if backend.warm_start}
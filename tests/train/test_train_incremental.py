@@ -0,0 +1,52 @@
+import joblib
+import numpy as np
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import roc_auc_score
+
+from app.artifacts.infrastructure import (
+    ParquetWriteOptions,
+    iter_dataset,
+    model_columns,
+    read_dataset,
+    split_features,
+    write_dataset,
+)
+from app.data.core import generate_synthetic_data
+from app.evaluate.core import evaluate_metrics
+from app.train.core import StreamingValidation, train_model_incremental
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def test_train_model_incremental_streams_row_groups(tmp_path):
+    path = tmp_path / "dataset_a.parquet"
+    write_dataset(generate_synthetic_data(MACRO, n=20_000, seed=3), path, ParquetWriteOptions(row_group_rows=2_000))
+    columns = model_columns(path)
+    passes = []
+
+    def batches():
+        passes.append(1)
+        return (split_features(df) for df in iter_dataset(path, columns))
+
+    model_path = train_model_incremental(batches, output_dir=tmp_path / "models", epochs=3)
+
+    model = joblib.load(model_path)
+    X, y = split_features(read_dataset(path, columns=columns))
+    assert isinstance(model, SGDClassifier)
+    assert list(model.feature_names_in_) == list(X.columns)
+    assert 2 <= len(passes) <= 6
+    assert evaluate_metrics(X, y, model_path)["auc"] > 0.9
+
+
+def test_streaming_validation_matches_exact_metrics():
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 2, 5_000)
+    proba = np.clip(0.3 * y + rng.uniform(0, 0.7, 5_000), 0, 1)
+    validation = StreamingValidation()
+    for start in range(0, 5_000, 1_000):
+        validation.update(y[start:start + 1_000], proba[start:start + 1_000])
+
+    result = validation.result()
+    assert result["rows"] == 5_000
+    assert abs(result["auc"] - roc_auc_score(y, proba)) < 1e-3
+    assert np.isclose(result["accuracy"], np.mean((proba >= 0.5) == y))
@@ -0,0 +1,64 @@
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from app.artifacts.infrastructure import split_features
+from app.data.core import generate_synthetic_data
+from app.evaluate.core import evaluate_metrics
+from app.train.core import search_model
+from app.train.core.search import _fit_path
+
+MACRO = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+
+
+def test_search_model_keeps_best_trial(tmp_path):
+    X, y = split_features(generate_synthetic_data(MACRO, n=3_000, seed=5))
+    space = {"C": [1.0, 0.0001, 0.01], "penalty": ["l2", "l1"], "cv": 3}
+
+    model_path, summary = search_model(X, y, space, output_dir=tmp_path / "models", n_jobs=2)
+
+    trials = summary["trials"]
+    assert [(trial["penalty"], trial["C"]) for trial in trials] == [
+        (penalty, C) for penalty in ("l2", "l1") for C in (0.0001, 0.01, 1.0)
+    ]
+    best = max(trials, key=lambda trial: trial["mean_score"])
+    assert summary["best_params"] == {"penalty": best["penalty"], "C": best["C"]}
+    assert summary["best_score"] == best["mean_score"] and summary["cv"] == 3
+
+    model = joblib.load(model_path)
+    assert isinstance(model, LogisticRegression)
+    assert list(model.feature_names_in_) == list(X.columns)
+    assert model.C == best["C"] and model.penalty == best["penalty"]
+    assert abs(evaluate_metrics(X, y, model_path)["auc"] - best["mean_score"]) < 0.02
+
+
+def test_search_model_folds_scaling_into_saved_model(tmp_path):
+    X, y = split_features(generate_synthetic_data(MACRO, n=2_000, seed=6))
+    scaler = StandardScaler().fit(X)
+    reference = LogisticRegression(C=1.0, max_iter=500).fit(scaler.transform(X), y)
+
+    model_path, _ = search_model(X, y, {"C": [1.0]}, output_dir=tmp_path / "models", n_jobs=1)
+
+    proba = joblib.load(model_path).predict_proba(X)[:, 1]
+    assert np.allclose(proba, reference.predict_proba(scaler.transform(X))[:, 1], atol=1e-3)
+
+
+def test_search_model_runs_a_custom_fit_path(tmp_path):
+    X, y = split_features(generate_synthetic_data(MACRO, n=2_000, seed=7))
+    calls = []
+
+    def cold_path(X, y, train, test, penalty, Cs, fold=0):
+        calls.append(fold)
+        return [trial for C in Cs for trial in _fit_path(X, y, train, test, penalty, [C], fold)]
+
+    space = {"C": [0.01, 1.0], "cv": 2}
+    _, warm = search_model(X, y, space, output_dir=tmp_path, n_jobs=1)
+    _, cold = search_model(X, y, space, output_dir=tmp_path, n_jobs=1, fit_path=cold_path)
+
+    assert sorted(calls) == [0, 1]
+    assert cold["best_params"] == warm["best_params"]
+    assert [trial["mean_score"] for trial in cold["trials"]] == pytest.approx(
+        [trial["mean_score"] for trial in warm["trials"]], abs=1e-4
+    )
@@ -1,12 +1,14 @@
 import pytest
 
+import numpy as np
 import pandas as pd
 
 from app.train.service import train as train_service
 
 
 def test_train_workflow_uses_named_dataset(monkeypatch, tmp_path):
-    df = pd.DataFrame({"default": [0], "name": ["A"], "feature": [1]})
+    X = pd.DataFrame({"feature": [1]})
+    y = np.array([0])
     dataset_dir = tmp_path / "datasets"
     dataset_dir.mkdir()
     model_dir = tmp_path / "models"
@@ -17,22 +19,24 @@ def test_train_workflow_uses_named_dataset(monkeypatch, tmp_path):
 
     logged_models = {}
 
-    def fake_read_parquet(path):
+    def fake_load_training_data(path):
         assert path == dataset_path
-        return df
+        return X, y
 
-    def fake_train_model(dataframe, output_dir):
-        assert dataframe is df
+    def fake_train_model(features, target, output_dir, estimator, params, parent):
+        assert features is X
+        assert target is y
         assert output_dir == model_dir
         return model_dir / "model_final.pkl"
 
-    def fake_log_model(name, dataset_name, timestamp=None):
+    def fake_log_model(name, dataset_name, timestamp=None, **kwargs):
         # Mock database call - doesn't actually hit DB
         logged_models[name] = dataset_name
 
     monkeypatch.setattr(train_service, "DATASET_DIR", dataset_dir, raising=False)
     monkeypatch.setattr(train_service, "MODEL_DIR", model_dir, raising=False)
-    monkeypatch.setattr(train_service.pd, "read_parquet", fake_read_parquet)
+    monkeypatch.setattr(train_service, "dataset_rows", lambda path: 1)
+    monkeypatch.setattr(train_service, "load_training_data", fake_load_training_data)
     monkeypatch.setattr(train_service, "train_model", fake_train_model)
     monkeypatch.setattr(train_service, "log_model", fake_log_model)
 
@@ -48,3 +52,133 @@ def test_train_workflow_requires_existing_dataset(monkeypatch, tmp_path):
     monkeypatch.setattr(train_service, "DATASET_DIR", dataset_dir, raising=False)
     with pytest.raises(ValueError):
         train_service.train_workflow("missing_dataset")
+
+
+def test_train_workflow_streams_datasets_above_row_threshold(monkeypatch, tmp_path):
+    from app.artifacts.infrastructure import write_dataset
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    model_dir = tmp_path / "models"
+    dataset_path = dataset_dir / "large_dataset.parquet"
+    write_dataset(pd.DataFrame({
+        "name": ["A", "B", "C", "D"],
+        "feature": [1.0, 2.0, 3.0, 4.0],
+        "default": [0, 1, 0, 1],
+    }), dataset_path)
+    batches_seen = []
+
+    def fake_train_model_incremental(batches, output_dir, epochs):
+        batches_seen.extend(batches())
+        return output_dir / "model_streamed.pkl"
+
+    def fail_load_training_data(path):
+        raise AssertionError("large datasets must not be loaded whole")
+
+    monkeypatch.setattr(train_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(train_service, "MODEL_DIR", model_dir, raising=False)
+    monkeypatch.setattr(train_service.settings, "train_out_of_core_rows", 3)
+    monkeypatch.setattr(train_service, "load_training_data", fail_load_training_data)
+    monkeypatch.setattr(train_service, "train_model_incremental", fake_train_model_incremental)
+    monkeypatch.setattr(train_service, "log_model", lambda name, dataset_name, **kwargs: None)
+
+    assert train_service.train_workflow("large_dataset") == model_dir / "model_streamed.pkl"
+    (X, y), = batches_seen
+    assert list(X.columns) == ["feature"]
+    assert y.tolist() == [0, 1, 0, 1]
+
+
+def test_train_workflow_cross_validates_before_fitting(monkeypatch, tmp_path):
+    from app.artifacts.infrastructure import write_dataset
+    from app.data.core import generate_synthetic_data
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    model_dir = tmp_path / "models"
+    macro = {"debt_ratio": 11.3, "delinquency": 3.1, "interest_rate": 4.33}
+    write_dataset(generate_synthetic_data(macro, n=1_000, seed=1), dataset_dir / "cv_dataset.parquet")
+    logged = {}
+    updates = []
+
+    monkeypatch.setattr(train_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(train_service, "MODEL_DIR", model_dir, raising=False)
+    monkeypatch.setattr(train_service.settings, "train_cv_folds", 3)
+    monkeypatch.setattr(train_service, "train_model", lambda X, y, output_dir, **kwargs: output_dir / "model_cv.pkl")
+    monkeypatch.setattr(train_service, "log_model", lambda name, dataset_name, **kwargs: logged.update(kwargs))
+
+    assert train_service.train_workflow("cv_dataset", progress=updates.append) == model_dir / "model_cv.pkl"
+    assert [update["stage"] for update in updates] == ["cross_validation"] * 3
+    assert logged["cv"]["folds"] == 3 and len(logged["cv"]["fold_results"]) == 3
+    assert logged["search"] is None
+
+
+def test_train_workflow_reuses_model_with_same_training_key(monkeypatch, tmp_path):
+    from app.artifacts.infrastructure import write_dataset
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    model_dir = tmp_path / "models"
+    model_dir.mkdir()
+    write_dataset(pd.DataFrame({"feature": [1.0, 2.0], "default": [0, 1]}), dataset_dir / "keyed_dataset.parquet")
+    models = {}
+    hits = []
+
+    class Record:
+        def __init__(self, name):
+            self.name = name
+
+    def fake_train_model(X, y, output_dir, estimator, params, parent):
+        path = output_dir / f"model_{len(models)}.pkl"
+        path.touch()
+        return path
+
+    def fake_log_model(name, dataset_name, training_key, **kwargs):
+        models[training_key] = name
+
+    monkeypatch.setattr(train_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(train_service, "MODEL_DIR", model_dir, raising=False)
+    monkeypatch.setattr(train_service.settings, "train_cv_folds", 0)
+    monkeypatch.setattr(train_service, "train_model", fake_train_model)
+    monkeypatch.setattr(train_service, "log_model", fake_log_model)
+    monkeypatch.setattr(
+        train_service, "find_model_by_training_key", lambda key: Record(models[key]) if key in models else None
+    )
+    monkeypatch.setattr(train_service, "count_model_cache_hit", lambda name: hits.append(name) or len(hits))
+
+    first = train_service.train_workflow("keyed_dataset")
+    assert train_service.train_workflow("keyed_dataset") == first
+    assert hits == [first.stem]
+
+    other = train_service.train_workflow("keyed_dataset", estimator="lbfgs")
+    assert other != first and len(models) == 2
+
+    write_dataset(pd.DataFrame({"feature": [1.0, 3.0], "default": [0, 1]}), dataset_dir / "keyed_dataset.parquet")
+    assert train_service.train_workflow("keyed_dataset") not in (first, other)
+
+
+def test_training_key_covers_every_input():
+    base = train_service.training_key("a" * 64, "liblinear")
+    variants = [
+        train_service.training_key("b" * 64, "liblinear"),
+        train_service.training_key("a" * 64, "lbfgs"),
+        train_service.training_key("a" * 64, "liblinear", {"C": 0.5}),
+        train_service.training_key("a" * 64, "liblinear", search={"C": [1.0]}),
+        train_service.training_key("a" * 64, "liblinear", out_of_core_epochs=5),
+    ]
+    assert base == train_service.training_key("a" * 64, "liblinear", {})
+    assert len({base, *variants}) == 6
+
+
+def test_train_workflow_requires_existing_parent_model(monkeypatch, tmp_path):
+    from app.artifacts.infrastructure import write_dataset
+
+    dataset_dir = tmp_path / "datasets"
+    dataset_dir.mkdir()
+    model_dir = tmp_path / "models"
+    model_dir.mkdir()
+    write_dataset(pd.DataFrame({"feature": [1.0, 2.0], "default": [0, 1]}), dataset_dir / "child_dataset.parquet")
+    monkeypatch.setattr(train_service, "DATASET_DIR", dataset_dir, raising=False)
+    monkeypatch.setattr(train_service, "MODEL_DIR", model_dir, raising=False)
+
+    with pytest.raises(ValueError, match="Parent model 'model_missing' not found"):
+        train_service.train_workflow("child_dataset", estimator="lbfgs", parent_model="model_missing")
@@ -0,0 +1,68 @@
+import threading
+
+from utils.cache import FileCacheBackend, RedisCacheBackend, load_cache, save_cache
+
+
+class FakeRedis:
+    """In-memory stand-in for the subset of redis.Redis used by the cache."""
+
+    def __init__(self):
+        self.store = {}
+        self.expiry = {}
+        self.down = False
+
+    def get(self, key):
+        if self.down:
+            raise ConnectionError("redis down")
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        if self.down:
+            raise ConnectionError("redis down")
+        self.store[key] = value.encode()
+        self.expiry[key] = ex
+
+
+def test_redis_backend_round_trips_json_with_ttl():
+    client = FakeRedis()
+    backend = RedisCacheBackend(client, prefix="macro_cache:", ttl=3600)
+
+    backend.save("FEDFUNDS", {"FEDFUNDS": 4.33, "fetched_at": 1.0})
+
+    assert client.store["macro_cache:FEDFUNDS"] == b'{"FEDFUNDS": 4.33, "fetched_at": 1.0}'
+    assert client.expiry["macro_cache:FEDFUNDS"] == 3600
+    assert backend.load("FEDFUNDS") == {"FEDFUNDS": 4.33, "fetched_at": 1.0}
+    assert backend.load("TDSP") == {}
+
+
+def test_redis_backend_falls_back_to_files_when_unreachable(tmp_path):
+    client = FakeRedis()
+    client.down = True
+    backend = RedisCacheBackend(client, prefix="macro_cache:", ttl=60, fallback=FileCacheBackend(tmp_path))
+
+    backend.save("TDSP", {"TDSP": 11.5})
+
+    assert backend.load("TDSP") == {"TDSP": 11.5}
+    assert load_cache(tmp_path / "TDSP.pkl") == {"TDSP": 11.5}
+
+
+def test_concurrent_file_saves_do_not_collide(tmp_path):
+    path = tmp_path / "FEDFUNDS.pkl"
+    errors = []
+
+    def writer(value):
+        try:
+            for _ in range(50):
+                save_cache(path, {"FEDFUNDS": value})
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(v,)) for v in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert load_cache(path)["FEDFUNDS"] in range(4)
+    assert list(tmp_path.glob("*.tmp")) == []
@@ -1,5 +1,11 @@
 from pathlib import Path
+from typing import Any, Protocol
+import json
+import os
 import pickle
+import tempfile
+import threading
+import time
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -16,9 +22,96 @@ def load_cache(path: Path) -> dict:
 
 
 def save_cache(path: Path, data: dict):
-    """Atomically write a cache file."""
-    path.parent.mkdir(exist_ok=True)
-    tmp = path.with_suffix(".tmp")
-    with open(tmp, "wb") as f:
-        pickle.dump(data, f)
-    tmp.replace(path)
\ No newline at end of file
+    """Atomically write a cache file.
+
+    Each writer uses its own temporary file, so concurrent saves of the same
+    key never interleave; the last rename wins.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(data, f)
+        Path(tmp).replace(path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+class TTLCache:
+    """Thread-safe in-process cache that remembers when each value was fetched.
+
+    Expiry policy is left to the caller: ``get`` returns the value together
+    with its age in seconds so callers can apply soft and hard TTLs.
+    """
+
+    def __init__(self):
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key) -> tuple[Any, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, fetched_at = entry
+        return value, time.time() - fetched_at
+
+    def set(self, key, value, fetched_at: float | None = None) -> None:
+        with self._lock:
+            self._entries[key] = (value, fetched_at if fetched_at is not None else time.time())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CacheBackend(Protocol):
+    """Key/value store for small JSON-compatible cache entries."""
+
+    def load(self, key: str) -> dict: ...
+
+    def save(self, key: str, data: dict) -> None: ...
+
+
+class FileCacheBackend:
+    """One pickle file per key under ``root``, via ``load_cache``/``save_cache``."""
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def load(self, key: str) -> dict:
+        return load_cache(self.root / f"{key}.pkl")
+
+    def save(self, key: str, data: dict) -> None:
+        save_cache(self.root / f"{key}.pkl", data)
+
+
+class RedisCacheBackend:
+    """JSON entries in Redis, shared by every API replica and worker.
+
+    Writes are a single atomic ``SET`` with an expiry of ``ttl`` seconds.
+    If Redis is unreachable, reads and writes go to ``fallback`` instead.
+    """
+
+    def __init__(self, client, prefix: str, ttl: float, fallback: CacheBackend | None = None):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self.fallback = fallback
+
+    def load(self, key: str) -> dict:
+        try:
+            raw = self.client.get(self.prefix + key)
+        except Exception as e:
+            logger.warning(f"Redis cache read failed for {key}: {e}")
+            return self.fallback.load(key) if self.fallback else {}
+        return json.loads(raw) if raw else {}
+
+    def save(self, key: str, data: dict) -> None:
+        try:
+            self.client.set(self.prefix + key, json.dumps(data), ex=max(1, int(self.ttl)))
+        except Exception as e:
+            logger.warning(f"Redis cache write failed for {key}: {e}")
+            if self.fallback:
+                self.fallback.save(key, data)